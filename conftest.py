@@ -41,3 +41,14 @@ def drf_request_factory(api_rf):
         return drf_req
         
     return _make
+
+@pytest.fixture(autouse=True)
+def primary_reads_only(request, settings):
+    """
+    Sends replica reads to the primary unless a test lists the replica in its
+    `django_db(databases=...)`, so the suite also passes with a replica configured.
+    """
+    marker = request.node.get_closest_marker('django_db')
+    databases = (marker.kwargs.get('databases') if marker else None) or ()
+    if databases != '__all__' and settings.READ_REPLICA_ALIAS not in databases:
+        settings.READ_REPLICA_ALIAS = None
@@ -0,0 +1,27 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from events.models import DeliveryCallback
+from events.utils.process_delivery_callbacks import process_delivery_callbacks
+
+class Command(BaseCommand):
+    help = 'Applies staged provider delivery callbacks to notifications and purges old processed callbacks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='The number of callbacks to apply per batch. Defaults to 1000.'
+        )
+
+    def handle(self, *args, **options):
+        processed = process_delivery_callbacks(batch_size=options['batch_size'])
+
+        retention_days = getattr(settings, 'DELIVERY_CALLBACK_RETENTION_DAYS', 7)
+        purged, _ = DeliveryCallback.objects.filter(
+            processed_at__lt=timezone.now() - timedelta(days=retention_days)
+        ).delete()
+
+        self.stdout.write(f"Processed {processed} delivery callbacks, purged {purged}.")
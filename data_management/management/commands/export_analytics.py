@@ -0,0 +1,45 @@
+import sys
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+from data_management.utils.stream_analytics_export import stream_analytics_export, EXPORT_DATASETS, EXPORT_FORMATS
+from futurereminder.db_router import get_read_database
+
+class Command(BaseCommand):
+    help = 'Exports the notifications, events or payments created in a date range as CSV or Parquet, in chunks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('dataset', choices=list(EXPORT_DATASETS), help='The dataset to export.')
+        parser.add_argument('--start', type=date.fromisoformat, required=True, help='The first creation date to include, as YYYY-MM-DD.')
+        parser.add_argument('--end', type=date.fromisoformat, required=True, help='The last creation date to include, as YYYY-MM-DD.')
+        parser.add_argument(
+            '--columns',
+            help='Comma-separated columns to export. Defaults to every exportable column.'
+        )
+        parser.add_argument('--file-format', choices=list(EXPORT_FORMATS), default='csv', help='Defaults to csv.')
+        parser.add_argument('--output', help='The file to write to. Defaults to standard output.')
+        parser.add_argument('--database', help='The database to read from. Defaults to the replica, if one is configured.')
+
+    def handle(self, *args, **options):
+        columns = [column.strip() for column in (options['columns'] or '').split(',') if column.strip()]
+
+        try:
+            content = stream_analytics_export(
+                options['dataset'],
+                options['start'],
+                options['end'],
+                columns=columns,
+                file_format=options['file_format'],
+                using=options['database'] or get_read_database()
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if options['output']:
+            with open(options['output'], 'wb') as output:
+                for chunk in content:
+                    output.write(chunk)
+            self.stdout.write(self.style.SUCCESS(f"Exported {options['dataset']} to {options['output']}."))
+        else:
+            for chunk in content:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
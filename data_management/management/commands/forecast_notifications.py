@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from events.utils.forecast_notification_volume import forecast_notification_volume
+
+class Command(BaseCommand):
+    help = 'Forecasts daily send volume per channel for the upcoming days and refreshes the forecast cache.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=30,
+            help='The number of days to forecast, starting today. Defaults to 30.'
+        )
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='Recompute every day instead of reusing cached days.'
+        )
+
+    def handle(self, *args, **options):
+        forecast = forecast_notification_volume(days=options['days'], refresh=options['refresh'])
+
+        self.stdout.write(self.style.SUCCESS(f"--- Notification Forecast ({options['days']} days) ---"))
+
+        for day in forecast:
+            channels = sorted(set(day['scheduled']) | set(day['projected']))
+            total = sum(day['scheduled'].values()) + sum(day['projected'].values())
+            self.stdout.write(f"{day['date']}: {total:.1f} total")
+
+            for channel in channels:
+                scheduled = day['scheduled'].get(channel, 0)
+                projected = day['projected'].get(channel, 0)
+                self.stdout.write(f"  {channel}: {scheduled} scheduled, {projected:.1f} projected")
+
+            if day['hourly']:
+                peak_hour, peak_channels = max(day['hourly'].items(), key=lambda item: sum(item[1].values()))
+                self.stdout.write(f"  Peak hour: {peak_hour}:00 ({sum(peak_channels.values()):.1f} sends)")
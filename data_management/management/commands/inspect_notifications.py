@@ -37,7 +37,7 @@ class Command(BaseCommand):
             # Choose a color based on status
             if notif.status == 'delivered' or notif.status == 'sent':
                 status_style = self.style.SUCCESS
-            elif notif.status == 'failed':
+            elif notif.status in ('failed', 'undeliverable'):
                 status_style = self.style.ERROR
             elif notif.status == 'pending':
                 status_style = self.style.WARNING
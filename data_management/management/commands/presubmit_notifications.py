@@ -0,0 +1,82 @@
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from events.models import Notification
+from .process_notifications import Command as ProcessNotificationsCommand, SMS_CHANNELS, FANOUT_SMS_CHANNELS
+
+# Only Twilio can cancel a scheduled message. Mailgun cannot recall a single
+# scheduled email, so an email submitted early would still be delivered after
+# its event is acknowledged or deactivated; emails are sent when due instead.
+PRESUBMIT_CHANNELS = SMS_CHANNELS + FANOUT_SMS_CHANNELS
+
+class Command(ProcessNotificationsCommand):
+    help = (
+        'Submits pending SMS notifications that are due within the pre-submission horizon to '
+        'Twilio ahead of time, with a scheduled delivery time, in throttled batches.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--horizon-hours',
+            type=int,
+            default=getattr(settings, 'NOTIFICATION_PRESUBMIT_HORIZON_HOURS', 24),
+            help='Submit notifications due within this many hours. Defaults to NOTIFICATION_PRESUBMIT_HORIZON_HOURS.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=getattr(settings, 'NOTIFICATION_PRESUBMIT_BATCH_SIZE', 50),
+            help='The number of provider calls per batch.'
+        )
+        parser.add_argument(
+            '--delay',
+            type=float,
+            default=getattr(settings, 'NOTIFICATION_PRESUBMIT_BATCH_DELAY_SECONDS', 1),
+            help='Seconds to wait between batches.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Finds pending SMS notifications due inside the horizon and hands them
+        to Twilio with their send time as the scheduled delivery time.
+
+        Notifications due sooner than the provider's minimum lead time are left
+        for process_notifications, as is anything that fails here: failed rows
+        are retried by the dispatcher once they are due. Each batch is checked
+        again after the pause before it, so rows cancelled or acknowledged in
+        the meantime are not submitted.
+        """
+        now = timezone.now()
+        min_lead = timedelta(minutes=getattr(settings, 'NOTIFICATION_PRESUBMIT_MIN_LEAD_MINUTES', 15))
+
+        upcoming_notifications = Notification.objects.filter(
+            status='pending',
+            channel__in=PRESUBMIT_CHANNELS,
+            scheduled_send_time__gt=now + min_lead,
+            scheduled_send_time__lte=now + timedelta(hours=options['horizon_hours']),
+            user__is_email_verified=True,
+            event__acknowledged_at__isnull=True
+        ).order_by('scheduled_send_time')
+
+        if not upcoming_notifications.exists():
+            return
+
+        groups = self._group_notifications(upcoming_notifications)
+        batch_size = max(options['batch_size'], 1)
+
+        for start in range(0, len(groups), batch_size):
+            if start:
+                time.sleep(options['delay'])
+            batch = groups[start:start + batch_size]
+            still_pending = set(upcoming_notifications.filter(
+                pk__in=[n.pk for group, _, _ in batch for n in group]
+            ).values_list('pk', flat=True))
+            for group, recipient, medium in batch:
+                group = [n for n in group if n.pk in still_pending]
+                if not group:
+                    continue
+                send_at = min(n.scheduled_send_time for n in group)
+                self._send_group(group, recipient, medium, send_at=send_at)
+
+        self.stdout.write(f"Processed {len(groups)} messages for scheduled delivery.")
@@ -1,10 +1,33 @@
+import time
+from collections import defaultdict
 from django.core.management.base import BaseCommand
+from django.conf import settings
 from django.utils import timezone
-from django.db.models import Q
-from events.models import Notification
+from django.db.models import F, Q
+from events.models import Notification, NotificationDelivery
 from events.utils.send_reminder_email import send_reminder_email
 from events.utils.send_reminder_sms import send_reminder_sms
-from datetime import datetime
+from events.utils.send_digest_email import send_digest_email
+from events.utils.send_digest_sms import send_digest_sms
+from events.utils.send_fanout_email import send_fanout_email
+from events.utils.send_fanout_sms import send_fanout_sms
+from users.utils.get_user_timezone import get_user_timezone
+from events.utils.process_admin_task_notifications import process_admin_task_notifications
+from events.utils.transition_notifications import transition_notifications
+from events.utils.record_latencies import record_latencies
+from data_management.utils.metrics import NOTIFICATIONS_SENT, NOTIFICATION_FAILURES, get_failure_code
+from data_management.utils.record_job_heartbeat import record_job_heartbeat
+from data_management.utils.get_dispatch_health import DISPATCHER_JOB_NAME
+from datetime import datetime, timedelta
+
+EMAIL_CHANNELS = ['primary_email', 'backup_email', 'emergency_contact_email']
+SMS_CHANNELS = ['primary_sms', 'backup_sms']
+# Fan-out channels send one step to every configured contact and record a
+# NotificationDelivery per recipient.
+FANOUT_EMAIL_CHANNELS = ['all_backup_emails', 'all_emergency_contact_emails']
+FANOUT_SMS_CHANNELS = ['all_emergency_contact_sms']
+FANOUT_CHANNELS = FANOUT_EMAIL_CHANNELS + FANOUT_SMS_CHANNELS
+SUPPORTED_CHANNELS = EMAIL_CHANNELS + SMS_CHANNELS + FANOUT_CHANNELS
 
 class Command(BaseCommand):
     help = 'Processes all pending or failed notifications that are due to be sent.'
@@ -23,7 +46,9 @@ class Command(BaseCommand):
         """
         The main entry point for the command.
         Finds all due notifications and attempts to send them based on their channel.
+        A run that completes records the dispatcher heartbeat.
         """
+        started_at = timezone.now()
         processing_time = None
         if options['date']:
             try:
@@ -35,58 +60,279 @@ class Command(BaseCommand):
         else:
             processing_time = timezone.now()
 
+        # Notifications pre-submitted to a provider count as sent once they are due,
+        # unless a webhook has already reported their delivery status.
+        transition_notifications(
+            Notification.objects.filter(status='scheduled', scheduled_send_time__lte=processing_time),
+            'sent',
+            sent_at=F('scheduled_send_time')
+        )
+
+        # Turn any pending social media steps into admin tasks in batches.
+        # These are handled ahead of their send time, so they are excluded below.
+        process_admin_task_notifications()
+
         due_notifications = Notification.objects.filter(
             Q(status='pending') | Q(status='failed'),
             scheduled_send_time__lte=processing_time,
-            user__is_email_verified=True # Basic check for email
+            user__is_email_verified=True, # Basic check for email
+            event__acknowledged_at__isnull=True # The user has already seen the reminder
+        ).exclude(channel='social_media')
+
+        if due_notifications.exists():
+            # Reminders later today for the same users can join a digest that
+            # is sent now, as each event has its own slot in the send window.
+            upcoming_notifications = Notification.objects.filter(
+                status='pending',
+                scheduled_send_time__gt=processing_time,
+                scheduled_send_time__lte=processing_time + timedelta(days=1),
+                user__in=due_notifications.values('user'),
+                event__acknowledged_at__isnull=True
+            ).exclude(channel__in=['social_media'] + FANOUT_CHANNELS)
+
+            # --- Sending ---
+            for group, recipient, medium in self._group_notifications(due_notifications, upcoming_notifications):
+                self._send_group(group, recipient, medium)
+
+        record_job_heartbeat(DISPATCHER_JOB_NAME, started_at)
+
+    def _group_notifications(self, notifications, upcoming_notifications=None):
+        """
+        Resolves the recipient of every notification and returns a list of
+        (group, recipient, medium) tuples. Resolving everything first lets
+        reminders going to the same recipient on the same day be merged into
+        a single digest message. Fan-out notifications are never merged; their
+        recipient is a tuple of every address. Notifications that cannot be
+        resolved are marked as failed.
+
+        Notifications in `upcoming_notifications` are not due yet. They only
+        join a group that is being sent anyway, for the same recipient and
+        local day, and only for an event that is not already in the group, so
+        an event's escalation steps keep their order.
+        """
+        digest_enabled = getattr(settings, 'NOTIFICATION_DIGEST_ENABLED', True)
+        groups = defaultdict(list)
+
+        for n in self._prefetch_recipients(notifications):
+            try:
+                if n.channel in FANOUT_CHANNELS:
+                    recipient = tuple(self._resolve_recipients(n))
+                else:
+                    recipient = self._resolve_recipient(n)
+            except Exception as e:
+                transition_notifications(Notification.objects.filter(pk=n.pk), 'failed', failure_reason=str(e))
+                continue
+
+            medium = 'email' if n.channel in EMAIL_CHANNELS + FANOUT_EMAIL_CHANNELS else 'sms'
+            if n.channel in FANOUT_CHANNELS:
+                group_key = (n.pk, recipient, medium)
+            elif digest_enabled:
+                group_key = (n.user_id, recipient, medium, self._get_send_day(n))
+            else:
+                group_key = (n.pk, recipient, medium)
+            groups[group_key].append(n)
+
+        if digest_enabled and upcoming_notifications is not None:
+            for n in self._prefetch_recipients(upcoming_notifications.order_by('scheduled_send_time')):
+                try:
+                    recipient = self._resolve_recipient(n)
+                except Exception:
+                    continue # Marked as failed when it falls due.
+                medium = 'email' if n.channel in EMAIL_CHANNELS else 'sms'
+                group = groups.get((n.user_id, recipient, medium, self._get_send_day(n)))
+                if group and all(member.event_id != n.event_id for member in group):
+                    group.append(n)
+
+        return [(group, group_key[1], group_key[2]) for group_key, group in groups.items()]
+
+    def _prefetch_recipients(self, notifications):
+        return notifications.select_related('user', 'event').prefetch_related(
+            'user__emergency_contacts', 'deliveries'
         )
 
-        if not due_notifications.exists():
+    def _get_send_day(self, n):
+        """Returns the day a notification is due in its user's time zone."""
+        return timezone.localtime(n.scheduled_send_time, get_user_timezone(n.user)).date()
+
+    def _resolve_recipient(self, n):
+        """
+        Returns the contact detail a notification should be sent to, based on its channel.
+        Raises an exception if the channel is unsupported or no recipient is configured.
+        """
+        if n.channel not in SUPPORTED_CHANNELS:
+            raise NotImplementedError(f"Channel '{n.channel}' is not a supported sending channel.")
+
+        recipient = None
+        if n.channel == 'primary_email':
+            recipient = n.user.email
+        elif n.channel == 'backup_email':
+            recipient = n.user.backup_email
+        elif n.channel == 'primary_sms':
+            recipient = n.user.phone
+        elif n.channel == 'backup_sms':
+            recipient = n.user.backup_phone
+        elif n.channel == 'emergency_contact_email':
+            contact = n.user.emergency_contacts.first()
+            if contact: recipient = contact.email
+
+        if not recipient:
+            raise ValueError(f"No recipient address found for channel '{n.channel}'.")
+
+        return recipient
+
+    def _resolve_recipients(self, n):
+        """
+        Returns every contact detail a fan-out notification should be sent to,
+        without duplicates. Recipients that already received this notification
+        on an earlier attempt are left out, so a retry only reaches the rest.
+        Raises an exception if no recipient is configured.
+        """
+        candidates = []
+        if n.channel == 'all_backup_emails':
+            candidates = [n.user.backup_email, n.user.secondary_backup_email]
+        elif n.channel == 'all_emergency_contact_emails':
+            candidates = [contact.email for contact in n.user.emergency_contacts.all()]
+        elif n.channel == 'all_emergency_contact_sms':
+            candidates = [contact.phone for contact in n.user.emergency_contacts.all()]
+
+        recipients = list(dict.fromkeys(candidate for candidate in candidates if candidate))
+        if not recipients:
+            raise ValueError(f"No recipient address found for channel '{n.channel}'.")
+
+        reached = {d.recipient for d in n.deliveries.all() if d.status != 'failed'}
+        return [recipient for recipient in recipients if recipient not in reached]
+
+    def _send_group(self, group, recipient, medium, send_at=None):
+        """
+        Sends a group of notifications that share a recipient, medium and day.
+        A single notification is sent as a normal reminder; several are merged
+        into one digest and all rows share the provider's message ID. A fan-out
+        notification is always a group of one, sent to all of its recipients.
+
+        If send_at is given, Twilio is asked to deliver the SMS at that time and
+        the notifications are marked as 'scheduled'. Only SMS are pre-submitted.
+        """
+        schedule = {'send_at': send_at} if send_at else {}
+
+        if group[0].channel in FANOUT_CHANNELS:
+            self._send_fanout(group[0], list(recipient), medium, schedule)
             return
 
-        for n in due_notifications:
-            sid_or_success = None
-            recipient = None
-            
-            try:
-                # --- Channel and Recipient Routing ---
-                supported_channels = ['primary_email', 'backup_email', 'emergency_contact_email', 'primary_sms', 'backup_sms']
-                if n.channel not in supported_channels:
-                    raise NotImplementedError(f"Channel '{n.channel}' is not a supported sending channel.")
-
-                if n.channel == 'primary_email':
-                    recipient = n.user.email
-                elif n.channel == 'backup_email':
-                    recipient = n.user.backup_email
-                elif n.channel == 'primary_sms':
-                    recipient = n.user.phone
-                elif n.channel == 'backup_sms':
-                    recipient = n.user.backup_phone
-                elif n.channel == 'emergency_contact_email':
-                    contact = n.user.emergency_contacts.first()
-                    if contact: recipient = contact.email
-                
-                if not recipient:
-                    raise ValueError(f"No recipient address found for channel '{n.channel}'.")
-
-                # --- Sending Logic ---
-                if n.channel in ['primary_email', 'backup_email', 'emergency_contact_email']:
-                    sid_or_success = send_reminder_email(n, recipient)
-                elif n.channel in ['primary_sms', 'backup_sms']:
-                    sid_or_success = send_reminder_sms(n, recipient)
-                
-                # --- Status Update ---
-                if sid_or_success:
-                    n.status = 'sent'
-                    n.recipient_contact_info = recipient
-                    if isinstance(sid_or_success, str): # SMS/Email returns a message ID
-                        n.message_sid = sid_or_success
-                    n.failure_reason = None # Clear previous failure reason
-                    n.save(update_fields=['status', 'recipient_contact_info', 'message_sid', 'failure_reason'])
+        group.sort(key=lambda n: (n.event.event_date, n.scheduled_send_time))
+
+        try:
+            # --- Sending Logic ---
+            if len(group) == 1:
+                if medium == 'email':
+                    sid_or_success = self._call_provider(group[0].channel, send_reminder_email, group[0], recipient, **schedule)
                 else:
-                    raise Exception("Sending function returned a falsy value.")
+                    sid_or_success = self._call_provider(group[0].channel, send_reminder_sms, group[0], recipient, **schedule)
+            else:
+                if medium == 'email':
+                    sid_or_success = self._call_provider(group[0].channel, send_digest_email, group, recipient, **schedule)
+                else:
+                    sid_or_success = self._call_provider(group[0].channel, send_digest_sms, group, recipient, **schedule)
 
-            except Exception as e:
-                n.status = 'failed'
-                n.failure_reason = str(e)
-                n.save(update_fields=['status', 'failure_reason'])
\ No newline at end of file
+            if not sid_or_success:
+                raise Exception("Sending function returned a falsy value.")
+
+        except Exception as e:
+            transition_notifications(Notification.objects.filter(pk__in=[n.pk for n in group]), 'failed', failure_reason=str(e))
+
+        else:
+            # --- Status Update ---
+            # Conditional UPDATEs: a notification cancelled while it was being
+            # sent keeps its 'cancelled' status.
+            fields = {'recipient_contact_info': recipient, 'failure_reason': None} # Clear previous failure reason
+            if isinstance(sid_or_success, str): # SMS/Email returns a message ID
+                fields['message_sid'] = sid_or_success
+
+            # A digest stores its segment count on the first row only.
+            pks_by_segments = defaultdict(list)
+            for n in group:
+                pks_by_segments[n.sms_segments].append(n.pk)
+            for sms_segments, pks in pks_by_segments.items():
+                transition_notifications(
+                    Notification.objects.filter(pk__in=pks),
+                    'scheduled' if send_at else 'sent',
+                    sms_segments=sms_segments,
+                    **fields
+                )
+
+    def _call_provider(self, channel, send, *args, **kwargs):
+        """
+        Calls a provider send function and records how long the call took,
+        whether it succeeded or raised, in the provider call histogram. The
+        outcome is counted in the sent and failure metrics; a fan-out call
+        counts each recipient that was attempted.
+        """
+        started = time.monotonic()
+        try:
+            result = send(*args, **kwargs)
+        except Exception as e:
+            NOTIFICATION_FAILURES.inc(source='dispatch', code=get_failure_code(e))
+            raise
+        finally:
+            duration_ms = (time.monotonic() - started) * 1000
+            record_latencies([('provider_call', channel, timezone.now(), duration_ms)])
+
+        # Skipped fan-out recipients (e.g. on the blocklist) were never attempted.
+        outcomes = [r['message_sid'] for r in result.values() if not r['skipped']] if isinstance(result, dict) else [result]
+        for outcome in outcomes:
+            if outcome:
+                NOTIFICATIONS_SENT.inc(channel=channel)
+            else:
+                NOTIFICATION_FAILURES.inc(source='dispatch', code='rejected')
+        return result
+
+    def _send_fanout(self, n, recipients, medium, schedule):
+        """
+        Sends a fan-out notification to all of its recipients in one batched
+        provider call (Mailgun) or a concurrent fan-out (Twilio), and records a
+        NotificationDelivery per recipient. The notification is only marked as
+        sent once every recipient has been reached; otherwise it is marked as
+        failed and the next run retries the remaining recipients. Recipients
+        on the blocklist are recorded as skipped and never retried, and a
+        notification whose recipients were all skipped is cancelled.
+        """
+        if medium == 'email':
+            results = self._call_provider(n.channel, send_fanout_email, n, recipients, **schedule)
+        else:
+            results = self._call_provider(n.channel, send_fanout_sms, n, recipients, **schedule)
+
+        # Replace the failed deliveries of any earlier attempt.
+        NotificationDelivery.objects.filter(notification=n, recipient__in=list(results)).delete()
+        NotificationDelivery.objects.bulk_create([
+            NotificationDelivery(
+                notification=n,
+                recipient=recipient,
+                status='sent' if result['message_sid'] else 'skipped' if result['skipped'] else 'failed',
+                message_sid=result['message_sid'],
+                failure_reason=result['failure_reason'],
+            )
+            for recipient, result in results.items()
+        ])
+
+        failures = [
+            f"{recipient}: {result['failure_reason']}"
+            for recipient, result in results.items() if not result['message_sid'] and not result['skipped']
+        ]
+        sids = {result['message_sid'] for result in results.values() if result['message_sid']}
+
+        fields = {'sms_segments': n.sms_segments}
+        if medium == 'email' and len(sids) == 1:
+            # A Mailgun batch shares one ID; Twilio IDs are kept on the deliveries.
+            fields['message_sid'] = sids.pop()
+
+        if failures:
+            transition_notifications(Notification.objects.filter(pk=n.pk), 'failed', failure_reason="; ".join(failures), **fields)
+        elif results and all(result['skipped'] for result in results.values()):
+            # Nobody can be reached, and retrying will not change that.
+            transition_notifications(
+                Notification.objects.filter(pk=n.pk), 'cancelled',
+                failure_reason="Every recipient was skipped: " + "; ".join(
+                    f"{recipient}: {result['failure_reason']}" for recipient, result in results.items()
+                )
+            )
+        else:
+            transition_notifications(Notification.objects.filter(pk=n.pk), 'scheduled' if schedule else 'sent', failure_reason=None, **fields)
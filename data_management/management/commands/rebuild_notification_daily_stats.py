@@ -0,0 +1,70 @@
+from datetime import date, datetime, time, timedelta
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Exists, F, Max, Min, OuterRef
+from django.utils import timezone
+from events.models import NotificationDailyStats, NotificationStatusEvent
+from events.utils.summarize_status_events import summarize_status_events
+
+class Command(BaseCommand):
+    help = (
+        'Rebuilds the daily notification rollup for a date range from the notification status log. '
+        'Defaults to every day in the log.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start',
+            type=date.fromisoformat,
+            help='The first day to rebuild, as YYYY-MM-DD.'
+        )
+        parser.add_argument(
+            '--end',
+            type=date.fromisoformat,
+            help='The last day to rebuild, as YYYY-MM-DD.'
+        )
+
+    def handle(self, *args, **options):
+        start, end = options['start'], options['end']
+        if start is None or end is None:
+            logged = NotificationStatusEvent.objects.aggregate(first=Min('occurred_at'), last=Max('occurred_at'))
+            if logged['first'] is None:
+                self.stdout.write("The status log is empty, nothing to rebuild.")
+                return
+            start = start or timezone.localtime(logged['first']).date()
+            end = end or timezone.localtime(logged['last']).date()
+
+        window_start = timezone.make_aware(datetime.combine(start, time.min))
+        window_end = timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min))
+
+        # The rollup counts each notification once per status: only its first
+        # entry into the status, as transition_notifications does.
+        entered_before = NotificationStatusEvent.objects.filter(
+            notification=OuterRef('notification'),
+            to_status=OuterRef('to_status'),
+            pk__lt=OuterRef('pk')
+        )
+        entries = NotificationStatusEvent.objects.filter(
+            occurred_at__gte=window_start,
+            occurred_at__lt=window_end
+        ).exclude(from_status=F('to_status')).filter(~Exists(entered_before)).values(
+            'occurred_at',
+            'channel',
+            'to_status',
+            scheduled_send_time=F('notification__scheduled_send_time'),
+            sent_at=F('notification__sent_at'),
+            delivered_at=F('notification__delivered_at'),
+            sms_segments=F('notification__sms_segments'),
+        )
+        totals = summarize_status_events(entries.iterator())
+
+        with transaction.atomic():
+            NotificationDailyStats.objects.filter(day__range=(start, end)).delete()
+            NotificationDailyStats.objects.bulk_create([
+                NotificationDailyStats(day=day, channel=channel, status=status, **counters)
+                for (day, channel, status), counters in totals.items()
+            ], batch_size=500)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {len(totals)} daily stats rows from {start.isoformat()} to {end.isoformat()}."
+        ))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from data_management.utils.refresh_signup_funnel import refresh_signup_funnel
+
+class Command(BaseCommand):
+    help = 'Recomputes the open and missing signup cohort funnels. Closed cohorts are frozen.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--weeks',
+            type=int,
+            default=52,
+            help='How many weeks of cohorts to cover. Defaults to 52.'
+        )
+
+    def handle(self, *args, **options):
+        computed = refresh_signup_funnel(weeks=options['weeks'])
+        self.stdout.write(self.style.SUCCESS(f"Computed {computed} signup cohorts."))
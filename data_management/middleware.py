@@ -0,0 +1,51 @@
+from contextlib import ExitStack
+from django.db import connections
+from rest_framework.permissions import SAFE_METHODS
+from futurereminder.db_router import pin_to_primary
+from .utils.metrics import VIEW_DB_QUERIES
+
+
+class QueryCountMiddleware:
+    """
+    Records how many database queries each request runs, labelled by the
+    view's URL name, in the view DB queries histogram. Queries made while
+    a streaming response is consumed are not counted. Requests that match
+    no URL are not recorded.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = 0
+
+        def count(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(count))
+            response = self.get_response(request)
+
+        match = getattr(request, 'resolver_match', None)
+        if match is not None:
+            VIEW_DB_QUERIES.observe(queries, view=match.view_name)
+        return response
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pins a user whose POST, PUT, PATCH or DELETE request succeeded to the
+    primary database for a short while, so views that read from the replica
+    show them their own changes even if the replica is behind.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            # DRF copies the user it authenticated (e.g. from a JWT) onto the request.
+            pin_to_primary(getattr(request, 'user', None))
+        return response
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_management', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyPlatformSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='The first day of the month.', unique=True)),
+                ('users', models.PositiveIntegerField(default=0, help_text='Users who joined in the month.')),
+                ('events', models.PositiveIntegerField(default=0, help_text='Events created in the month.')),
+                ('payments', models.PositiveIntegerField(default=0, help_text='Successful payments made in the month.')),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, help_text='The sum of successful payments made in the month.', max_digits=12)),
+                ('conversions', models.PositiveIntegerField(default=0, help_text='Users whose first successful payment was made in the month.')),
+                ('is_final', models.BooleanField(default=False, help_text='Set once the month has ended, after which the row is never recomputed.')),
+                ('computed_at', models.DateTimeField(help_text='When the totals were last recomputed.')),
+                ('changed_at', models.DateTimeField(help_text="When the totals last changed. Used as the response's Last-Modified.")),
+            ],
+            options={
+                'verbose_name': 'Monthly Platform Summary',
+                'verbose_name_plural': 'Monthly Platform Summaries',
+                'ordering': ['month'],
+            },
+        ),
+    ]
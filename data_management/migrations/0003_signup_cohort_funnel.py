@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_management', '0002_monthly_platform_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SignupCohortFunnel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('week_start', models.DateField(help_text="The Monday the cohort's signup week starts on.", unique=True)),
+                ('signups', models.PositiveIntegerField(default=0)),
+                ('verified', models.PositiveIntegerField(default=0)),
+                ('created_event', models.PositiveIntegerField(default=0)),
+                ('activated', models.PositiveIntegerField(default=0)),
+                ('paid', models.PositiveIntegerField(default=0)),
+                ('is_final', models.BooleanField(default=False, help_text='Set once the cohort is closed, after which the row is never recomputed.')),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Signup Cohort Funnel',
+                'verbose_name_plural': 'Signup Cohort Funnels',
+                'ordering': ['week_start'],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_management', '0003_signup_cohort_funnel'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobHeartbeat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text="The job's name, e.g. its management command.", max_length=100, unique=True)),
+                ('succeeded_at', models.DateTimeField(help_text='When the last successful run finished.')),
+                ('duration_seconds', models.FloatField(help_text='How long the last successful run took.')),
+            ],
+            options={
+                'verbose_name': 'Job Heartbeat',
+                'verbose_name_plural': 'Job Heartbeats',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_management', '0004_job_heartbeat'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='monthlyplatformsummary',
+            name='is_final',
+            field=models.BooleanField(default=False, help_text='Set once the month has ended and its grace period has passed, after which the row is never recomputed.'),
+        ),
+    ]
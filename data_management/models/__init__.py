@@ -1,3 +1,6 @@
 from .faq import FAQ
 from .terms_and_conditions import TermsAndConditions
-from .blocked_email import BlockedEmail
\ No newline at end of file
+from .blocked_email import BlockedEmail
+from .monthly_platform_summary import MonthlyPlatformSummary
+from .signup_cohort_funnel import SignupCohortFunnel
+from .job_heartbeat import JobHeartbeat
@@ -0,0 +1,17 @@
+from django.db import models
+
+class JobHeartbeat(models.Model):
+    """
+    The last successful run of a periodic job, such as the notification
+    dispatcher. Read by the dispatch health check to detect a stalled job.
+    """
+    name = models.CharField(max_length=100, unique=True, help_text="The job's name, e.g. its management command.")
+    succeeded_at = models.DateTimeField(help_text="When the last successful run finished.")
+    duration_seconds = models.FloatField(help_text="How long the last successful run took.")
+
+    def __str__(self):
+        return f"{self.name} last succeeded at {self.succeeded_at}"
+
+    class Meta:
+        verbose_name = "Job Heartbeat"
+        verbose_name_plural = "Job Heartbeats"
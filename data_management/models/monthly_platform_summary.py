@@ -0,0 +1,27 @@
+from django.db import models
+
+class MonthlyPlatformSummary(models.Model):
+    """
+    Platform-wide totals for one calendar month, shown on the admin historical
+    summary. The current month, and a month that ended less than
+    PLATFORM_SUMMARY_FINAL_AFTER_HOURS ago, is recomputed periodically by
+    `refresh_monthly_platform_summaries`; older months are frozen.
+    """
+    month = models.DateField(unique=True, help_text="The first day of the month.")
+    users = models.PositiveIntegerField(default=0, help_text="Users who joined in the month.")
+    events = models.PositiveIntegerField(default=0, help_text="Events created in the month.")
+    payments = models.PositiveIntegerField(default=0, help_text="Successful payments made in the month.")
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0, help_text="The sum of successful payments made in the month.")
+    conversions = models.PositiveIntegerField(default=0, help_text="Users whose first successful payment was made in the month.")
+    is_final = models.BooleanField(default=False, help_text="Set once the month has ended and its grace period has passed, after which the row is never recomputed.")
+
+    computed_at = models.DateTimeField(help_text="When the totals were last recomputed.")
+    changed_at = models.DateTimeField(help_text="When the totals last changed. Used as the response's Last-Modified.")
+
+    def __str__(self):
+        return f"Platform summary for {self.month.strftime('%Y-%m')}"
+
+    class Meta:
+        verbose_name = "Monthly Platform Summary"
+        verbose_name_plural = "Monthly Platform Summaries"
+        ordering = ['month']
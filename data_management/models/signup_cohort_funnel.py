@@ -0,0 +1,27 @@
+from django.db import models
+
+class SignupCohortFunnel(models.Model):
+    """
+    Conversion funnel for the users who signed up in one week. Each step counts
+    the users of the cohort who completed it and every step before it:
+    signup -> verified email -> created an event -> activated an event -> paid.
+
+    Cohorts that are still open are recomputed by `refresh_signup_funnel`;
+    older cohorts are frozen once computed.
+    """
+    week_start = models.DateField(unique=True, help_text="The Monday the cohort's signup week starts on.")
+    signups = models.PositiveIntegerField(default=0)
+    verified = models.PositiveIntegerField(default=0)
+    created_event = models.PositiveIntegerField(default=0)
+    activated = models.PositiveIntegerField(default=0)
+    paid = models.PositiveIntegerField(default=0)
+    is_final = models.BooleanField(default=False, help_text="Set once the cohort is closed, after which the row is never recomputed.")
+    computed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"Signup cohort of {self.week_start}"
+
+    class Meta:
+        verbose_name = "Signup Cohort Funnel"
+        verbose_name_plural = "Signup Cohort Funnels"
+        ordering = ['week_start']
@@ -0,0 +1,22 @@
+import pytest
+from datetime import timedelta
+from django.core.management import call_command
+from django.utils import timezone
+from events.models import DeliveryCallback
+
+pytestmark = pytest.mark.django_db
+
+def test_purges_old_processed_callbacks(settings):
+    """
+    Test that processed callbacks older than the retention period are deleted.
+    """
+    settings.DELIVERY_CALLBACK_RETENTION_DAYS = 7
+    old = DeliveryCallback.objects.create(provider='twilio', message_sid='SM1', raw_status='delivered', status='delivered')
+    DeliveryCallback.objects.filter(pk=old.pk).update(processed_at=timezone.now() - timedelta(days=8))
+    recent = DeliveryCallback.objects.create(provider='twilio', message_sid='SM2', raw_status='delivered', status='delivered')
+
+    call_command('apply_delivery_callbacks')
+
+    assert not DeliveryCallback.objects.filter(pk=old.pk).exists()
+    recent.refresh_from_db()
+    assert recent.processed_at is not None
@@ -0,0 +1,38 @@
+import pytest
+import pandas as pd
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+from payments.tests.factories.payment_factory import PaymentFactory
+from data_management.utils import stream_analytics_export
+
+pytestmark = pytest.mark.django_db
+
+def test_exports_payments_in_chunks(tmp_path, mocker):
+    """
+    Test that every row is written to the output file when it is read in several chunks.
+    """
+    mocker.patch('data_management.utils.stream_analytics_export.EXPORT_CHUNK_SIZE', 2)
+    iter_chunks = mocker.spy(stream_analytics_export, '_iter_chunks')
+    mocker.patch('events.utils.schedule_notifications_for_event.schedule_notifications_for_event')
+    payments = PaymentFactory.create_batch(5, status='succeeded')
+    today = timezone.localdate().isoformat()
+    output = tmp_path / 'payments.csv'
+
+    call_command('export_analytics', 'payments', f'--start={today}', f'--end={today}', '--columns=id,amount,status', f'--output={output}')
+
+    frame = pd.read_csv(output)
+    assert sorted(frame['id']) == sorted(payment.pk for payment in payments)
+    assert set(frame['status']) == {'succeeded'}
+    assert iter_chunks.call_args.args[2] == 2
+
+def test_unknown_column_is_an_error(tmp_path):
+    """
+    Test that an unknown column stops the command before anything is written.
+    """
+    today = timezone.localdate().isoformat()
+
+    with pytest.raises(CommandError):
+        call_command('export_analytics', 'payments', f'--start={today}', f'--end={today}', '--columns=stripe_secret', f'--output={tmp_path / "out.csv"}')
+
+    assert not (tmp_path / 'out.csv').exists()
@@ -0,0 +1,28 @@
+import pytest
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+
+@pytest.mark.django_db
+class TestForecastNotificationsCommand:
+
+    @patch('data_management.management.commands.forecast_notifications.forecast_notification_volume')
+    def test_prints_daily_forecast(self, mock_forecast):
+        """
+        Test that the command prints per-channel totals and the peak hour for each day.
+        """
+        mock_forecast.return_value = [{
+            'date': '2026-03-01',
+            'scheduled': {'primary_email': 4},
+            'projected': {'primary_sms': 1.5},
+            'hourly': {'09': {'primary_email': 4, 'primary_sms': 1.5}},
+        }]
+        out = StringIO()
+
+        call_command('forecast_notifications', '--days', '1', '--refresh', stdout=out)
+
+        mock_forecast.assert_called_once_with(days=1, refresh=True)
+        output = out.getvalue()
+        assert '2026-03-01: 5.5 total' in output
+        assert 'primary_email: 4 scheduled, 0.0 projected' in output
+        assert 'Peak hour: 09:00 (5.5 sends)' in output
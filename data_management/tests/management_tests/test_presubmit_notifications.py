@@ -0,0 +1,183 @@
+import json
+import threading
+import pytest
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs
+from django.core.management import call_command
+from django.utils import timezone
+from unittest.mock import patch
+
+from events.models import Notification
+from events.tests.factories.event_factory import EventFactory
+from users.tests.factories.user_factory import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class _StubProviderHandler(BaseHTTPRequestHandler):
+    """Answers Mailgun and Twilio message requests like the real APIs would."""
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        form = parse_qs(self.rfile.read(length).decode('utf-8'))
+        self.server.requests.append((self.path, form))
+
+        if self.server.fail:
+            self.send_response(500)
+            self.end_headers()
+            return
+
+        if '/Messages.json' in self.path:
+            status, body = 201, {'sid': f"SM{len(self.server.requests):032d}", 'status': 'scheduled'}
+        else:
+            status, body = 200, {'id': f"<{len(self.server.requests)}@stub.mailgun.org>", 'message': 'Queued.'}
+
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_provider(settings):
+    """
+    Runs a local HTTP server standing in for both Mailgun and Twilio, and points
+    the provider base URLs at it.
+    """
+    server = HTTPServer(('127.0.0.1', 0), _StubProviderHandler)
+    server.requests = []
+    server.fail = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    settings.MAILGUN_API_BASE_URL = base_url
+    settings.MAILGUN_DOMAIN = 'mail.example.com'
+    settings.MAILGUN_API_KEY = 'key-test'
+    settings.TWILIO_API_BASE_URL = base_url
+    settings.TWILIO_ACCOUNT_SID = 'AC' + '0' * 32
+    settings.TWILIO_AUTH_TOKEN = 'token'
+    settings.TWILIO_MESSAGING_SERVICE_SID = 'MG' + '0' * 32
+    settings.NOTIFICATION_PRESUBMIT_BATCH_DELAY_SECONDS = 0
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(autouse=True)
+def mock_schedule_notifications(mocker):
+    """Prevents EventFactory saves from rescheduling the notifications under test."""
+    mocker.patch('events.utils.schedule_notifications_for_event.schedule_notifications_for_event')
+
+def _notification(user, channel, due_in):
+    event = EventFactory(user=user)
+    return Notification.objects.create(
+        event=event,
+        user=user,
+        channel=channel,
+        status='pending',
+        scheduled_send_time=(timezone.now() + due_in).replace(microsecond=0)
+    )
+
+def test_emails_are_left_for_the_dispatcher(stub_provider):
+    """
+    Test that emails are not pre-submitted, as Mailgun cannot cancel a scheduled email.
+    """
+    user = UserFactory(is_email_verified=True)
+    notification = _notification(user, 'primary_email', timedelta(hours=2))
+
+    call_command('presubmit_notifications')
+
+    assert stub_provider.requests == []
+    notification.refresh_from_db()
+    assert notification.status == 'pending'
+
+def test_presubmits_sms_with_send_at(stub_provider):
+    """
+    Test that an SMS due within the horizon is submitted with SendAt and a fixed schedule type.
+    """
+    user = UserFactory(is_email_verified=True, phone='+15551234567')
+    notification = _notification(user, 'primary_sms', timedelta(hours=3))
+
+    call_command('presubmit_notifications')
+
+    path, form = stub_provider.requests[0]
+    assert path.endswith('/Messages.json')
+    assert form['ScheduleType'] == ['fixed']
+    assert form['SendAt'] == [notification.scheduled_send_time.strftime('%Y-%m-%dT%H:%M:%SZ')]
+
+    notification.refresh_from_db()
+    assert notification.status == 'scheduled'
+    assert notification.message_sid.startswith('SM')
+    assert notification.sms_segments == 1
+    assert '/api/events/ack/' in form['Body'][0]
+
+def test_skips_notifications_outside_the_horizon(stub_provider):
+    """
+    Test that notifications inside the minimum lead time or beyond the horizon are left pending.
+    """
+    user = UserFactory(is_email_verified=True, phone='+15551234567')
+    too_soon = _notification(user, 'primary_sms', timedelta(minutes=5))
+    too_late = _notification(user, 'primary_sms', timedelta(hours=30))
+
+    call_command('presubmit_notifications', '--horizon-hours=24')
+
+    assert stub_provider.requests == []
+    for notification in (too_soon, too_late):
+        notification.refresh_from_db()
+        assert notification.status == 'pending'
+
+def test_throttles_between_batches(stub_provider):
+    """
+    Test that the command pauses between batches of provider calls.
+    """
+    for hours in (2, 4, 6):
+        _notification(UserFactory(is_email_verified=True, phone='+15551234567'), 'primary_sms', timedelta(hours=hours))
+
+    with patch('data_management.management.commands.presubmit_notifications.time.sleep') as mock_sleep:
+        call_command('presubmit_notifications', '--batch-size=2', '--delay=0.5')
+
+    assert len(stub_provider.requests) == 3
+    mock_sleep.assert_called_once_with(0.5)
+    assert Notification.objects.filter(status='scheduled').count() == 3
+
+def test_provider_error_marks_notification_failed(stub_provider):
+    """
+    Test that a rejected submission is marked failed so the dispatcher retries it when due.
+    """
+    stub_provider.fail = True
+    user = UserFactory(is_email_verified=True, phone='+15551234567')
+    notification = _notification(user, 'primary_sms', timedelta(hours=2))
+
+    call_command('presubmit_notifications')
+
+    notification.refresh_from_db()
+    assert notification.status == 'failed'
+    assert notification.failure_reason
+
+def test_rows_cancelled_during_the_pause_are_not_submitted(stub_provider):
+    """
+    Test that each batch is checked again after the pause, so a row acknowledged
+    or cancelled while earlier batches were sent is not submitted.
+    """
+    first = _notification(UserFactory(is_email_verified=True, phone='+15551234567'), 'primary_sms', timedelta(hours=2))
+    second = _notification(UserFactory(is_email_verified=True, phone='+15551234568'), 'primary_sms', timedelta(hours=4))
+
+    def cancel_second(seconds):
+        Notification.objects.filter(pk=second.pk).update(status='cancelled')
+
+    with patch('data_management.management.commands.presubmit_notifications.time.sleep', side_effect=cancel_second):
+        call_command('presubmit_notifications', '--batch-size=1')
+
+    assert len(stub_provider.requests) == 1
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert first.status == 'scheduled'
+    assert second.status == 'cancelled'
@@ -4,9 +4,12 @@ from django.utils import timezone
 from unittest.mock import patch
 from datetime import timedelta, datetime
 
-from events.models import Notification
+from events.models import Notification, LatencyBucket
+from data_management.models import BlockedEmail, JobHeartbeat
+from data_management.utils.metrics_registry import REGISTRY
 from events.tests.factories.event_factory import EventFactory
 from users.tests.factories.user_factory import UserFactory
+from users.tests.factories.emergency_contact_factory import EmergencyContactFactory
 
 @pytest.fixture
 def mock_send_email():
@@ -89,6 +92,24 @@ class TestProcessNotificationsCommand:
 
         mock_send_email.assert_called_once()
 
+    def test_skips_notifications_of_acknowledged_events(self, mock_send_email, mock_send_sms):
+        """Tests that a due step is not sent once its event has been acknowledged."""
+        user = UserFactory(is_email_verified=True)
+        event = EventFactory(user=user, acknowledged_at=timezone.now())
+        notification = Notification.objects.create(
+            event=event,
+            user=user,
+            channel='primary_email',
+            status='failed',
+            scheduled_send_time=timezone.now() - timedelta(hours=1)
+        )
+
+        call_command('process_notifications')
+
+        mock_send_email.assert_not_called()
+        notification.refresh_from_db()
+        assert notification.status == 'failed'
+
     def test_does_not_send_future_notification(self, mock_send_email, mock_send_sms):
         """Tests that a notification scheduled for the future is not sent."""
         user = UserFactory(is_email_verified=True)
@@ -113,7 +134,7 @@ class TestProcessNotificationsCommand:
         notification = Notification.objects.create(
             event=event,
             user=user,
-            channel='social_media',
+            channel='admin_call',
             status='pending',
             scheduled_send_time=timezone.now() - timedelta(hours=1)
         )
@@ -126,6 +147,25 @@ class TestProcessNotificationsCommand:
         assert notification.status == 'failed'
         assert "not a supported sending channel" in notification.failure_reason
 
+    def test_social_media_notifications_are_turned_into_admin_tasks(self, mock_send_email, mock_send_sms):
+        """Tests that social media steps go to the admin task job rather than a provider."""
+        user = UserFactory(is_email_verified=True)
+        event = EventFactory(user=user)
+        Notification.objects.create(
+            event=event,
+            user=user,
+            channel='social_media',
+            status='pending',
+            scheduled_send_time=timezone.now() - timedelta(hours=1)
+        )
+
+        with patch('data_management.management.commands.process_notifications.process_admin_task_notifications') as mock_job:
+            call_command('process_notifications')
+
+        mock_job.assert_called_once()
+        mock_send_email.assert_not_called()
+        mock_send_sms.assert_not_called()
+
     def test_date_argument_filters_correctly(self, mock_send_email):
         """Tests that the --date argument correctly filters notifications."""
         user = UserFactory(is_email_verified=True)
@@ -175,4 +215,343 @@ class TestProcessNotificationsCommand:
         assert notification.status == 'failed'
         assert "SMTP server is down" in notification.failure_reason
 
-    
\ No newline at end of file
+    def test_same_day_reminders_are_merged_into_one_digest(self, mock_send_email, mock_send_sms):
+        """Tests that several emails due to the same recipient on the same day are sent as one digest."""
+        user = UserFactory(is_email_verified=True)
+        due_time = timezone.now() - timedelta(minutes=5)
+        notifications = []
+        for _ in range(3):
+            event = EventFactory(user=user)
+            notifications.append(Notification.objects.create(
+                event=event,
+                user=user,
+                channel='primary_email',
+                status='pending',
+                scheduled_send_time=due_time
+            ))
+
+        with patch('data_management.management.commands.process_notifications.send_digest_email') as mock_digest:
+            mock_digest.return_value = "digest-message-id"
+            call_command('process_notifications')
+
+        mock_digest.assert_called_once()
+        assert len(mock_digest.call_args.args[0]) == 3
+        mock_send_email.assert_not_called()
+        for notification in notifications:
+            notification.refresh_from_db()
+            assert notification.status == 'sent'
+            assert notification.message_sid == "digest-message-id"
+
+    def test_reminders_later_the_same_day_join_the_digest(self, mock_send_email, mock_send_sms, mocker):
+        """
+        Tests that a recipient's reminders due later the same local day are
+        sent with a digest going out now, but not those due on another day or
+        for an event already in the digest.
+        """
+        now = timezone.make_aware(datetime(2030, 6, 1, 10, 0), timezone.get_fixed_timezone(0))
+        mocker.patch('django.utils.timezone.now', return_value=now)
+        user = UserFactory(is_email_verified=True, timezone='UTC')
+        due_event, later_event, tomorrow_event = EventFactory(user=user), EventFactory(user=user), EventFactory(user=user)
+
+        def create(event, send_time):
+            return Notification.objects.create(
+                event=event, user=user, channel='primary_email', status='pending', scheduled_send_time=send_time
+            )
+
+        due = create(due_event, now - timedelta(minutes=5))
+        later_today = create(later_event, now + timedelta(hours=3))
+        same_event_later = create(due_event, now + timedelta(hours=4))
+        tomorrow = create(tomorrow_event, now + timedelta(hours=15))
+
+        with patch('data_management.management.commands.process_notifications.send_digest_email') as mock_digest:
+            mock_digest.return_value = "digest-message-id"
+            call_command('process_notifications')
+
+        mock_digest.assert_called_once()
+        assert {n.pk for n in mock_digest.call_args.args[0]} == {due.pk, later_today.pk}
+        mock_send_email.assert_not_called()
+        for notification, status in [(due, 'sent'), (later_today, 'sent'), (same_event_later, 'pending'), (tomorrow, 'pending')]:
+            notification.refresh_from_db()
+            assert notification.status == status
+
+    def test_digest_is_not_used_when_disabled(self, mock_send_email, mock_send_sms, settings):
+        """Tests that each reminder is sent on its own when digest mode is disabled."""
+        settings.NOTIFICATION_DIGEST_ENABLED = False
+        user = UserFactory(is_email_verified=True)
+        for _ in range(2):
+            event = EventFactory(user=user)
+            Notification.objects.create(
+                event=event,
+                user=user,
+                channel='primary_email',
+                status='pending',
+                scheduled_send_time=timezone.now() - timedelta(minutes=5)
+            )
+
+        call_command('process_notifications')
+
+        assert mock_send_email.call_count == 2
+
+    def test_digest_failure_marks_every_row_failed(self, mock_send_email, mock_send_sms):
+        """Tests that a failed digest send marks every merged notification as failed."""
+        user = UserFactory(phone='+15551234567', is_email_verified=True)
+        notifications = []
+        for _ in range(2):
+            event = EventFactory(user=user)
+            notifications.append(Notification.objects.create(
+                event=event,
+                user=user,
+                channel='primary_sms',
+                status='pending',
+                scheduled_send_time=timezone.now() - timedelta(minutes=5)
+            ))
+
+        with patch('data_management.management.commands.process_notifications.send_digest_sms') as mock_digest:
+            mock_digest.side_effect = Exception("Twilio is down")
+            call_command('process_notifications')
+
+        for notification in notifications:
+            notification.refresh_from_db()
+            assert notification.status == 'failed'
+            assert "Twilio is down" in notification.failure_reason
+
+    def test_notification_cancelled_during_send_stays_cancelled(self, mock_send_email, mock_send_sms):
+        """Tests that a notification cancelled while its message was being sent is not marked sent."""
+        user = UserFactory(is_email_verified=True)
+        event = EventFactory(user=user)
+        notification = Notification.objects.create(
+            event=event,
+            user=user,
+            channel='primary_email',
+            status='pending',
+            scheduled_send_time=timezone.now() - timedelta(hours=1)
+        )
+
+        def cancel_while_sending(*args, **kwargs):
+            Notification.objects.filter(pk=notification.pk).update(status='cancelled')
+            return True
+        mock_send_email.side_effect = cancel_while_sending
+
+        call_command('process_notifications')
+
+        mock_send_email.assert_called_once()
+        notification.refresh_from_db()
+        assert notification.status == 'cancelled'
+
+    def test_provider_call_duration_is_recorded(self, mock_send_email, mock_send_sms):
+        """Tests that the duration of each provider call is added to the latency histogram, including failed calls."""
+        user = UserFactory(phone='+15551234567', is_email_verified=True)
+        for channel in ('primary_email', 'primary_sms'):
+            Notification.objects.create(
+                event=EventFactory(user=user),
+                user=user,
+                channel=channel,
+                status='pending',
+                scheduled_send_time=timezone.now() - timedelta(days=1 if channel == 'primary_email' else 2)
+            )
+        mock_send_sms.side_effect = Exception("Twilio is down")
+
+        call_command('process_notifications')
+
+        assert LatencyBucket.objects.get(channel='primary_email', metric='provider_call').provider == 'mailgun'
+        assert LatencyBucket.objects.get(channel='primary_sms', metric='provider_call').provider == 'twilio'
+
+    def test_due_scheduled_notifications_are_marked_sent(self, mock_send_email, mock_send_sms):
+        """Tests that pre-submitted notifications count as sent once due, and are not sent again."""
+        user = UserFactory(is_email_verified=True)
+        event = EventFactory(user=user)
+        due = Notification.objects.create(
+            event=event,
+            user=user,
+            channel='primary_email',
+            status='scheduled',
+            message_sid='mailgun-id',
+            scheduled_send_time=timezone.now() - timedelta(minutes=5)
+        )
+        upcoming = Notification.objects.create(
+            event=event,
+            user=user,
+            channel='primary_email',
+            status='scheduled',
+            message_sid='mailgun-id-2',
+            scheduled_send_time=timezone.now() + timedelta(hours=2)
+        )
+
+        call_command('process_notifications')
+
+        mock_send_email.assert_not_called()
+        due.refresh_from_db()
+        upcoming.refresh_from_db()
+        assert due.status == 'sent'
+        assert upcoming.status == 'scheduled'
+
+    def test_fanout_email_reaches_every_emergency_contact(self, mock_send_email, mock_send_sms):
+        """Tests that a fan-out step sends one batch to all contacts and records a delivery per contact."""
+        user = UserFactory(is_email_verified=True)
+        contacts = [EmergencyContactFactory(user=user) for _ in range(3)]
+        event = EventFactory(user=user)
+        notification = Notification.objects.create(
+            event=event,
+            user=user,
+            channel='all_emergency_contact_emails',
+            status='pending',
+            scheduled_send_time=timezone.now() - timedelta(minutes=5)
+        )
+
+        with patch('data_management.management.commands.process_notifications.send_fanout_email') as mock_fanout:
+            mock_fanout.side_effect = lambda n, recipients: {
+                r: {'message_sid': 'batch-id', 'failure_reason': None, 'skipped': False} for r in recipients
+            }
+            call_command('process_notifications')
+
+        mock_fanout.assert_called_once()
+        assert sorted(mock_fanout.call_args[0][1]) == sorted(c.email for c in contacts)
+        mock_send_email.assert_not_called()
+        notification.refresh_from_db()
+        assert notification.status == 'sent'
+        assert notification.message_sid == 'batch-id'
+        assert notification.deliveries.filter(status='sent').count() == 3
+
+    def test_fanout_retries_only_failed_recipients(self, mock_send_email, mock_send_sms):
+        """Tests that a partially failed fan-out is retried for the remaining recipients only."""
+        user = UserFactory(is_email_verified=True, backup_email='one@example.com', secondary_backup_email='two@example.com')
+        event = EventFactory(user=user)
+        notification = Notification.objects.create(
+            event=event,
+            user=user,
+            channel='all_backup_emails',
+            status='pending',
+            scheduled_send_time=timezone.now() - timedelta(minutes=5)
+        )
+
+        def _partial(n, recipients):
+            return {r: {'message_sid': None, 'failure_reason': 'Bounced', 'skipped': False} if r == 'two@example.com'
+                    else {'message_sid': 'id-1', 'failure_reason': None, 'skipped': False} for r in recipients}
+
+        with patch('data_management.management.commands.process_notifications.send_fanout_email') as mock_fanout:
+            mock_fanout.side_effect = _partial
+            call_command('process_notifications')
+
+            notification.refresh_from_db()
+            assert notification.status == 'failed'
+            assert 'two@example.com: Bounced' in notification.failure_reason
+
+            mock_fanout.side_effect = lambda n, recipients: {
+                r: {'message_sid': 'id-2', 'failure_reason': None, 'skipped': False} for r in recipients
+            }
+            call_command('process_notifications')
+
+        assert mock_fanout.call_args[0][1] == ['two@example.com']
+        notification.refresh_from_db()
+        assert notification.status == 'sent'
+        assert dict(notification.deliveries.values_list('recipient', 'status')) == {
+            'one@example.com': 'sent', 'two@example.com': 'sent'
+        }
+
+    def test_fanout_skips_blocked_recipients_without_failing(self, mock_send_email, mock_send_sms):
+        """
+        Tests that a blocklisted recipient is recorded as skipped, the fan-out
+        counts as sent, and the next run does not retry it.
+        """
+        user = UserFactory(is_email_verified=True, backup_email='one@example.com', secondary_backup_email='two@example.com')
+        BlockedEmail.objects.create(email='two@example.com')
+        event = EventFactory(user=user)
+        notification = Notification.objects.create(
+            event=event,
+            user=user,
+            channel='all_backup_emails',
+            status='pending',
+            scheduled_send_time=timezone.now() - timedelta(minutes=5)
+        )
+
+        with patch('events.utils.send_fanout_email.requests.post') as mock_post:
+            mock_post.return_value.json.return_value = {'id': '<batch@mailgun.org>'}
+            call_command('process_notifications')
+            call_command('process_notifications')
+
+        mock_post.assert_called_once()
+        notification.refresh_from_db()
+        assert notification.status == 'sent'
+        assert dict(notification.deliveries.values_list('recipient', 'status')) == {
+            'one@example.com': 'sent', 'two@example.com': 'skipped'
+        }
+
+    def test_fanout_with_every_recipient_blocked_is_cancelled(self, mock_send_email, mock_send_sms):
+        """Tests that a fan-out nobody can receive is cancelled instead of failing on every run."""
+        user = UserFactory(is_email_verified=True, backup_email='one@example.com', secondary_backup_email=None)
+        BlockedEmail.objects.create(email='one@example.com')
+        event = EventFactory(user=user)
+        notification = Notification.objects.create(
+            event=event,
+            user=user,
+            channel='all_backup_emails',
+            status='pending',
+            scheduled_send_time=timezone.now() - timedelta(minutes=5)
+        )
+
+        with patch('events.utils.send_fanout_email.requests.post') as mock_post:
+            call_command('process_notifications')
+
+        mock_post.assert_not_called()
+        notification.refresh_from_db()
+        assert notification.status == 'cancelled'
+        assert 'blocklist' in notification.failure_reason
+
+    def test_fanout_sms_records_each_recipient(self, mock_send_email, mock_send_sms):
+        """Tests that a fan-out SMS sends to every contact's phone and stores each SID on its delivery."""
+        user = UserFactory(is_email_verified=True)
+        EmergencyContactFactory(user=user, phone='+15550000001')
+        EmergencyContactFactory(user=user, phone='+15550000002')
+        event = EventFactory(user=user)
+        notification = Notification.objects.create(
+            event=event,
+            user=user,
+            channel='all_emergency_contact_sms',
+            status='pending',
+            scheduled_send_time=timezone.now() - timedelta(minutes=5)
+        )
+
+        with patch('events.utils.send_fanout_sms.send_reminder_sms') as mock_reminder_sms:
+            mock_reminder_sms.side_effect = lambda n, phone, send_at=None: f"SM{phone[-1]}"
+            call_command('process_notifications')
+
+        notification.refresh_from_db()
+        assert notification.status == 'sent'
+        assert dict(notification.deliveries.values_list('recipient', 'message_sid')) == {
+            '+15550000001': 'SM1', '+15550000002': 'SM2'
+        }
+
+    def test_counts_sends_and_failure_codes(self, mock_send_email, mock_send_sms, settings):
+        """Tests that accepted sends are counted per channel and rejected ones by error code."""
+        settings.METRICS_DIR = None
+        user = UserFactory(phone='+15551234567', is_email_verified=True)
+        event = EventFactory(user=user)
+        for channel in ('primary_email', 'primary_sms'):
+            Notification.objects.create(
+                event=event,
+                user=user,
+                channel=channel,
+                status='pending',
+                scheduled_send_time=timezone.now() - timedelta(hours=1)
+            )
+        error = Exception("Unverified number")
+        error.code = 21608
+        mock_send_sms.side_effect = error
+        sent_before = REGISTRY.get_sample_value('futurereminder_notifications_sent_total', channel='primary_email') or 0
+        failed_before = REGISTRY.get_sample_value('futurereminder_notification_failures_total', source='dispatch', code='21608') or 0
+
+        call_command('process_notifications')
+
+        assert REGISTRY.get_sample_value('futurereminder_notifications_sent_total', channel='primary_email') == sent_before + 1
+        assert REGISTRY.get_sample_value('futurereminder_notification_failures_total', source='dispatch', code='21608') == failed_before + 1
+
+    def test_records_heartbeat_after_a_run(self, mock_send_email, mock_send_sms):
+        """Tests that a completed run records the dispatcher heartbeat, even when nothing is due."""
+        call_command('process_notifications')
+        first = JobHeartbeat.objects.get(name='process_notifications')
+
+        call_command('process_notifications')
+
+        second = JobHeartbeat.objects.get(name='process_notifications')
+        assert second.succeeded_at >= first.succeeded_at
+        assert second.duration_seconds >= 0
@@ -0,0 +1,75 @@
+import pytest
+from datetime import timedelta
+from django.core.management import call_command
+from django.utils import timezone
+from events.models import Notification, NotificationDailyStats, NotificationStatusEvent
+from events.tests.factories.event_factory import EventFactory
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def mock_schedule_notifications(mocker):
+    """Prevents EventFactory saves from creating notifications of their own."""
+    mocker.patch('events.utils.schedule_notifications_for_event.schedule_notifications_for_event')
+
+def _logged_notification(event, to_status, occurred_at, **fields):
+    notification = Notification.objects.create(
+        event=event, user=event.user, channel='primary_sms', status=to_status,
+        scheduled_send_time=occurred_at - timedelta(minutes=1), **fields
+    )
+    NotificationStatusEvent.objects.create(
+        notification=notification, channel='primary_sms', from_status='pending',
+        to_status=to_status, occurred_at=occurred_at
+    )
+    return notification
+
+def test_rebuilds_range_from_status_log():
+    """
+    Test that the rollup for the range is replaced with totals from the status log.
+    """
+    event = EventFactory()
+    sent_at = timezone.now() - timedelta(days=2)
+    _logged_notification(event, 'sent', sent_at, sent_at=sent_at, sms_segments=2)
+    _logged_notification(event, 'failed', sent_at, failed_at=sent_at)
+    day = timezone.localtime(sent_at).date()
+    NotificationDailyStats.objects.create(day=day, channel='primary_sms', status='sent', count=99)
+
+    call_command('rebuild_notification_daily_stats', f'--start={day.isoformat()}', f'--end={day.isoformat()}')
+
+    sent = NotificationDailyStats.objects.get(day=day, status='sent')
+    assert (sent.count, sent.sms_segments, sent.latency_count) == (1, 2, 1)
+    assert sent.latency_seconds_total == 60
+    assert NotificationDailyStats.objects.get(day=day, status='failed').count == 1
+
+def test_leaves_days_outside_the_range():
+    """
+    Test that rollup rows outside the requested range are kept.
+    """
+    event = EventFactory()
+    today = timezone.localdate()
+    _logged_notification(event, 'sent', timezone.now())
+    older = NotificationDailyStats.objects.create(day=today - timedelta(days=10), channel='primary_sms', status='sent', count=5)
+
+    call_command('rebuild_notification_daily_stats', f'--start={today.isoformat()}', f'--end={today.isoformat()}')
+
+    older.refresh_from_db()
+    assert older.count == 5
+    assert NotificationDailyStats.objects.get(day=today).count == 1
+
+def test_counts_a_retried_notification_once_per_status():
+    """
+    Test that repeated failures of one notification are counted once, as the incremental rollup does.
+    """
+    event = EventFactory()
+    first_failure = timezone.now() - timedelta(days=2)
+    notification = _logged_notification(event, 'sent', first_failure + timedelta(hours=2))
+    for attempt, (from_status, to_status) in enumerate([('pending', 'failed'), ('failed', 'failed'), ('failed', 'failed')]):
+        NotificationStatusEvent.objects.create(
+            notification=notification, channel='primary_sms', from_status=from_status,
+            to_status=to_status, occurred_at=first_failure + timedelta(minutes=attempt)
+        )
+    day = timezone.localtime(first_failure).date()
+
+    call_command('rebuild_notification_daily_stats', f'--start={day.isoformat()}', f'--end={day.isoformat()}')
+
+    assert NotificationDailyStats.objects.get(day=day, status='failed').count == 1
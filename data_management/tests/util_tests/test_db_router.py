@@ -0,0 +1,140 @@
+import pytest
+from datetime import date
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, router
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from events.models import Notification
+from users.models import User
+from users.tests.factories.user_factory import UserFactory
+from data_management.middleware import ReadYourWritesMiddleware
+from futurereminder.db_router import get_read_database, pin_to_primary, read_from
+
+pytestmark = pytest.mark.django_db
+
+requires_replica = pytest.mark.skipif(
+    'replica' not in settings.DATABASES,
+    reason="Needs a 'replica' database, e.g. DB_REPLICA_ENGINE=django.db.backends.sqlite3."
+)
+
+@pytest.fixture(autouse=True)
+def clear_pins():
+    """Pins live in the cache, which outlives each test's database rollback."""
+    cache.clear()
+    yield
+    cache.clear()
+
+@pytest.fixture
+def replica_configured(settings):
+    """Makes the router see a replica alias, without connecting to it."""
+    settings.READ_REPLICA_ALIAS = 'replica'
+
+@pytest.fixture
+def admin_client():
+    client = APIClient()
+    admin = User.objects.create_superuser('admin@example.com', 'password')
+    client.force_authenticate(user=admin)
+    client.admin = admin
+    return client
+
+def test_reads_and_writes_use_the_primary_by_default():
+    """
+    Test that reads outside a replica view, and every write, go to the primary.
+    """
+    assert router.db_for_read(Notification) == 'default'
+    with read_from('replica'):
+        assert router.db_for_read(Notification) == 'replica'
+        assert router.db_for_write(Notification) == 'default'
+    assert router.db_for_read(Notification) == 'default'
+
+def test_read_database_without_a_replica(settings):
+    """
+    Test that the primary is used when no replica is configured.
+    """
+    settings.READ_REPLICA_ALIAS = None
+    assert get_read_database(UserFactory()) == 'default'
+
+def test_pinned_user_reads_from_the_primary(replica_configured):
+    """
+    Test that a user who has just written reads from the primary, while others use the replica.
+    """
+    writer = UserFactory()
+    reader = UserFactory()
+
+    pin_to_primary(writer)
+
+    assert get_read_database(writer) == 'default'
+    assert get_read_database(reader) == 'replica'
+    assert get_read_database() == 'replica'
+
+@pytest.mark.parametrize('method, status_code, pinned', [
+    ('post', 201, True),
+    ('delete', 204, True),
+    ('post', 400, False),
+    ('get', 200, False),
+])
+def test_middleware_pins_after_successful_writes(replica_configured, method, status_code, pinned):
+    """
+    Test that only a successful unsafe request pins its user to the primary.
+    """
+    user = UserFactory()
+    request = getattr(RequestFactory(), method)('/api/events/')
+    request.user = user
+
+    ReadYourWritesMiddleware(lambda request: HttpResponse(status=status_code))(request)
+
+    assert (get_read_database(user) == 'default') is pinned
+
+@requires_replica
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_analytics_views_read_from_the_replica(admin_client):
+    """
+    Test that an analytics view runs its queries on the replica.
+    """
+    with CaptureQueriesContext(connections['replica']) as replica_queries:
+        response = admin_client.get(reverse('data_management:signup-funnel'))
+
+    assert response.status_code == 200
+    assert len(replica_queries) > 0
+
+@requires_replica
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_analytics_views_read_from_the_primary_after_a_write(admin_client):
+    """
+    Test that an admin who has just written reads their own changes from the primary.
+    """
+    pin_to_primary(admin_client.admin)
+
+    with CaptureQueriesContext(connections['replica']) as replica_queries:
+        response = admin_client.get(reverse('data_management:signup-funnel'))
+
+    assert response.status_code == 200
+    assert len(replica_queries) == 0
+
+@requires_replica
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_exports_read_from_the_replica(admin_client):
+    """
+    Test that a streamed export reads its rows from the replica.
+    """
+    today = date.today().isoformat()
+    response = admin_client.get(reverse('data_management:analytics-export'), {'dataset': 'events', 'start': today, 'end': today})
+
+    with CaptureQueriesContext(connections['replica']) as replica_queries:
+        b''.join(response.streaming_content)
+
+    assert len(replica_queries) > 0
+
+@requires_replica
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_historical_summary_writes_to_the_primary(admin_client):
+    """
+    Test that the stored monthly summaries are read and written on the primary,
+    so a replica without them does not cause duplicate inserts.
+    """
+    assert admin_client.get(reverse('data_management:historical-summary')).status_code == 200
+    assert admin_client.get(reverse('data_management:historical-summary')).status_code == 200
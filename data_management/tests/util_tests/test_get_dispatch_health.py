@@ -0,0 +1,109 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from events.models import Notification
+from events.tests.factories.event_factory import EventFactory
+from users.tests.factories.user_factory import UserFactory
+from data_management.models import JobHeartbeat
+from data_management.utils.get_dispatch_health import get_dispatch_health, DISPATCHER_JOB_NAME
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def mock_schedule_notifications(mocker):
+    """Prevents EventFactory saves from rescheduling the notifications under test."""
+    mocker.patch('events.utils.schedule_notifications_for_event.schedule_notifications_for_event')
+
+@pytest.fixture(autouse=True)
+def thresholds(settings):
+    settings.DISPATCH_LAG_DEGRADED_SECONDS = 5 * 60
+    settings.DISPATCH_LAG_FAILING_SECONDS = 15 * 60
+    settings.DISPATCH_BACKLOG_DEGRADED_SIZE = 2
+    settings.DISPATCH_RETRY_DEGRADED_SIZE = 1
+    settings.DISPATCHER_HEARTBEAT_MAX_AGE_SECONDS = 10 * 60
+
+def _heartbeat(age):
+    JobHeartbeat.objects.create(name=DISPATCHER_JOB_NAME, succeeded_at=timezone.now() - age, duration_seconds=1.5)
+
+def _due(user, channel, late_by, status='pending'):
+    return Notification.objects.create(
+        event=EventFactory(user=user), user=user, channel=channel, status=status,
+        scheduled_send_time=timezone.now() - late_by
+    )
+
+def test_ok_with_a_recent_heartbeat_and_no_backlog():
+    """
+    Test that a dispatcher that ran recently with nothing due is healthy.
+    """
+    _heartbeat(timedelta(minutes=1))
+    _due(UserFactory(is_email_verified=True), 'primary_email', timedelta(hours=1), status='sent')
+
+    health = get_dispatch_health()
+
+    assert health['status'] == 'ok'
+    assert health['problems'] == []
+    assert health['backlog'] == {}
+    assert health['heartbeat']['duration_seconds'] == 1.5
+
+def test_lag_turns_the_status_degraded_then_failing():
+    """
+    Test that each channel's oldest due notification is compared with the lag thresholds.
+    """
+    _heartbeat(timedelta(minutes=1))
+    user = UserFactory(is_email_verified=True)
+    _due(user, 'primary_email', timedelta(minutes=7))
+    _due(user, 'primary_email', timedelta(minutes=1))
+
+    health = get_dispatch_health()
+    assert health['status'] == 'degraded'
+    assert health['backlog']['primary_email']['count'] == 2
+    assert 420 <= health['backlog']['primary_email']['lag_seconds'] < 480
+
+    _due(user, 'primary_sms', timedelta(minutes=20))
+    health = get_dispatch_health()
+    assert health['status'] == 'failing'
+    assert health['backlog_size'] == 3
+    assert len(health['problems']) == 3
+
+def test_failed_notifications_are_retries_not_lag():
+    """
+    Test that an old failed notification does not count as lag, and that the retries are reported on their own.
+    """
+    _heartbeat(timedelta(minutes=1))
+    user = UserFactory(is_email_verified=True)
+    _due(user, 'primary_email', timedelta(days=3), status='failed')
+    _due(user, 'primary_email', timedelta(minutes=1))
+
+    health = get_dispatch_health()
+    assert health['status'] == 'ok'
+    assert health['backlog']['primary_email']['count'] == 1
+    assert health['backlog']['primary_email']['retrying'] == 1
+    assert health['backlog']['primary_email']['lag_seconds'] < 120
+    assert health['retry_backlog_size'] == 1
+
+    _due(user, 'primary_sms', timedelta(days=3), status='failed')
+    health = get_dispatch_health()
+    assert health['status'] == 'degraded'
+    assert health['backlog']['primary_sms']['lag_seconds'] is None
+    assert health['problems'] == ['2 failed notifications are waiting for a retry.']
+
+def test_ignores_notifications_the_dispatcher_skips():
+    """
+    Test that social media steps and notifications of unverified users are not counted as lag.
+    """
+    _heartbeat(timedelta(minutes=1))
+    _due(UserFactory(is_email_verified=False), 'primary_email', timedelta(hours=2))
+    _due(UserFactory(is_email_verified=True), 'social_media', timedelta(hours=2))
+
+    assert get_dispatch_health()['status'] == 'ok'
+
+def test_a_stale_or_missing_heartbeat_is_failing():
+    """
+    Test that the dispatcher is failing if it never ran or has not run recently.
+    """
+    assert get_dispatch_health()['status'] == 'failing'
+
+    _heartbeat(timedelta(minutes=11))
+    health = get_dispatch_health()
+    assert health['status'] == 'failing'
+    assert health['heartbeat']['age_seconds'] >= 660
@@ -0,0 +1,102 @@
+import json
+import multiprocessing
+import os
+import pytest
+from data_management.utils.metrics_registry import MetricsRegistry, Counter, Gauge, Histogram, ARCHIVE_FILENAME
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+def test_renders_counters_gauges_and_histograms(registry, settings):
+    """
+    Test that every metric type is rendered in the Prometheus text format.
+    """
+    settings.METRICS_DIR = None
+    sent = Counter('sent_total', 'Messages sent.', ['channel'], registry=registry)
+    backlog = Gauge('backlog', 'Due messages.', registry=registry)
+    duration = Histogram('duration_seconds', 'Duration.', ['provider'], buckets=(0.1, 1), registry=registry)
+
+    sent.inc(channel='primary_email')
+    sent.inc(2, channel='primary_email')
+    backlog.set(7)
+    duration.observe(0.05, provider='twilio')
+    duration.observe(0.5, provider='twilio')
+    duration.observe(5, provider='twilio')
+
+    assert registry.render().splitlines() == [
+        '# HELP backlog Due messages.',
+        '# TYPE backlog gauge',
+        'backlog 7',
+        '# HELP duration_seconds Duration.',
+        '# TYPE duration_seconds histogram',
+        'duration_seconds_bucket{provider="twilio",le="0.1"} 1',
+        'duration_seconds_bucket{provider="twilio",le="1"} 2',
+        'duration_seconds_bucket{provider="twilio",le="+Inf"} 3',
+        'duration_seconds_sum{provider="twilio"} 5.55',
+        'duration_seconds_count{provider="twilio"} 3',
+        '# HELP sent_total Messages sent.',
+        '# TYPE sent_total counter',
+        'sent_total{channel="primary_email"} 3',
+    ]
+
+def test_rejects_wrong_labels_and_negative_increments(registry):
+    """
+    Test that a series must name exactly the declared labels and counters cannot go down.
+    """
+    counter = Counter('failures_total', 'Failures.', ['code'], registry=registry)
+
+    with pytest.raises(ValueError):
+        counter.inc(channel='sms')
+    with pytest.raises(ValueError):
+        counter.inc(-1, code='500')
+    with pytest.raises(ValueError):
+        Counter('failures_total', 'Duplicate.', registry=registry)
+
+def test_escapes_label_values(registry, settings):
+    """
+    Test that quotes, backslashes and newlines in label values are escaped.
+    """
+    settings.METRICS_DIR = None
+    counter = Counter('errors_total', 'Errors.', ['code'], registry=registry)
+    counter.inc(code='a"b\\c\nd')
+
+    assert 'errors_total{code="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+def _increment_in_child(registry, counter):
+    counter.inc(5, channel='primary_sms')
+    registry.flush()
+
+def test_adds_up_the_values_of_every_process(registry, settings, tmp_path):
+    """
+    Test that a scrape includes the counters written by other processes, and
+    that a forked process does not repeat its parent's values.
+    """
+    settings.METRICS_DIR = str(tmp_path)
+    settings.METRICS_FLUSH_INTERVAL_SECONDS = 60
+    counter = Counter('sent_total', 'Messages sent.', ['channel'], registry=registry)
+    counter.inc(2, channel='primary_sms')
+
+    child = multiprocessing.get_context('fork').Process(target=_increment_in_child, args=(registry, counter))
+    child.start()
+    child.join()
+
+    assert registry.get_sample_value('sent_total', channel='primary_sms') == 7
+
+def test_archives_the_files_of_exited_processes(registry, settings, tmp_path):
+    """
+    Test that the file of an exited process is merged into the archive and removed.
+    """
+    settings.METRICS_DIR = str(tmp_path)
+    histogram = Histogram('duration_seconds', 'Duration.', buckets=(1,), registry=registry)
+    histogram.observe(0.5)
+    # A process id that is not running.
+    dead_file = tmp_path / '999999999_deadbeef.json'
+    dead_file.write_text(json.dumps({'duration_seconds': {'[]': {'buckets': [0, 2], 'sum': 6, 'count': 2}}}))
+
+    assert registry.get_sample_value('duration_seconds') == 3
+    assert not dead_file.exists()
+    assert json.loads((tmp_path / ARCHIVE_FILENAME).read_text())['duration_seconds']['[]']['count'] == 2
+    assert 'duration_seconds_sum 6.5' in registry.render()
+    assert sorted(os.listdir(tmp_path)) == sorted(['.lock', ARCHIVE_FILENAME, registry._filename])
@@ -0,0 +1,31 @@
+import pytest
+from django.utils import timezone
+from data_management.models import MonthlyPlatformSummary
+from data_management.utils import refresh_monthly_platform_summaries as refresh_module
+from data_management.utils.refresh_monthly_platform_summaries import refresh_monthly_platform_summaries
+
+pytestmark = pytest.mark.django_db
+
+def test_month_stored_by_a_concurrent_request_is_reread(mocker):
+    """
+    Test that a month inserted by another request between the read and the
+    insert is read back and updated instead of failing on the unique month.
+    """
+    current_month = timezone.localdate().replace(day=1)
+    compute_month = refresh_module._compute_month
+
+    def compute_while_another_request_inserts(month_start, month_end):
+        totals = compute_month(month_start, month_end)
+        if month_start.date() == current_month:
+            MonthlyPlatformSummary.objects.create(
+                month=current_month, computed_at=timezone.now(), changed_at=timezone.now(), **dict(totals, users=99)
+            )
+        return totals
+
+    mocker.patch.object(refresh_module, '_compute_month', side_effect=compute_while_another_request_inserts)
+
+    summaries = refresh_monthly_platform_summaries(months=0)
+
+    assert [summary.month for summary in summaries] == [current_month]
+    assert summaries[0].users == 0
+    assert MonthlyPlatformSummary.objects.get(month=current_month).users == 0
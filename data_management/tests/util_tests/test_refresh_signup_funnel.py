@@ -0,0 +1,85 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from data_management.models import SignupCohortFunnel
+from data_management.utils.refresh_signup_funnel import refresh_signup_funnel
+from events.tests.factories.event_factory import EventFactory
+from payments.tests.factories.payment_factory import PaymentFactory
+from users.models import User
+from users.tests.factories.user_factory import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def mock_schedule_notifications(mocker):
+    """Prevents EventFactory saves from creating notifications."""
+    mocker.patch('events.utils.schedule_notifications_for_event.schedule_notifications_for_event')
+
+def _current_week():
+    today = timezone.localdate()
+    return today - timedelta(days=today.weekday())
+
+def _user(joined_at, verified=True):
+    user = UserFactory(is_email_verified=verified)
+    User.objects.filter(pk=user.pk).update(date_joined=joined_at)
+    return user
+
+def test_counts_each_funnel_step_cumulatively():
+    """
+    Test that each step counts the cohort's users who completed it and every step before it.
+    """
+    joined_at = timezone.now()
+    _user(joined_at, verified=False)
+    _user(joined_at)
+    with_event = _user(joined_at)
+    EventFactory(user=with_event, is_active=False)
+    activated = _user(joined_at)
+    EventFactory(user=activated, is_active=True)
+    paid = _user(joined_at)
+    event = EventFactory(user=paid, is_active=True)
+    PaymentFactory.create_batch(2, user=paid, event=event, status='succeeded')
+    # Paid without ever activating an event, so it does not reach the last step.
+    PaymentFactory(user=with_event, event=None, status='succeeded')
+
+    refresh_signup_funnel(weeks=0)
+
+    cohort = SignupCohortFunnel.objects.get(week_start=_current_week())
+    assert (cohort.signups, cohort.verified, cohort.created_event, cohort.activated, cohort.paid) == (5, 4, 3, 2, 1)
+    assert not cohort.is_final
+
+def test_only_open_cohorts_are_recomputed(settings):
+    """
+    Test that a closed cohort is frozen once computed while open cohorts keep updating.
+    """
+    settings.FUNNEL_OPEN_COHORT_WEEKS = 2
+    old_joined_at = timezone.now() - timedelta(weeks=4)
+    _user(old_joined_at)
+    _user(timezone.now())
+
+    assert refresh_signup_funnel(weeks=4) == 5
+
+    _user(old_joined_at)
+    _user(timezone.now())
+
+    # Only the open cohorts (this week and the two before it) are recomputed.
+    assert refresh_signup_funnel(weeks=4) == 3
+
+    old_week = _current_week() - timedelta(weeks=4)
+    assert SignupCohortFunnel.objects.get(week_start=old_week).signups == 1
+    assert SignupCohortFunnel.objects.get(week_start=old_week).is_final
+    assert SignupCohortFunnel.objects.get(week_start=_current_week()).signups == 2
+
+def test_deactivated_events_still_count_as_activated():
+    """
+    Test that a user whose event was activated and later deactivated stays in the activated step.
+    """
+    user = _user(timezone.now())
+    event = EventFactory(user=user, is_active=True)
+    event.is_active = False
+    event.save()
+
+    refresh_signup_funnel(weeks=0)
+
+    event.refresh_from_db()
+    assert event.activated_at is not None
+    assert SignupCohortFunnel.objects.get(week_start=_current_week()).activated == 1
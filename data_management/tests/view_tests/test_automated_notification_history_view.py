@@ -4,23 +4,27 @@ from django.utils import timezone
 from datetime import timedelta, datetime
 from rest_framework.test import APIClient
 from users.models import User
-from events.models import Notification
+from events.models import Notification, NotificationDailyStats
 from events.tests.factories.event_factory import EventFactory
 
 pytestmark = pytest.mark.django_db
 
+
 @pytest.fixture
 def api_client():
     return APIClient()
 
+
 @pytest.fixture
 def admin_user():
     return User.objects.create_superuser('admin@example.com', 'password')
 
+
 @pytest.fixture
 def regular_user():
     return User.objects.create_user('user@example.com', 'password')
 
+
 def test_automated_notification_history_unauthorized(api_client, regular_user):
     """
     Test that a non-admin user cannot access the view.
@@ -30,6 +34,7 @@ def test_automated_notification_history_unauthorized(api_client, regular_user):
     response = api_client.get(url)
     assert response.status_code == 403
 
+
 def test_automated_notification_history_authorized(api_client, admin_user):
     """
     Test that an admin user can access the view and gets a 200 response.
@@ -50,46 +55,14 @@ def test_automated_notification_history_authorized(api_client, admin_user):
         scheduled_send_time=base_time
     )
     
-    # 2. A completed notification that should be counted
-    completed_notification = Notification.objects.create(
-        event=event,
-        user=event.user,
-        channel='primary_sms', 
-        status='sent', 
-        scheduled_send_time=base_time - timedelta(days=2),
-    )
-    # Manually update the 'updated_at' field to bypass auto_now=True
-    Notification.objects.filter(pk=completed_notification.pk).update(updated_at=completed_time)
+    # 2. Daily rollup rows for the sent, failed and delivered notifications
+    completed_day = completed_time.date()
+    NotificationDailyStats.objects.create(day=completed_day, channel='primary_sms', status='sent', count=1)
+    NotificationDailyStats.objects.create(day=completed_day, channel='primary_email', status='failed', count=1)
+    NotificationDailyStats.objects.create(day=completed_day, channel='backup_sms', status='delivered', count=1)
 
-
-    # 3. A notification that has failed
-    failed_notification = Notification.objects.create(
-        event=event,
-        user=event.user,
-        channel='primary_email', 
-        status='failed', 
-        scheduled_send_time=base_time - timedelta(days=3),
-    )
-    Notification.objects.filter(pk=failed_notification.pk).update(updated_at=completed_time)
-
-    # 4. A notification that was delivered
-    delivered_notification = Notification.objects.create(
-        event=event,
-        user=event.user,
-        channel='backup_sms', 
-        status='delivered', 
-        scheduled_send_time=base_time - timedelta(days=4),
-    )
-    Notification.objects.filter(pk=delivered_notification.pk).update(updated_at=completed_time)
-
-    # 5. A notification with a channel that should NOT be included
-    Notification.objects.create(
-        event=event,
-        user=event.user,
-        channel='social_media', 
-        status='completed', 
-        scheduled_send_time=base_time - timedelta(days=5),
-    )
+    # 3. A rollup row with a channel that should NOT be included
+    NotificationDailyStats.objects.create(day=completed_day, channel='social_media', status='completed', count=1)
 
     url = reverse('data_management:automated-notification-history')
     response = api_client.get(url)
@@ -113,4 +86,52 @@ def test_automated_notification_history_authorized(api_client, admin_user):
     assert data_map[completed_day_str]['sent'] == 1
     assert data_map[completed_day_str]['delivered'] == 1
     assert data_map[completed_day_str]['errors'] == 1
-    assert data_map[completed_day_str]['completed'] == 0
\ No newline at end of file
+    assert data_map[completed_day_str]['completed'] == 0
+
+
+def test_automated_notification_history_sms_segments(api_client, admin_user):
+    """
+    Test that the billable SMS segments of sent notifications are summed per day.
+    """
+    api_client.force_authenticate(user=admin_user)
+    sent_day = timezone.localdate() - timedelta(days=1)
+
+    NotificationDailyStats.objects.create(day=sent_day, channel='primary_sms', status='sent', count=2, sms_segments=3)
+    NotificationDailyStats.objects.create(day=sent_day, channel='primary_email', status='sent', count=1)
+
+    response = api_client.get(reverse('data_management:automated-notification-history'))
+
+    data_map = {item['date']: item for item in response.data}
+    assert data_map[sent_day.strftime('%Y-%m-%d')]['sms_segments'] == 3
+    assert data_map[sent_day.strftime('%Y-%m-%d')]['sent'] == 3
+
+
+def test_automated_notification_history_query_count(api_client, admin_user, django_assert_num_queries):
+    """
+    Test that the history is built with a fixed number of queries, however many statuses and days it covers.
+    """
+    api_client.force_authenticate(user=admin_user)
+    event = EventFactory()
+    now = timezone.now()
+    activity_day = timezone.localdate() - timedelta(days=3)
+
+    for _ in range(3):
+        Notification.objects.create(
+            event=event,
+            user=event.user,
+            channel='primary_sms',
+            status='pending',
+            scheduled_send_time=now + timedelta(days=2),
+        )
+    for status in ('sent', 'delivered', 'failed'):
+        for channel in ('primary_sms', 'primary_email'):
+            NotificationDailyStats.objects.create(day=activity_day, channel=channel, status=status, count=1)
+
+    # The date range, the due notifications and the rollup.
+    with django_assert_num_queries(3):
+        response = api_client.get(reverse('data_management:automated-notification-history'))
+
+    data_map = {item['date']: item for item in response.data}
+    activity = data_map[activity_day.strftime('%Y-%m-%d')]
+    assert data_map[(now + timedelta(days=2)).strftime('%Y-%m-%d')]['scheduled'] == 3
+    assert (activity['sent'], activity['delivered'], activity['errors']) == (2, 2, 2)
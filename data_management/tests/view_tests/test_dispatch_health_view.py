@@ -0,0 +1,75 @@
+import pytest
+from datetime import timedelta
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from users.models import User
+from data_management.models import JobHeartbeat
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def api_client():
+    cache.clear()
+    return APIClient()
+
+@pytest.fixture
+def admin_client(api_client):
+    api_client.force_authenticate(user=User.objects.create_superuser('admin@example.com', 'password'))
+    return api_client
+
+def test_dispatch_health_ok(api_client, settings):
+    """
+    Test that a healthy dispatcher returns 200 and only the status without authentication.
+    """
+    settings.DISPATCHER_HEARTBEAT_MAX_AGE_SECONDS = 600
+    JobHeartbeat.objects.create(name='process_notifications', succeeded_at=timezone.now(), duration_seconds=2)
+
+    response = api_client.get(reverse('data_management:dispatch-health'))
+
+    assert response.status_code == 200
+    assert response.data == {'status': 'ok'}
+
+def test_dispatch_health_failing_returns_503(api_client, settings):
+    """
+    Test that a stalled dispatcher returns 503 without exposing the problem to anonymous callers.
+    """
+    settings.DISPATCHER_HEARTBEAT_MAX_AGE_SECONDS = 600
+    JobHeartbeat.objects.create(
+        name='process_notifications', succeeded_at=timezone.now() - timedelta(hours=1), duration_seconds=2
+    )
+
+    response = api_client.get(reverse('data_management:dispatch-health'))
+
+    assert response.status_code == 503
+    assert response.data == {'status': 'failing'}
+
+def test_dispatch_health_details_for_admins(admin_client, settings):
+    """
+    Test that an admin gets the problems and the backlog along with the status.
+    """
+    settings.DISPATCHER_HEARTBEAT_MAX_AGE_SECONDS = 600
+    JobHeartbeat.objects.create(
+        name='process_notifications', succeeded_at=timezone.now() - timedelta(hours=1), duration_seconds=2
+    )
+
+    response = admin_client.get(reverse('data_management:dispatch-health'))
+
+    assert response.status_code == 503
+    assert response.data['status'] == 'failing'
+    assert response.data['backlog_size'] == 0
+    assert 'dispatcher last completed a run' in response.data['problems'][0]
+
+def test_dispatch_health_status_is_cached_for_anonymous_callers(api_client, settings, django_assert_num_queries):
+    """
+    Test that repeated anonymous polls are served from the cache.
+    """
+    settings.DISPATCHER_HEARTBEAT_MAX_AGE_SECONDS = 600
+    JobHeartbeat.objects.create(name='process_notifications', succeeded_at=timezone.now(), duration_seconds=2)
+    api_client.get(reverse('data_management:dispatch-health'))
+
+    with django_assert_num_queries(0):
+        response = api_client.get(reverse('data_management:dispatch-health'))
+
+    assert response.data == {'status': 'ok'}
@@ -86,3 +86,80 @@ def test_historical_summary_authorized(api_client, admin_user):
     assert data_map[month2_str]['users'] == 1
     assert data_map[month2_str]['events'] == 3
     assert data_map[month2_str]['payments'] == 0
+
+def test_historical_summary_revenue_and_conversions(api_client, admin_user):
+    """
+    Test that successful payments are summed and each paying user is converted once, in the month of their first payment.
+    """
+    api_client.force_authenticate(user=admin_user)
+    user = UserFactory()
+    event = EventFactory(user=user)
+    month1_time = (timezone.now() - relativedelta(months=1)).replace(day=1, hour=12)
+    for amount in ('10.00', '5.50'):
+        payment = PaymentFactory(user=user, event=event, status='succeeded', amount=amount)
+        Payment.objects.filter(pk=payment.pk).update(created_at=month1_time)
+    PaymentFactory(user=user, event=event, status='succeeded', amount='20.00')
+    PaymentFactory(user=user, event=event, status='failed', amount='99.00')
+
+    response = api_client.get(reverse('data_management:historical-summary'))
+
+    data_map = {item['month']: item for item in response.data}
+    previous = data_map[month1_time.strftime('%Y-%m')]
+    current = data_map[timezone.now().strftime('%Y-%m')]
+    assert (previous['payments'], previous['revenue'], previous['conversions']) == (2, '15.50', 1)
+    assert (current['payments'], current['revenue'], current['conversions']) == (1, '20.00', 0)
+
+def test_historical_summary_closed_months_are_frozen(api_client, admin_user):
+    """
+    Test that a month that has ended is not recomputed once its summary is final.
+    """
+    api_client.force_authenticate(user=admin_user)
+    setup_historical_data()
+    url = reverse('data_management:historical-summary')
+    api_client.get(url)
+
+    # Two months back is always past the grace period, unlike last month.
+    month2_time = timezone.now() - relativedelta(months=2)
+    late_user = UserFactory()
+    User.objects.filter(pk=late_user.pk).update(date_joined=month2_time)
+
+    response = api_client.get(url)
+
+    data_map = {item['month']: item for item in response.data}
+    assert data_map[month2_time.strftime('%Y-%m')]['users'] == 1
+
+def test_historical_summary_ended_month_stays_open_during_grace_period(api_client, admin_user, settings):
+    """
+    Test that a month that ended within PLATFORM_SUMMARY_FINAL_AFTER_HOURS still
+    picks up payments that a late webhook marks as succeeded.
+    """
+    settings.PLATFORM_SUMMARY_REFRESH_SECONDS = 0
+    settings.PLATFORM_SUMMARY_FINAL_AFTER_HOURS = 24 * 62
+    api_client.force_authenticate(user=admin_user)
+    user = UserFactory()
+    month1_time = (timezone.now() - relativedelta(months=1)).replace(day=1, hour=12)
+    payment = PaymentFactory(user=user, event=EventFactory(user=user), status='pending', amount='10.00')
+    Payment.objects.filter(pk=payment.pk).update(created_at=month1_time)
+    url = reverse('data_management:historical-summary')
+    api_client.get(url)
+
+    Payment.objects.filter(pk=payment.pk).update(status='succeeded')
+    response = api_client.get(url)
+
+    data_map = {item['month']: item for item in response.data}
+    assert data_map[month1_time.strftime('%Y-%m')]['revenue'] == '10.00'
+
+def test_historical_summary_conditional_request(api_client, admin_user, django_assert_num_queries):
+    """
+    Test that a repeat request with the ETag gets a 304 from a single summary lookup.
+    """
+    api_client.force_authenticate(user=admin_user)
+    url = reverse('data_management:historical-summary')
+    first = api_client.get(url)
+    assert first['ETag']
+    assert first['Last-Modified']
+
+    with django_assert_num_queries(1):
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+    assert response.status_code == 304
@@ -0,0 +1,88 @@
+import pytest
+from datetime import timedelta
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from twilio.request_validator import RequestValidator
+from events.models import Notification
+from events.tests.factories.event_factory import EventFactory
+from users.models import User
+from users.tests.factories.user_factory import UserFactory
+from data_management.utils.metrics_registry import REGISTRY
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def admin_user():
+    return User.objects.create_superuser('admin@example.com', 'password')
+
+@pytest.fixture(autouse=True)
+def mock_schedule_notifications(mocker):
+    """Prevents EventFactory saves from rescheduling the notifications under test."""
+    mocker.patch('events.utils.schedule_notifications_for_event.schedule_notifications_for_event')
+
+@pytest.fixture(autouse=True)
+def in_memory_metrics(settings):
+    settings.METRICS_DIR = None
+
+def test_metrics_unauthorized(api_client):
+    """
+    Test that a non-admin user cannot read the metrics.
+    """
+    api_client.force_authenticate(user=User.objects.create_user('user@example.com', 'password'))
+    assert api_client.get(reverse('metrics')).status_code == 403
+
+def test_metrics_report_the_due_backlog(api_client, admin_user):
+    """
+    Test that the backlog gauges count due pending notifications, their oldest lag and the retries per channel.
+    """
+    api_client.force_authenticate(user=admin_user)
+    user = UserFactory(is_email_verified=True)
+    event = EventFactory(user=user)
+    now = timezone.now()
+    for status, due in (('pending', now - timedelta(minutes=10)), ('pending', now - timedelta(minutes=2)),
+                        ('failed', now - timedelta(days=1)), ('sent', now - timedelta(hours=1)),
+                        ('pending', now + timedelta(hours=1))):
+        Notification.objects.create(event=event, user=user, channel='primary_email', status=status, scheduled_send_time=due)
+
+    response = api_client.get(reverse('metrics'))
+
+    assert response.status_code == 200
+    assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+    body = response.content.decode()
+    assert 'futurereminder_due_notifications{channel="primary_email"} 2' in body
+    assert 'futurereminder_retrying_notifications{channel="primary_email"} 1' in body
+    lag_line = next(line for line in body.splitlines() if line.startswith('futurereminder_oldest_due_lag_seconds{'))
+    assert 600 <= float(lag_line.split()[-1]) < 660
+
+def test_metrics_count_queries_per_view(api_client, admin_user):
+    """
+    Test that the queries of each request are recorded against the view's URL name.
+    """
+    api_client.force_authenticate(user=admin_user)
+    before = REGISTRY.get_sample_value('futurereminder_view_db_queries', view='data_management:signup-funnel') or 0
+
+    api_client.get(reverse('data_management:signup-funnel'))
+
+    assert REGISTRY.get_sample_value('futurereminder_view_db_queries', view='data_management:signup-funnel') == before + 1
+    assert 'futurereminder_view_db_queries_bucket{view="data_management:signup-funnel",le="+Inf"}' in api_client.get(reverse('metrics')).content.decode()
+
+def test_metrics_time_webhooks_and_count_failure_codes(api_client, settings):
+    """
+    Test that a webhook's processing time and its failure code are recorded.
+    """
+    settings.TWILIO_AUTH_TOKEN = 'test-auth-token'
+    data = {'MessageSid': 'SM1', 'MessageStatus': 'undelivered', 'ErrorCode': '30003'}
+    url = reverse('twilio-status-webhook')
+    signature = RequestValidator(settings.TWILIO_AUTH_TOKEN).compute_signature(f"{settings.SITE_URL}{url}", data)
+    timed_before = REGISTRY.get_sample_value('futurereminder_webhook_processing_seconds', provider='twilio') or 0
+    failed_before = REGISTRY.get_sample_value('futurereminder_notification_failures_total', source='twilio_callback', code='30003') or 0
+
+    api_client.post(url, data, HTTP_X_TWILIO_SIGNATURE=signature)
+
+    assert REGISTRY.get_sample_value('futurereminder_webhook_processing_seconds', provider='twilio') == timed_before + 1
+    assert REGISTRY.get_sample_value('futurereminder_notification_failures_total', source='twilio_callback', code='30003') == failed_before + 1
@@ -0,0 +1,51 @@
+import pytest
+from django.urls import reverse
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def api_client():
+    cache.clear()
+    return APIClient()
+
+@pytest.fixture
+def admin_user():
+    return User.objects.create_superuser('admin@example.com', 'password')
+
+@pytest.fixture
+def regular_user():
+    return User.objects.create_user('user@example.com', 'password')
+
+def test_notification_forecast_unauthorized(api_client, regular_user):
+    """
+    Test that a non-admin user cannot access the view.
+    """
+    api_client.force_authenticate(user=regular_user)
+    url = reverse('data_management:notification-forecast')
+    response = api_client.get(url)
+    assert response.status_code == 403
+
+def test_notification_forecast_returns_requested_days(api_client, admin_user):
+    """
+    Test that the forecast covers the requested number of days.
+    """
+    api_client.force_authenticate(user=admin_user)
+    url = reverse('data_management:notification-forecast')
+    response = api_client.get(url, {'days': 7})
+
+    assert response.status_code == 200
+    assert len(response.data) == 7
+    assert set(response.data[0]) == {'date', 'scheduled', 'projected', 'hourly'}
+
+def test_notification_forecast_rejects_invalid_days(api_client, admin_user):
+    """
+    Test that a non-numeric or out-of-range 'days' parameter is rejected.
+    """
+    api_client.force_authenticate(user=admin_user)
+    url = reverse('data_management:notification-forecast')
+
+    assert api_client.get(url, {'days': 'abc'}).status_code == 400
+    assert api_client.get(url, {'days': 0}).status_code == 400
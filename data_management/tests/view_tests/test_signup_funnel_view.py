@@ -0,0 +1,58 @@
+import pytest
+from datetime import timedelta
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from users.models import User
+from data_management.models import SignupCohortFunnel
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def admin_user():
+    return User.objects.create_superuser('admin@example.com', 'password')
+
+def _week(weeks_ago):
+    today = timezone.localdate()
+    return today - timedelta(days=today.weekday(), weeks=weeks_ago)
+
+def test_signup_funnel_unauthorized(api_client):
+    """
+    Test that a non-admin user cannot access the funnel.
+    """
+    api_client.force_authenticate(user=User.objects.create_user('user@example.com', 'password'))
+    assert api_client.get(reverse('data_management:signup-funnel')).status_code == 403
+
+def test_signup_funnel_returns_cohorts_with_rates(api_client, admin_user):
+    """
+    Test that the stored cohorts in the window are returned with their conversion rates.
+    """
+    api_client.force_authenticate(user=admin_user)
+    SignupCohortFunnel.objects.create(
+        week_start=_week(1), signups=10, verified=8, created_event=5, activated=4, paid=2, computed_at=timezone.now()
+    )
+    SignupCohortFunnel.objects.create(
+        week_start=_week(0), signups=0, computed_at=timezone.now()
+    )
+    SignupCohortFunnel.objects.create(
+        week_start=_week(30), signups=3, computed_at=timezone.now()
+    )
+
+    response = api_client.get(reverse('data_management:signup-funnel'), {'weeks': 4})
+
+    assert response.status_code == 200
+    assert [cohort['week_start'] for cohort in response.data] == [_week(1).isoformat(), _week(0).isoformat()]
+    assert response.data[0]['rates'] == {'verified': 0.8, 'created_event': 0.5, 'activated': 0.4, 'paid': 0.2}
+    assert response.data[1]['rates']['paid'] == 0.0
+
+def test_signup_funnel_invalid_weeks(api_client, admin_user):
+    """
+    Test that a malformed or out-of-range window is rejected.
+    """
+    api_client.force_authenticate(user=admin_user)
+    for weeks in ('abc', 0, 500):
+        assert api_client.get(reverse('data_management:signup-funnel'), {'weeks': weeks}).status_code == 400
@@ -7,6 +7,10 @@ from .views.product_views import SingleEventPriceView
 from .views.automated_notification_history_view import AutomatedNotificationHistoryView
 from .views.manual_notification_history_view import ManualNotificationHistoryView
 from .views.historical_summary_view import HistoricalSummaryView
+from .views.notification_forecast_view import NotificationForecastView
+from .views.analytics_export_view import AnalyticsExportView
+from .views.signup_funnel_view import SignupFunnelView
+from .views.dispatch_health_view import DispatchHealthView
 
 app_name = 'data_management'
 
@@ -19,4 +23,8 @@ urlpatterns = [
     path('analytics/automated-notifications/', AutomatedNotificationHistoryView.as_view(), name='automated-notification-history'),
     path('analytics/manual-notifications/', ManualNotificationHistoryView.as_view(), name='manual-notification-history'),
     path('analytics/historical-summary/', HistoricalSummaryView.as_view(), name='historical-summary'),
+    path('analytics/notification-forecast/', NotificationForecastView.as_view(), name='notification-forecast'),
+    path('analytics/export/', AnalyticsExportView.as_view(), name='analytics-export'),
+    path('analytics/signup-funnel/', SignupFunnelView.as_view(), name='signup-funnel'),
+    path('health/dispatch/', DispatchHealthView.as_view(), name='dispatch-health'),
 ]
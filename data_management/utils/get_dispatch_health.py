@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.utils import timezone
+from data_management.models import JobHeartbeat
+from events.utils.get_dispatch_backlog import get_dispatch_backlog
+
+DISPATCHER_JOB_NAME = 'process_notifications'
+
+# Ordered from best to worst.
+HEALTH_STATUSES = ['ok', 'degraded', 'failing']
+
+
+def get_dispatch_health(now=None) -> dict:
+    """
+    Checks whether reminders are going out on time.
+
+    The age of the oldest due, pending notification of each channel is
+    compared with DISPATCH_LAG_DEGRADED_SECONDS and
+    DISPATCH_LAG_FAILING_SECONDS, and the backlog size with
+    DISPATCH_BACKLOG_DEGRADED_SIZE. Failed notifications waiting for a retry
+    do not count as lag; more than DISPATCH_RETRY_DEGRADED_SIZE of them is
+    reported as degraded on its own. The dispatcher's last successful run is
+    compared with DISPATCHER_HEARTBEAT_MAX_AGE_SECONDS; a dispatcher that
+    has stopped running is failing even if nothing is due yet.
+
+    Args:
+        now: Optional. The time to check against. Defaults to now.
+
+    Returns:
+        A dictionary with the overall 'status' ('ok', 'degraded' or
+        'failing'), the 'problems' that caused it, the 'heartbeat', the
+        'backlog_size', the 'retry_backlog_size' and the per-channel 'backlog'.
+    """
+    now = now or timezone.now()
+    lag_degraded = getattr(settings, 'DISPATCH_LAG_DEGRADED_SECONDS', 5 * 60)
+    lag_failing = getattr(settings, 'DISPATCH_LAG_FAILING_SECONDS', 15 * 60)
+    backlog_degraded = getattr(settings, 'DISPATCH_BACKLOG_DEGRADED_SIZE', 1000)
+    retry_degraded = getattr(settings, 'DISPATCH_RETRY_DEGRADED_SIZE', 100)
+    heartbeat_max_age = getattr(settings, 'DISPATCHER_HEARTBEAT_MAX_AGE_SECONDS', 10 * 60)
+
+    problems = []
+    status = 'ok'
+
+    def report(level, problem):
+        nonlocal status
+        problems.append(problem)
+        if HEALTH_STATUSES.index(level) > HEALTH_STATUSES.index(status):
+            status = level
+
+    heartbeat = JobHeartbeat.objects.filter(name=DISPATCHER_JOB_NAME).first()
+    heartbeat_age = (now - heartbeat.succeeded_at).total_seconds() if heartbeat else None
+    if heartbeat is None:
+        report('failing', "The dispatcher has never completed a run.")
+    elif heartbeat_age > heartbeat_max_age:
+        report('failing', f"The dispatcher last completed a run {int(heartbeat_age)} seconds ago.")
+
+    backlog = get_dispatch_backlog(now)
+    for channel, row in backlog.items():
+        if row['lag_seconds'] is None:
+            continue
+        if row['lag_seconds'] > lag_failing:
+            report('failing', f"The oldest due {channel} notification is {int(row['lag_seconds'])} seconds late.")
+        elif row['lag_seconds'] > lag_degraded:
+            report('degraded', f"The oldest due {channel} notification is {int(row['lag_seconds'])} seconds late.")
+
+    backlog_size = sum(row['count'] for row in backlog.values())
+    if backlog_size > backlog_degraded:
+        report('degraded', f"{backlog_size} due notifications are waiting to be sent.")
+
+    retry_backlog_size = sum(row['retrying'] for row in backlog.values())
+    if retry_backlog_size > retry_degraded:
+        report('degraded', f"{retry_backlog_size} failed notifications are waiting for a retry.")
+
+    return {
+        'status': status,
+        'checked_at': now,
+        'problems': problems,
+        'heartbeat': {
+            'succeeded_at': heartbeat.succeeded_at if heartbeat else None,
+            'age_seconds': heartbeat_age,
+            'duration_seconds': heartbeat.duration_seconds if heartbeat else None,
+        },
+        'backlog_size': backlog_size,
+        'retry_backlog_size': retry_backlog_size,
+        'backlog': backlog,
+    }
@@ -0,0 +1,97 @@
+import functools
+import time
+from django.utils import timezone
+from events.utils.get_dispatch_backlog import get_dispatch_backlog
+from data_management.models import JobHeartbeat
+from .get_dispatch_health import DISPATCHER_JOB_NAME
+from .metrics_registry import Counter, Gauge, Histogram
+
+NOTIFICATIONS_SENT = Counter(
+    'futurereminder_notifications_sent_total',
+    'Messages accepted by a provider, by notification channel.',
+    ['channel']
+)
+NOTIFICATION_FAILURES = Counter(
+    'futurereminder_notification_failures_total',
+    'Rejected sends (source dispatch) and failed deliveries reported by webhooks, by error code.',
+    ['source', 'code']
+)
+WEBHOOK_PROCESSING_SECONDS = Histogram(
+    'futurereminder_webhook_processing_seconds',
+    'Time spent handling a provider webhook request.',
+    ['provider']
+)
+VIEW_DB_QUERIES = Histogram(
+    'futurereminder_view_db_queries',
+    'Database queries run while handling a request, by view.',
+    ['view'],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+)
+DUE_NOTIFICATIONS = Gauge(
+    'futurereminder_due_notifications',
+    'Due pending notifications the dispatcher has not sent yet, by channel.',
+    ['channel']
+)
+OLDEST_DUE_LAG_SECONDS = Gauge(
+    'futurereminder_oldest_due_lag_seconds',
+    'How long the oldest due pending notification has been waiting, by channel.',
+    ['channel']
+)
+RETRYING_NOTIFICATIONS = Gauge(
+    'futurereminder_retrying_notifications',
+    'Due failed notifications waiting for the dispatcher to retry them, by channel.',
+    ['channel']
+)
+DISPATCHER_HEARTBEAT_AGE_SECONDS = Gauge(
+    'futurereminder_dispatcher_heartbeat_age_seconds',
+    'Time since the dispatcher last completed a run.'
+)
+
+
+def get_failure_code(exception: Exception) -> str:
+    """
+    Returns a short error code for a failed provider call: the Twilio error
+    code, the HTTP status of a rejected request, or the exception's name.
+    """
+    code = getattr(exception, 'code', None)
+    if code:
+        return str(code)
+    response = getattr(exception, 'response', None)
+    if response is not None and getattr(response, 'status_code', None):
+        return f"http_{response.status_code}"
+    return type(exception).__name__
+
+
+def observe_webhook(provider: str):
+    """Decorates a webhook view to record its processing time."""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            started = time.monotonic()
+            try:
+                return view(request, *args, **kwargs)
+            finally:
+                WEBHOOK_PROCESSING_SECONDS.observe(time.monotonic() - started, provider=provider)
+        return wrapper
+    return decorator
+
+
+def update_backlog_metrics():
+    """
+    Sets the backlog and heartbeat gauges from the database, so they are
+    current for the scrape that is about to be rendered.
+    """
+    now = timezone.now()
+    backlog = get_dispatch_backlog(now)
+    DUE_NOTIFICATIONS.clear()
+    OLDEST_DUE_LAG_SECONDS.clear()
+    RETRYING_NOTIFICATIONS.clear()
+    for channel, row in backlog.items():
+        DUE_NOTIFICATIONS.set(row['count'], channel=channel)
+        RETRYING_NOTIFICATIONS.set(row['retrying'], channel=channel)
+        if row['lag_seconds'] is not None:
+            OLDEST_DUE_LAG_SECONDS.set(row['lag_seconds'], channel=channel)
+
+    heartbeat = JobHeartbeat.objects.filter(name=DISPATCHER_JOB_NAME).first()
+    if heartbeat:
+        DISPATCHER_HEARTBEAT_AGE_SECONDS.set((now - heartbeat.succeeded_at).total_seconds())
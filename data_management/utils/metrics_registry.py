@@ -0,0 +1,330 @@
+import atexit
+import glob
+import json
+import math
+import os
+import threading
+import uuid
+from django.conf import settings
+
+try:
+    import fcntl
+except ImportError: # Windows; dead process files are then never compacted.
+    fcntl = None
+
+# The Prometheus default buckets, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+ARCHIVE_FILENAME = 'archived.json'
+LOCK_FILENAME = '.lock'
+
+
+class _Metric:
+    """
+    A named metric with a fixed set of label names. Each combination of label
+    values is a separate series.
+    """
+    type = None
+
+    def __init__(self, name: str, documentation: str, labelnames=(), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._registry = registry or REGISTRY
+        self._registry.register(self)
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric '{self.name}' expects the labels: {', '.join(self.labelnames) or 'none'}.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+
+class Counter(_Metric):
+    """A value that only goes up, e.g. the number of messages sent."""
+    type = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        if amount < 0:
+            raise ValueError("Counters can only be increased.")
+        key = self._key(labels)
+        with self._registry.lock:
+            self._values[key] = self._values.get(key, 0) + amount
+        self._registry.changed()
+
+
+class Gauge(_Metric):
+    """
+    A value that goes up and down, e.g. the size of a queue.
+
+    Gauges are not shared between processes, so they should be set by the
+    process that exposes them, e.g. from the database right before a scrape.
+    """
+    type = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._registry.lock:
+            self._values[key] = value
+
+    def clear(self):
+        """Removes every series, e.g. before setting the ones that still exist."""
+        with self._registry.lock:
+            self._values = {}
+
+
+class Histogram(_Metric):
+    """A distribution of observed values, counted in cumulative buckets."""
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS, registry=None):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._registry.lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = {'buckets': [0] * (len(self.buckets) + 1), 'sum': 0, 'count': 0}
+            index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+            series['buckets'][index] += 1
+            series['sum'] += value
+            series['count'] += 1
+        self._registry.changed()
+
+
+def _merge(target: dict, source: dict):
+    """Adds the counter and histogram values of one snapshot to another."""
+    for name, series in source.items():
+        merged = target.setdefault(name, {})
+        for key, value in series.items():
+            if isinstance(value, dict):
+                existing = merged.get(key)
+                if existing is None:
+                    merged[key] = {'buckets': list(value['buckets']), 'sum': value['sum'], 'count': value['count']}
+                elif len(existing['buckets']) == len(value['buckets']):
+                    existing['buckets'] = [a + b for a, b in zip(existing['buckets'], value['buckets'])]
+                    existing['sum'] += value['sum']
+                    existing['count'] += value['count']
+            else:
+                merged[key] = merged.get(key, 0) + value
+
+
+def _pid_is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: list) -> str:
+    if not labels:
+        return ''
+    escaped = (
+        f'{name}="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for name, value in labels
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+class MetricsRegistry:
+    """
+    Holds the metrics of a process and renders them in the Prometheus text format.
+
+    Without METRICS_DIR, the metrics only live in memory, which is enough for
+    a single process such as the development server. With METRICS_DIR set,
+    every process (e.g. each gunicorn worker and each dispatcher run) writes
+    its counters and histograms to its own file in that directory, at most
+    every METRICS_FLUSH_INTERVAL_SECONDS and when it exits. A scrape adds
+    up the files of all processes, so it does not matter which worker
+    serves it. The files of processes that have exited are merged into a
+    single archive file, so the directory does not grow with every cron run.
+    The directory should be emptied on deploy, when the counters restart.
+    """
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._metrics = {}
+        self._timer = None
+        self._reset_process()
+        atexit.register(self.flush)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def register(self, metric: _Metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"A metric named '{metric.name}' is already registered.")
+        self._metrics[metric.name] = metric
+
+    def _reset_process(self):
+        self._pid = os.getpid()
+        self._filename = f"{self._pid}_{uuid.uuid4().hex[:8]}.json"
+
+    def _after_fork(self):
+        """A forked worker starts from zero instead of repeating its parent's values."""
+        self.lock = threading.RLock()
+        self._timer = None
+        self._reset_process()
+        for metric in self._metrics.values():
+            metric._values = {}
+
+    def _get_directory(self):
+        return getattr(settings, 'METRICS_DIR', None)
+
+    def changed(self):
+        """Schedules a write of this process's file, unless one is already due."""
+        if not self._get_directory():
+            return
+        with self.lock:
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(getattr(settings, 'METRICS_FLUSH_INTERVAL_SECONDS', 1), self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _snapshot(self) -> dict:
+        """Returns a copy of this process's counters and histograms, keyed by JSON-encoded label values."""
+        with self.lock:
+            return {
+                metric.name: {
+                    json.dumps(key): (dict(value, buckets=list(value['buckets'])) if isinstance(value, dict) else value)
+                    for key, value in metric._values.items()
+                }
+                for metric in self._metrics.values() if metric.type != 'gauge' and metric._values
+            }
+
+    def flush(self):
+        """Writes this process's counters and histograms to its file in METRICS_DIR."""
+        directory = self._get_directory()
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not directory:
+            return
+
+        snapshot = self._snapshot()
+        if not snapshot:
+            return
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, self._filename)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, 'w') as f:
+            json.dump(snapshot, f)
+        # Readers only ever see a complete file.
+        os.replace(temporary_path, path)
+
+    def _read_directory(self, directory: str) -> dict:
+        """
+        Adds up the files of every process, after merging the files of
+        processes that have exited into the archive.
+        """
+        totals = {}
+        archive_path = os.path.join(directory, ARCHIVE_FILENAME)
+        archive = {}
+        if os.path.exists(archive_path):
+            with open(archive_path) as f:
+                archive = json.load(f)
+
+        dead_paths = []
+        for path in glob.glob(os.path.join(directory, '*_*.json')):
+            try:
+                with open(path) as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue
+            pid = int(os.path.basename(path).split('_', 1)[0])
+            if fcntl is not None and pid != self._pid and not _pid_is_alive(pid):
+                _merge(archive, snapshot)
+                dead_paths.append(path)
+            else:
+                _merge(totals, snapshot)
+
+        if dead_paths:
+            temporary_path = f"{archive_path}.tmp"
+            with open(temporary_path, 'w') as f:
+                json.dump(archive, f)
+            os.replace(temporary_path, archive_path)
+            for path in dead_paths:
+                os.remove(path)
+
+        _merge(totals, archive)
+        return totals
+
+    def _collect_totals(self) -> dict:
+        directory = self._get_directory()
+        if not directory:
+            return self._snapshot()
+
+        self.flush()
+        if fcntl is None:
+            return self._read_directory(directory)
+        # One scrape at a time, so a file is never counted both on its own
+        # and in the archive.
+        with open(os.path.join(directory, LOCK_FILENAME), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                return self._read_directory(directory)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get_sample_value(self, name: str, **labels):
+        """
+        Returns the current value of a counter or gauge series, or the count of
+        a histogram series, across all processes. Returns None if the series
+        has no value yet.
+        """
+        metric = self._metrics[name]
+        key = metric._key(labels)
+        if metric.type == 'gauge':
+            return metric._values.get(key)
+        value = self._collect_totals().get(name, {}).get(json.dumps(list(key)))
+        if isinstance(value, dict):
+            return value['count']
+        return value
+
+    def render(self) -> str:
+        """Returns every metric in the Prometheus text exposition format (version 0.0.4)."""
+        totals = self._collect_totals()
+        lines = []
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.type}")
+
+            if metric.type == 'gauge':
+                with self.lock:
+                    series = {json.dumps(list(key)): value for key, value in metric._values.items()}
+            else:
+                series = totals.get(name, {})
+
+            for encoded_key in sorted(series):
+                labels = list(zip(metric.labelnames, json.loads(encoded_key)))
+                value = series[encoded_key]
+                if metric.type != 'histogram':
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                    continue
+                if len(value['buckets']) != len(metric.buckets) + 1:
+                    continue # Written with other buckets, e.g. before a deploy.
+                cumulative = 0
+                for bound, count in zip(metric.buckets + (math.inf,), value['buckets']):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(labels + [('le', _format_value(bound))])} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(value['sum'])}")
+                lines.append(f"{name}_count{_format_labels(labels)} {value['count']}")
+
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
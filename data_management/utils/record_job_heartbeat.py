@@ -0,0 +1,21 @@
+from django.utils import timezone
+from data_management.models import JobHeartbeat
+
+
+def record_job_heartbeat(name: str, started_at) -> JobHeartbeat:
+    """
+    Records that a periodic job has just finished successfully.
+
+    Args:
+        name: The job's name, e.g. 'process_notifications'.
+        started_at: When the run started, used to store its duration.
+
+    Returns:
+        The updated JobHeartbeat.
+    """
+    now = timezone.now()
+    heartbeat, _ = JobHeartbeat.objects.update_or_create(
+        name=name,
+        defaults={'succeeded_at': now, 'duration_seconds': (now - started_at).total_seconds()}
+    )
+    return heartbeat
@@ -0,0 +1,109 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from dateutil.relativedelta import relativedelta
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, router, transaction
+from django.db.models import Count, Min, Sum
+from django.utils import timezone
+from events.models import Event
+from payments.models import Payment
+from ..models import MonthlyPlatformSummary
+
+TOTAL_FIELDS = ('users', 'events', 'payments', 'revenue', 'conversions')
+
+
+def _compute_month(month_start, month_end) -> dict:
+    """
+    Computes the totals for one month over half-open datetime bounds, so every
+    filter can use an index on its date column.
+    """
+    successful_payments = Payment.objects.filter(status='succeeded')
+    payment_totals = successful_payments.filter(
+        created_at__gte=month_start,
+        created_at__lt=month_end
+    ).aggregate(count=Count('id'), revenue=Sum('amount'))
+
+    return {
+        'users': get_user_model().objects.filter(date_joined__gte=month_start, date_joined__lt=month_end).count(),
+        'events': Event.objects.filter(created_at__gte=month_start, created_at__lt=month_end).count(),
+        'payments': payment_totals['count'],
+        'revenue': (payment_totals['revenue'] or Decimal(0)).quantize(Decimal('0.01')),
+        'conversions': successful_payments.values('user').annotate(
+            first_payment=Min('created_at')
+        ).filter(first_payment__gte=month_start, first_payment__lt=month_end).count(),
+    }
+
+
+def _save_totals(summary, totals: dict, is_final: bool, now):
+    """Stores freshly computed totals, moving `changed_at` only if one changed."""
+    if any(getattr(summary, field) != value for field, value in totals.items()):
+        for field, value in totals.items():
+            setattr(summary, field, value)
+        summary.changed_at = now
+    summary.is_final = is_final
+    summary.computed_at = now
+    summary.save()
+
+
+def refresh_monthly_platform_summaries(months: int = 12) -> list:
+    """
+    Returns the platform summaries for the current month and the `months`
+    before it, computing only what is missing or stale.
+
+    A month stays open, and is recomputed when its row is older than
+    PLATFORM_SUMMARY_REFRESH_SECONDS, until PLATFORM_SUMMARY_FINAL_AFTER_HOURS
+    after it ends: late payment webhooks can still mark its payments as
+    succeeded. It is then computed one last time and frozen. `changed_at`
+    only moves when a total actually changes, so it can back HTTP
+    Last-Modified headers.
+
+    Args:
+        months: How many months before the current one to include.
+
+    Returns:
+        The MonthlyPlatformSummary rows in month order, one per month.
+    """
+    now = timezone.now()
+    current_month = timezone.localdate().replace(day=1)
+    first_month = current_month - relativedelta(months=months)
+    refresh_after = timedelta(seconds=getattr(settings, 'PLATFORM_SUMMARY_REFRESH_SECONDS', 300))
+    final_after = timedelta(hours=getattr(settings, 'PLATFORM_SUMMARY_FINAL_AFTER_HOURS', 72))
+
+    # The stored rows are read from the database they are written to, so a
+    # replica that is behind never leads to a duplicate insert.
+    database = router.db_for_write(MonthlyPlatformSummary)
+    existing = {
+        summary.month: summary
+        for summary in MonthlyPlatformSummary.objects.using(database).filter(month__gte=first_month, month__lte=current_month)
+    }
+
+    summaries = []
+    month = first_month
+    while month <= current_month:
+        summary = existing.get(month)
+        month_start = timezone.make_aware(datetime.combine(month, time.min))
+        month_end = timezone.make_aware(datetime.combine(month + relativedelta(months=1), time.min))
+        is_final = now >= month_end + final_after
+
+        if summary is None or (not summary.is_final and (is_final or now - summary.computed_at >= refresh_after)):
+            totals = _compute_month(month_start, month_end)
+
+            if summary is None:
+                try:
+                    with transaction.atomic(using=database):
+                        summary = MonthlyPlatformSummary.objects.using(database).create(
+                            month=month, is_final=is_final, computed_at=now, changed_at=now, **totals
+                        )
+                except IntegrityError:
+                    # A concurrent request stored the month first.
+                    summary = MonthlyPlatformSummary.objects.using(database).get(month=month)
+                    if not summary.is_final:
+                        _save_totals(summary, totals, is_final, now)
+            else:
+                _save_totals(summary, totals, is_final, now)
+
+        summaries.append(summary)
+        month += relativedelta(months=1)
+
+    return summaries
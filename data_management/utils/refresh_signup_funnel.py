@@ -0,0 +1,85 @@
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils import timezone
+from events.models import Event
+from payments.models import Payment
+from ..models import SignupCohortFunnel
+
+FUNNEL_STEPS = ('signups', 'verified', 'created_event', 'activated', 'paid')
+
+
+def _compute_cohort(week_start) -> dict:
+    """
+    Counts a cohort's users at each funnel step with one aggregate query. The
+    later steps are correlated EXISTS checks, so a user with many events or
+    payments is still counted once.
+    """
+    cohort_start = timezone.make_aware(datetime.combine(week_start, time.min))
+    cohort_end = cohort_start + timedelta(days=7)
+
+    users = get_user_model().objects.filter(
+        date_joined__gte=cohort_start,
+        date_joined__lt=cohort_end
+    ).annotate(
+        has_event=Exists(Event.objects.filter(user=OuterRef('pk'))),
+        # Ever activated, so a cohort does not shrink when events are later deactivated.
+        has_activated_event=Exists(Event.objects.filter(user=OuterRef('pk'), activated_at__isnull=False)),
+        has_paid=Exists(Payment.objects.filter(user=OuterRef('pk'), status='succeeded')),
+    )
+
+    verified = Q(is_email_verified=True)
+    created_event = verified & Q(has_event=True)
+    activated = created_event & Q(has_activated_event=True)
+    return users.aggregate(
+        signups=Count('id'),
+        verified=Count('id', filter=verified),
+        created_event=Count('id', filter=created_event),
+        activated=Count('id', filter=activated),
+        paid=Count('id', filter=activated & Q(has_paid=True)),
+    )
+
+
+def refresh_signup_funnel(weeks: int = 12) -> int:
+    """
+    Brings the stored signup cohort funnels up to date.
+
+    Cohorts that signed up within the last FUNNEL_OPEN_COHORT_WEEKS are
+    recomputed on every run, since their users are still converting. A
+    closed cohort is computed one last time and then frozen, so each run
+    only queries the open cohorts and any that are missing.
+
+    Args:
+        weeks: How many weeks before the current one to cover.
+
+    Returns:
+        The number of cohorts computed.
+    """
+    now = timezone.now()
+    today = timezone.localdate()
+    current_week = today - timedelta(days=today.weekday())
+    first_week = current_week - timedelta(weeks=weeks)
+    open_since = current_week - timedelta(weeks=getattr(settings, 'FUNNEL_OPEN_COHORT_WEEKS', 8))
+
+    frozen = set(SignupCohortFunnel.objects.filter(
+        week_start__gte=first_week,
+        is_final=True
+    ).values_list('week_start', flat=True))
+
+    computed = 0
+    week_start = first_week
+    while week_start <= current_week:
+        if week_start not in frozen:
+            SignupCohortFunnel.objects.update_or_create(
+                week_start=week_start,
+                defaults={
+                    **_compute_cohort(week_start),
+                    'is_final': week_start < open_since,
+                    'computed_at': now,
+                }
+            )
+            computed += 1
+        week_start += timedelta(weeks=1)
+
+    return computed
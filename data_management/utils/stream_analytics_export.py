@@ -0,0 +1,185 @@
+import io
+from datetime import datetime, time, timedelta
+import pandas as pd
+from django.db import models
+from django.utils import timezone
+from events.models import Event, Notification
+from payments.models import Payment
+
+# The exportable datasets, filtered by their creation time. Columns holding
+# personal data (contact details, event names and notes) are not exportable.
+EXPORT_DATASETS = {
+    'notifications': (Notification, [
+        'id', 'event_id', 'user_id', 'channel', 'status', 'scheduled_send_time', 'sent_at',
+        'delivered_at', 'failed_at', 'sms_segments', 'step_index', 'generation', 'failure_reason',
+        'message_sid', 'created_at', 'updated_at',
+    ]),
+    'events': (Event, [
+        'id', 'user_id', 'tier_id', 'event_date', 'weeks_in_advance', 'notification_start_date',
+        'is_active', 'acknowledged_at', 'created_at', 'updated_at',
+    ]),
+    'payments': (Payment, [
+        'id', 'user_id', 'price_id', 'event_id', 'amount', 'status', 'created_at', 'updated_at',
+    ]),
+}
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+EXPORT_CHUNK_SIZE = 5000
+
+
+class _StreamBuffer(io.RawIOBase):
+    """
+    A write-only file that hands back what was written since the last drain,
+    so a Parquet file can be streamed one row group at a time.
+    """
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _parquet_schema(model, columns):
+    """
+    Builds the Parquet schema from the model fields, so every row group has the
+    same types even when a column is empty in the first chunk.
+    """
+    import pyarrow as pa
+
+    fields = []
+    for column in columns:
+        field = model._meta.get_field(column[:-3] if column.endswith('_id') and column != 'id' else column)
+        if isinstance(field, (models.ForeignKey, models.AutoField, models.IntegerField)):
+            arrow_type = pa.int64()
+        elif isinstance(field, models.DateTimeField):
+            arrow_type = pa.timestamp('us', tz='UTC')
+        elif isinstance(field, models.DateField):
+            arrow_type = pa.date32()
+        elif isinstance(field, models.BooleanField):
+            arrow_type = pa.bool_()
+        elif isinstance(field, models.DecimalField):
+            arrow_type = pa.decimal128(field.max_digits, field.decimal_places)
+        elif isinstance(field, models.FloatField):
+            arrow_type = pa.float64()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column, arrow_type))
+    return pa.schema(fields)
+
+
+def _iter_chunks(queryset, columns, chunk_size):
+    """
+    Yields the rows in chunks using keyset pagination on the primary key. Each
+    chunk is a separate bounded query, so memory stays constant on every
+    database backend, including MySQL, whose driver buffers whole result sets.
+    """
+    last_pk = None
+    while True:
+        page = queryset.order_by('pk')
+        if last_pk is not None:
+            page = page.filter(pk__gt=last_pk)
+        rows = list(page.values_list('pk', *columns)[:chunk_size])
+        if not rows:
+            return
+        last_pk = rows[-1][0]
+        yield [row[1:] for row in rows]
+        if len(rows) < chunk_size:
+            return
+
+
+def stream_analytics_export(dataset: str, start_date, end_date, columns: list = None, file_format: str = 'csv', chunk_size: int = None, using: str = None):
+    """
+    Exports the rows of a dataset created in a date range as CSV or Parquet.
+
+    The arguments are validated when this function is called. The returned
+    generator then reads and encodes one chunk of rows at a time, so the
+    export can be streamed from a web worker or written to a file without
+    holding the full result set.
+
+    Args:
+        dataset: One of EXPORT_DATASETS.
+        start_date: The first creation date to include.
+        end_date: The last creation date to include.
+        columns: Optional. The columns to export, in order. Defaults to all
+                 exportable columns of the dataset.
+        file_format: 'csv' or 'parquet'. Parquet requires pyarrow.
+        chunk_size: Optional. The number of rows read and encoded at a time.
+                    Defaults to EXPORT_CHUNK_SIZE.
+        using: Optional. The database alias to read from, e.g. the replica.
+               The rows are read after this function returns, so the alias
+               is fixed here rather than by the caller's routing.
+
+    Returns:
+        A generator of bytes.
+
+    Raises:
+        ValueError: If the dataset, a column or the format is not supported,
+                    or the start date is after the end date.
+    """
+    if dataset not in EXPORT_DATASETS:
+        raise ValueError(f"Unknown dataset '{dataset}'. Choose from: {', '.join(EXPORT_DATASETS)}.")
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown format '{file_format}'. Choose from: {', '.join(EXPORT_FORMATS)}.")
+    if start_date > end_date:
+        raise ValueError("The start date must not be after the end date.")
+
+    model, exportable = EXPORT_DATASETS[dataset]
+    columns = columns or exportable
+    unknown = [column for column in columns if column not in exportable]
+    if unknown:
+        raise ValueError(f"Unknown columns for {dataset}: {', '.join(unknown)}.")
+
+    schema = None
+    if file_format == 'parquet':
+        try:
+            schema = _parquet_schema(model, columns)
+        except ImportError:
+            raise ValueError("Parquet export requires the pyarrow package.")
+
+    queryset = model.objects.using(using).filter(
+        created_at__gte=timezone.make_aware(datetime.combine(start_date, time.min)),
+        created_at__lt=timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min))
+    )
+    chunks = _iter_chunks(queryset, columns, chunk_size or EXPORT_CHUNK_SIZE)
+
+    if file_format == 'csv':
+        return _stream_csv(chunks, columns)
+    return _stream_parquet(chunks, columns, schema)
+
+
+def _stream_csv(chunks, columns):
+    yield pd.DataFrame(columns=columns).to_csv(index=False).encode('utf-8')
+    for rows in chunks:
+        yield pd.DataFrame(rows, columns=columns).to_csv(index=False, header=False).encode('utf-8')
+
+
+def _stream_parquet(chunks, columns, schema):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    buffer = _StreamBuffer()
+    with pq.ParquetWriter(buffer, schema) as writer:
+        for rows in chunks:
+            # Object columns keep None as null; the schema sets the final types.
+            frame = pd.DataFrame(rows, columns=columns, dtype=object)
+            writer.write_table(pa.Table.from_pandas(frame, schema=schema, preserve_index=False))
+            yield buffer.drain()
+    yield buffer.drain()
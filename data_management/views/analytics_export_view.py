@@ -0,0 +1,47 @@
+from datetime import date
+from django.http import StreamingHttpResponse
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+from rest_framework import status
+
+from data_management.utils.stream_analytics_export import stream_analytics_export, EXPORT_FORMATS
+from futurereminder.db_router import get_read_database
+
+class AnalyticsExportView(APIView):
+    """
+    Streams the notifications, events or payments created in a date range as
+    CSV or Parquet for offline analysis.
+
+    Query parameters: `dataset`, `start` and `end` (YYYY-MM-DD, inclusive), and
+    optionally `columns` (comma-separated) and `file_format` (csv or parquet).
+    Rows are read from the replica when one is configured.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        dataset = request.query_params.get('dataset', '')
+        file_format = request.query_params.get('file_format', 'csv')
+        columns = [column.strip() for column in request.query_params.get('columns', '').split(',') if column.strip()]
+
+        try:
+            start_date = date.fromisoformat(request.query_params.get('start', ''))
+            end_date = date.fromisoformat(request.query_params.get('end', ''))
+        except ValueError:
+            return Response(
+                {"error": "'start' and 'end' must be dates in YYYY-MM-DD format."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            content = stream_analytics_export(
+                dataset, start_date, end_date, columns=columns, file_format=file_format,
+                using=get_read_database(request.user)
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = StreamingHttpResponse(content, content_type=EXPORT_FORMATS[file_format])
+        filename = f"{dataset}_{start_date.isoformat()}_{end_date.isoformat()}.{file_format}"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
@@ -4,4 +4,7 @@ class AutomatedNotificationHistoryView(BaseAnalyticsView):
     """
     Provides time-series data for automated notifications.
     """
-    CHANNELS = ['primary_email', 'primary_sms', 'backup_email', 'backup_sms', 'emergency_contact_email']
+    CHANNELS = [
+        'primary_email', 'primary_sms', 'backup_email', 'backup_sms', 'emergency_contact_email',
+        'all_backup_emails', 'all_emergency_contact_emails', 'all_emergency_contact_sms',
+    ]
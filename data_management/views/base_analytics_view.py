@@ -2,92 +2,76 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser
 from django.utils import timezone
-from datetime import timedelta
+from datetime import datetime, time, timedelta
 from collections import defaultdict
 from django.db.models.functions import TruncDate
-from django.db.models import Count
+from django.db.models import Count, Max, Min, Q, Sum
 
-from events.models import Notification
+from events.models import Notification, NotificationDailyStats
+from futurereminder.db_router import ReplicaReadMixin
 
-class BaseAnalyticsView(APIView):
+class BaseAnalyticsView(ReplicaReadMixin, APIView):
     """
     Base class for notification analytics views to share common logic.
-    Provides time-series data for scheduled, sent, delivered, and failed notifications.
+    Provides time-series data for scheduled, sent, delivered, and failed notifications,
+    plus the billable SMS segments sent each day. Status counts come from the
+    NotificationDailyStats rollup, so they count every notification that first
+    reached a status that day, even if it has moved on since. A notification
+    is counted once per status, however many times it was retried.
     """
     permission_classes = [IsAdminUser]
 
     # To be defined by subclasses
     CHANNELS = []
 
+    def _day_start(self, day):
+        """Returns the first instant of `day` in the current timezone."""
+        return timezone.make_aware(datetime.combine(day, time.min))
+
     def get(self, request, *args, **kwargs):
         # 1. Determine date range
-        pending_notifications = Notification.objects.filter(
+        pending_range = Notification.objects.filter(
             channel__in=self.CHANNELS,
             status='pending'
-        ).order_by('scheduled_send_time')
-
-        earliest_pending = pending_notifications.first()
-        latest_pending = pending_notifications.last()
+        ).aggregate(earliest=Min('scheduled_send_time'), latest=Max('scheduled_send_time'))
 
         today = timezone.now().date()
         start_date = today - timedelta(days=30) # Default: last 30 days
         end_date = today + timedelta(days=30)   # Default: next 30 days
 
-        if earliest_pending:
-            start_date = earliest_pending.scheduled_send_time.date() - timedelta(days=7)
-        
-        if latest_pending:
-            end_date = latest_pending.scheduled_send_time.date() + timedelta(days=7)
+        if pending_range['earliest']:
+            start_date = timezone.localtime(pending_range['earliest']).date() - timedelta(days=7)
 
-        date_range = [start_date, end_date]
+        if pending_range['latest']:
+            end_date = timezone.localtime(pending_range['latest']).date() + timedelta(days=7)
 
-        # 2. Get counts for each status, grouped by day
+        # 2. Count the notifications due each day. Half-open datetime bounds keep
+        # the filter able to use the scheduled_send_time index.
         scheduled_counts = Notification.objects.filter(
             channel__in=self.CHANNELS,
-            scheduled_send_time__date__range=date_range
-        ).annotate(day=TruncDate('scheduled_send_time')).values('day').annotate(count=Count('id')).order_by('day')
-
-        sent_counts = Notification.objects.filter(
-            channel__in=self.CHANNELS,
-            status='sent',
-            updated_at__date__range=date_range
-        ).annotate(day=TruncDate('updated_at')).values('day').annotate(count=Count('id')).order_by('day')
-        
-        delivered_counts = Notification.objects.filter(
-            channel__in=self.CHANNELS,
-            status='delivered',
-            updated_at__date__range=date_range
-        ).annotate(day=TruncDate('updated_at')).values('day').annotate(count=Count('id')).order_by('day')
+            scheduled_send_time__gte=self._day_start(start_date),
+            scheduled_send_time__lt=self._day_start(end_date + timedelta(days=1))
+        ).annotate(day=TruncDate('scheduled_send_time')).values('day').annotate(count=Count('id')).order_by()
 
-        error_counts = Notification.objects.filter(
+        # 3. Read the status counts from the daily rollup: one row per day, channel
+        # and status, folded into one row per day with conditional sums.
+        status_counts = NotificationDailyStats.objects.filter(
             channel__in=self.CHANNELS,
-            status='failed',
-            updated_at__date__range=date_range
-        ).annotate(day=TruncDate('updated_at')).values('day').annotate(count=Count('id')).order_by('day')
-
-        completed_counts = Notification.objects.filter(
-            channel__in=self.CHANNELS,
-            status='completed',
-            updated_at__date__range=date_range
-        ).annotate(day=TruncDate('updated_at')).values('day').annotate(count=Count('id')).order_by('day')
-        
-        # 3. Combine and format the data
-        chart_data = defaultdict(lambda: {'scheduled': 0, 'sent': 0, 'delivered': 0, 'errors': 0, 'completed': 0})
-
+            day__range=(start_date, end_date)
+        ).values('day').annotate(
+            sent=Sum('count', filter=Q(status='sent')),
+            delivered=Sum('count', filter=Q(status='delivered')),
+            errors=Sum('count', filter=Q(status__in=['failed', 'undeliverable'])),
+            completed=Sum('count', filter=Q(status='completed')),
+            sms_segments=Sum('sms_segments', filter=Q(status='sent')),
+        ).order_by()
+
+        chart_data = defaultdict(dict)
         for item in scheduled_counts:
             chart_data[item['day']]['scheduled'] = item['count']
-        
-        for item in sent_counts:
-            chart_data[item['day']]['sent'] = item['count']
-
-        for item in delivered_counts:
-            chart_data[item['day']]['delivered'] = item['count']
-
-        for item in error_counts:
-            chart_data[item['day']]['errors'] = item['count']
 
-        for item in completed_counts:
-            chart_data[item['day']]['completed'] = item['count']
+        for item in status_counts:
+            chart_data[item['day']].update(item)
 
         # 4. Format for the chart response
         response_data = []
@@ -96,11 +80,12 @@ class BaseAnalyticsView(APIView):
             data_point = chart_data[current_date]
             response_data.append({
                 'date': current_date.strftime('%Y-%m-%d'),
-                'scheduled': data_point['scheduled'],
-                'sent': data_point['sent'],
-                'delivered': data_point['delivered'],
-                'errors': data_point['errors'],
-                'completed': data_point['completed'],
+                'scheduled': data_point.get('scheduled') or 0,
+                'sent': data_point.get('sent') or 0,
+                'delivered': data_point.get('delivered') or 0,
+                'errors': data_point.get('errors') or 0,
+                'completed': data_point.get('completed') or 0,
+                'sms_segments': data_point.get('sms_segments') or 0,
             })
             current_date += timedelta(days=1)
 
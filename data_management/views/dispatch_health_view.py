@@ -0,0 +1,39 @@
+from django.core.cache import cache
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+from rest_framework import status
+
+from data_management.utils.get_dispatch_health import get_dispatch_health
+
+HEALTH_STATUS_CACHE_KEY = 'dispatch_health:status'
+HEALTH_STATUS_CACHE_TIMEOUT = 10
+
+class DispatchHealthView(APIView):
+    """
+    Reports whether reminders are going out on time. Responds with 503 when
+    the status is 'failing', so load balancers and uptime checks can act on
+    it without parsing the body.
+
+    Anonymous callers only get the status, cached for a few seconds so that
+    polling does not run the backlog query on every hit. Admins get the
+    dispatcher's last successful run, the problems found and, per channel,
+    the due backlog and the age of its oldest notification, read fresh.
+    """
+    permission_classes = [AllowAny]
+    # Polled every few seconds by health checks.
+    throttle_classes = []
+
+    def get(self, request, *args, **kwargs):
+        if request.user.is_staff:
+            health = get_dispatch_health()
+            cache.set(HEALTH_STATUS_CACHE_KEY, health['status'], HEALTH_STATUS_CACHE_TIMEOUT)
+        else:
+            health_status = cache.get(HEALTH_STATUS_CACHE_KEY)
+            if health_status is None:
+                health_status = get_dispatch_health()['status']
+                cache.set(HEALTH_STATUS_CACHE_KEY, health_status, HEALTH_STATUS_CACHE_TIMEOUT)
+            health = {'status': health_status}
+
+        http_status = status.HTTP_503_SERVICE_UNAVAILABLE if health['status'] == 'failing' else status.HTTP_200_OK
+        return Response(health, status=http_status)
@@ -5,9 +5,10 @@ from data_management.models import FAQ
 from data_management.serializers.faq_serializer import FaqSerializer
 from django.views.decorators.cache import cache_page
 from django.utils.decorators import method_decorator
+from futurereminder.db_router import ReplicaReadMixin
 
 @method_decorator(cache_page(60 * 60 * 24), name='dispatch') # Apply 24-hour cache
-class FaqListView(ListAPIView):
+class FaqListView(ReplicaReadMixin, ListAPIView):
     # This view should be public and not attempt any authentication.
     # We override the global default by setting authentication_classes to empty.
     authentication_classes = []
@@ -0,0 +1,22 @@
+from django.http import HttpResponse
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAdminUser
+
+from data_management.utils.metrics import update_backlog_metrics
+from data_management.utils.metrics_registry import REGISTRY
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+class MetricsView(APIView):
+    """
+    Exposes the dispatcher, webhook and API metrics of every process in the
+    Prometheus text format. The backlog gauges are read from the database
+    on each scrape.
+    """
+    permission_classes = [IsAdminUser]
+    # Scrapes run every few seconds, far above the user throttle rate.
+    throttle_classes = []
+
+    def get(self, request, *args, **kwargs):
+        update_backlog_metrics()
+        return HttpResponse(REGISTRY.render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,30 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+from rest_framework import status
+
+from events.utils.forecast_notification_volume import forecast_notification_volume
+from futurereminder.db_router import ReplicaReadMixin
+
+MAX_FORECAST_DAYS = 365
+
+class NotificationForecastView(ReplicaReadMixin, APIView):
+    """
+    Forecasts daily and hourly send volume per channel for the next N days,
+    so provider quotas and rate limits can be set ahead of peak weeks.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            days = int(request.query_params.get('days', 30))
+        except ValueError:
+            return Response({"error": "'days' must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not 1 <= days <= MAX_FORECAST_DAYS:
+            return Response(
+                {"error": f"'days' must be between 1 and {MAX_FORECAST_DAYS}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(forecast_notification_volume(days=days))
@@ -0,0 +1,51 @@
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+from rest_framework import status
+
+from data_management.models import SignupCohortFunnel
+from data_management.utils.refresh_signup_funnel import FUNNEL_STEPS
+from futurereminder.db_router import ReplicaReadMixin
+
+MAX_FUNNEL_WEEKS = 104
+
+class SignupFunnelView(ReplicaReadMixin, APIView):
+    """
+    Provides the conversion funnel (signup -> verified -> event -> activated -> paid)
+    of each weekly signup cohort over the last `?weeks=` weeks (default 12), with
+    each step's conversion rate from signup. Cohorts are read from the stored
+    funnels, which the `refresh_signup_funnel` command keeps up to date.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            weeks = int(request.query_params.get('weeks', 12))
+        except ValueError:
+            return Response({"error": "'weeks' must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not 1 <= weeks <= MAX_FUNNEL_WEEKS:
+            return Response(
+                {"error": f"'weeks' must be between 1 and {MAX_FUNNEL_WEEKS}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        today = timezone.localdate()
+        first_week = today - timedelta(days=today.weekday(), weeks=weeks)
+
+        response_data = []
+        for cohort in SignupCohortFunnel.objects.filter(week_start__gte=first_week):
+            steps = {step: getattr(cohort, step) for step in FUNNEL_STEPS}
+            response_data.append({
+                'week_start': cohort.week_start.strftime('%Y-%m-%d'),
+                **steps,
+                'rates': {
+                    step: round(count / cohort.signups, 4) if cohort.signups else 0.0
+                    for step, count in steps.items() if step != 'signups'
+                },
+                'is_final': cohort.is_final,
+            })
+
+        return Response(response_data)
@@ -1,6 +1,29 @@
 from django.contrib import admin
-from .models import Event, Notification
+from .models import Event, Notification, NotificationDelivery, NotificationStatusEvent
 
-admin.site.register(Event)
-admin.site.register(Notification)
+class NotificationDeliveryInline(admin.TabularInline):
+    """
+    Shows the per-recipient results of fan-out notifications.
+    """
+    model = NotificationDelivery
+    extra = 0
+    readonly_fields = ('recipient', 'status', 'message_sid', 'failure_reason', 'created_at', 'updated_at')
+
+class NotificationStatusEventInline(admin.TabularInline):
+    """
+    Shows the append-only status history of a notification.
+    """
+    model = NotificationStatusEvent
+    extra = 0
+    can_delete = False
+    readonly_fields = ('from_status', 'to_status', 'occurred_at')
+    fields = readonly_fields
 
+class NotificationAdmin(admin.ModelAdmin):
+    """
+    Notification admin configuration that includes fan-out deliveries and the status history.
+    """
+    inlines = (NotificationDeliveryInline, NotificationStatusEventInline)
+
+admin.site.register(Event)
+admin.site.register(Notification, NotificationAdmin)
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_alter_notification_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='generation',
+            field=models.PositiveIntegerField(default=0, help_text='Fingerprint of the schedule inputs (tier, manifest, dates) this notification was generated from.'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='step_index',
+            field=models.PositiveIntegerField(blank=True, help_text="The position of this notification in its event's schedule. Null for notifications created outside the scheduler.", null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(fields=('event', 'step_index', 'generation'), name='unique_notification_step_per_generation'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0011_notification_step_index_generation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='source_notification',
+            field=models.ForeignKey(blank=True, help_text="For admin tasks, the 'social_media' notification this task was generated from.", null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='admin_tasks', to='events.notification'),
+        ),
+    ]
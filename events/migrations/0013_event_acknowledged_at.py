@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0012_event_source_notification'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='acknowledged_at',
+            field=models.DateTimeField(blank=True, help_text='When the user acknowledged a reminder. Acknowledged events receive no further notifications.', null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0013_event_acknowledged_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='message_sid',
+            field=models.CharField(blank=True, db_index=True, help_text='The identifier for the message from the provider (e.g., Twilio SID). Shared by all notifications merged into one digest.', max_length=255, null=True),
+        ),
+    ]
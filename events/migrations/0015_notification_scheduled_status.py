@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0014_notification_shared_message_sid'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('scheduled', 'Scheduled With Provider'), ('sent', 'Sent'), ('failed', 'Failed'), ('delivered', 'Delivered'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('admin_task_created', 'Admin Task Created')], db_index=True, default='pending', max_length=20),
+        ),
+    ]
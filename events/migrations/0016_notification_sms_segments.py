@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0015_notification_scheduled_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='sms_segments',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Billable SMS segments of the message sent for this notification. For a digest, the whole count is on its first notification.', null=True),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0016_notification_sms_segments'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='channel',
+            field=models.CharField(choices=[('primary_email', 'Primary Email'), ('primary_sms', 'Primary SMS'), ('backup_email', 'Backup Email'), ('backup_sms', 'Backup SMS'), ('social_media', 'Social Media Outreach Task'), ('emergency_contact_email', 'Emergency Contact Email'), ('all_backup_emails', 'All Backup Emails'), ('all_emergency_contact_emails', 'All Emergency Contact Emails'), ('all_emergency_contact_sms', 'All Emergency Contact SMS')], max_length=30),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='recipient_contact_info',
+            field=models.CharField(blank=True, help_text='The contact info used for sending. Populated after the notification is sent. Fan-out channels record their recipients in `deliveries` instead.', max_length=255, null=True),
+        ),
+        migrations.CreateModel(
+            name='NotificationDelivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('recipient', models.CharField(help_text='The email address or phone number this delivery was sent to.', max_length=255)),
+                ('status', models.CharField(choices=[('sent', 'Sent'), ('delivered', 'Delivered'), ('failed', 'Failed')], db_index=True, max_length=20)),
+                ('message_sid', models.CharField(blank=True, db_index=True, help_text="The provider's message ID. A Mailgun batch shares one ID across its recipients.", max_length=255, null=True)),
+                ('failure_reason', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('notification', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deliveries', to='events.notification')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('notification', 'recipient'), name='unique_delivery_per_recipient')],
+            },
+        ),
+    ]
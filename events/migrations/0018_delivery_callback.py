@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0017_notification_delivery'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeliveryCallback',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.CharField(choices=[('mailgun', 'Mailgun'), ('twilio', 'Twilio')], max_length=20)),
+                ('message_sid', models.CharField(help_text="The provider's message ID, matching Notification.message_sid.", max_length=255)),
+                ('recipient', models.CharField(blank=True, help_text='The recipient reported by the provider. Used to match fan-out deliveries that share a message ID.', max_length=255, null=True)),
+                ('raw_status', models.CharField(help_text='The event or status name as sent by the provider.', max_length=50)),
+                ('status', models.CharField(blank=True, choices=[('delivered', 'Delivered'), ('failed', 'Failed')], help_text='The terminal status this callback maps to, or null if it is only informational.', max_length=20, null=True)),
+                ('failure_reason', models.TextField(blank=True, null=True)),
+                ('received_at', models.DateTimeField(auto_now_add=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['processed_at', 'id'], name='events_deli_process_0ca214_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_timing_columns(apps, schema_editor):
+    """
+    Existing rows only have updated_at, which is the best available estimate
+    of when they reached their current status.
+    """
+    Notification = apps.get_model('events', 'Notification')
+    Notification.objects.filter(status='sent').update(sent_at=F('updated_at'))
+    Notification.objects.filter(status='delivered').update(delivered_at=F('updated_at'))
+    Notification.objects.filter(status='failed').update(failed_at=F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0018_delivery_callback'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationStatusEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('channel', models.CharField(choices=[('primary_email', 'Primary Email'), ('primary_sms', 'Primary SMS'), ('backup_email', 'Backup Email'), ('backup_sms', 'Backup SMS'), ('social_media', 'Social Media Outreach Task'), ('emergency_contact_email', 'Emergency Contact Email'), ('all_backup_emails', 'All Backup Emails'), ('all_emergency_contact_emails', 'All Emergency Contact Emails'), ('all_emergency_contact_sms', 'All Emergency Contact SMS')], help_text="The notification's channel, copied so time-window analytics do not need to join the notification table.", max_length=30)),
+                ('from_status', models.CharField(choices=[('pending', 'Pending'), ('scheduled', 'Scheduled With Provider'), ('sent', 'Sent'), ('failed', 'Failed'), ('delivered', 'Delivered'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('admin_task_created', 'Admin Task Created')], max_length=20)),
+                ('to_status', models.CharField(choices=[('pending', 'Pending'), ('scheduled', 'Scheduled With Provider'), ('sent', 'Sent'), ('failed', 'Failed'), ('delivered', 'Delivered'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('admin_task_created', 'Admin Task Created')], max_length=20)),
+                ('occurred_at', models.DateTimeField(help_text="When the transition happened, e.g. the provider's delivery time.")),
+            ],
+            options={
+                'ordering': ['occurred_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='delivered_at',
+            field=models.DateTimeField(blank=True, help_text='When the provider reported the message as delivered.', null=True),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='failed_at',
+            field=models.DateTimeField(blank=True, help_text='When the notification last failed.', null=True),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='sent_at',
+            field=models.DateTimeField(blank=True, help_text='When the message was last handed to the provider for immediate or scheduled delivery.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['sent_at', 'channel'], name='events_noti_sent_at_597ff3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['delivered_at', 'channel'], name='events_noti_deliver_fb5871_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['failed_at', 'channel'], name='events_noti_failed__48a19e_idx'),
+        ),
+        migrations.AddField(
+            model_name='notificationstatusevent',
+            name='notification',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='events.notification'),
+        ),
+        migrations.AddIndex(
+            model_name='notificationstatusevent',
+            index=models.Index(fields=['to_status', 'occurred_at'], name='events_noti_to_stat_745c7d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notificationstatusevent',
+            index=models.Index(fields=['channel', 'to_status', 'occurred_at'], name='events_noti_channel_bc8823_idx'),
+        ),
+        migrations.RunPython(backfill_timing_columns, migrations.RunPython.noop),
+    ]
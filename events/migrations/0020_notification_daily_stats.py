@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:01
+
+from django.db import migrations, models
+
+
+def seed_status_events(apps, schema_editor):
+    """
+    Notifications handled before the status log existed only have their timing
+    columns. Each one is recorded as a transition from 'pending', so the
+    rollup can be rebuilt from the log for their days too.
+    """
+    Notification = apps.get_model('events', 'Notification')
+    NotificationStatusEvent = apps.get_model('events', 'NotificationStatusEvent')
+
+    unlogged = Notification.objects.filter(status_events__isnull=True).values(
+        'pk', 'channel', 'sent_at', 'delivered_at', 'failed_at'
+    )
+    status_events = []
+    for notification in unlogged.iterator():
+        for status in ('sent', 'delivered', 'failed'):
+            if notification[f'{status}_at']:
+                status_events.append(NotificationStatusEvent(
+                    notification_id=notification['pk'],
+                    channel=notification['channel'],
+                    from_status='pending',
+                    to_status=status,
+                    occurred_at=notification[f'{status}_at']
+                ))
+    NotificationStatusEvent.objects.bulk_create(status_events, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0019_notification_timing_status_events'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('channel', models.CharField(choices=[('primary_email', 'Primary Email'), ('primary_sms', 'Primary SMS'), ('backup_email', 'Backup Email'), ('backup_sms', 'Backup SMS'), ('social_media', 'Social Media Outreach Task'), ('emergency_contact_email', 'Emergency Contact Email'), ('all_backup_emails', 'All Backup Emails'), ('all_emergency_contact_emails', 'All Emergency Contact Emails'), ('all_emergency_contact_sms', 'All Emergency Contact SMS')], max_length=30)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('scheduled', 'Scheduled With Provider'), ('sent', 'Sent'), ('failed', 'Failed'), ('delivered', 'Delivered'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('admin_task_created', 'Admin Task Created')], max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('sms_segments', models.PositiveIntegerField(default=0, help_text="Billable SMS segments of the notifications counted, for the 'sent' status.")),
+                ('latency_count', models.PositiveIntegerField(default=0, help_text='How many of the counted notifications contributed to latency_seconds_total.')),
+                ('latency_seconds_total', models.FloatField(default=0, help_text="Summed seconds from the scheduled send time to 'sent', or from 'sent' to 'delivered'.")),
+            ],
+            options={
+                'verbose_name_plural': 'notification daily stats',
+                'constraints': [models.UniqueConstraint(fields=('day', 'channel', 'status'), name='unique_daily_stats_per_channel_status')],
+            },
+        ),
+        migrations.RunPython(seed_status_events, migrations.RunPython.noop),
+    ]
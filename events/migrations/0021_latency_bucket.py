@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0020_notification_daily_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LatencyBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(help_text='The start of the hour the latencies were observed in.')),
+                ('metric', models.CharField(choices=[('provider_call', 'Provider Call Duration'), ('delivery', 'Sent To Delivered')], max_length=20)),
+                ('channel', models.CharField(choices=[('primary_email', 'Primary Email'), ('primary_sms', 'Primary SMS'), ('backup_email', 'Backup Email'), ('backup_sms', 'Backup SMS'), ('social_media', 'Social Media Outreach Task'), ('emergency_contact_email', 'Emergency Contact Email'), ('all_backup_emails', 'All Backup Emails'), ('all_emergency_contact_emails', 'All Emergency Contact Emails'), ('all_emergency_contact_sms', 'All Emergency Contact SMS')], max_length=30)),
+                ('provider', models.CharField(choices=[('mailgun', 'Mailgun'), ('twilio', 'Twilio')], max_length=20)),
+                ('bucket', models.PositiveSmallIntegerField(help_text='The logarithmic bucket index.')),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('hour', 'metric', 'channel', 'provider', 'bucket'), name='unique_latency_bucket')],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:19
+
+from django.db import migrations, models
+
+
+def mark_callback_failures_undeliverable(apps, schema_editor):
+    """
+    Rows a provider callback moved from 'sent' or 'scheduled' to 'failed'
+    were retried by the dispatcher on every run. They become 'undeliverable'.
+    """
+    Notification = apps.get_model('events', 'Notification')
+    NotificationStatusEvent = apps.get_model('events', 'NotificationStatusEvent')
+    callback_failures = NotificationStatusEvent.objects.filter(
+        from_status__in=['sent', 'scheduled'], to_status='failed'
+    ).values('notification_id')
+    Notification.objects.filter(status='failed', pk__in=callback_failures).update(status='undeliverable')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0022_notificationdelivery_skipped_status'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('scheduled', 'Scheduled With Provider'), ('sent', 'Sent'), ('failed', 'Failed'), ('undeliverable', 'Undeliverable'), ('delivered', 'Delivered'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('admin_task_created', 'Admin Task Created')], db_index=True, default='pending', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='notificationdailystats',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('scheduled', 'Scheduled With Provider'), ('sent', 'Sent'), ('failed', 'Failed'), ('undeliverable', 'Undeliverable'), ('delivered', 'Delivered'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('admin_task_created', 'Admin Task Created')], max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='notificationdelivery',
+            name='status',
+            field=models.CharField(choices=[('sent', 'Sent'), ('delivered', 'Delivered'), ('failed', 'Failed'), ('undeliverable', 'Undeliverable'), ('skipped', 'Skipped')], db_index=True, max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='notificationstatusevent',
+            name='from_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('scheduled', 'Scheduled With Provider'), ('sent', 'Sent'), ('failed', 'Failed'), ('undeliverable', 'Undeliverable'), ('delivered', 'Delivered'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('admin_task_created', 'Admin Task Created')], max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='notificationstatusevent',
+            name='to_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('scheduled', 'Scheduled With Provider'), ('sent', 'Sent'), ('failed', 'Failed'), ('undeliverable', 'Undeliverable'), ('delivered', 'Delivered'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('admin_task_created', 'Admin Task Created')], max_length=20),
+        ),
+        migrations.RunPython(mark_callback_failures_undeliverable, migrations.RunPython.noop),
+    ]
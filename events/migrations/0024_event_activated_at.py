@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:28
+
+from django.db import migrations, models
+from django.db.models import F, Min, OuterRef, Subquery
+
+
+def backfill_activated_at(apps, schema_editor):
+    """
+    Events paid for were activated when their first payment succeeded. Other
+    active events were activated some time before their last update, the best
+    available estimate.
+    """
+    Event = apps.get_model('events', 'Event')
+    Payment = apps.get_model('payments', 'Payment')
+    first_payment = Payment.objects.filter(event=OuterRef('pk'), status='succeeded').values('event').annotate(
+        first=Min('created_at')
+    ).values('first')[:1]
+    paid_events = Payment.objects.filter(status='succeeded', event__isnull=False).values('event')
+    Event.objects.filter(pk__in=paid_events).update(activated_at=Subquery(first_payment))
+    Event.objects.filter(is_active=True, activated_at__isnull=True).update(activated_at=F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0023_notification_undeliverable_status'),
+        ('payments', '0005_tier_compiled_schedule'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='activated_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='When the event was first activated. Kept if the event is later deactivated.', null=True),
+        ),
+        migrations.RunPython(backfill_activated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:49
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_acknowledged_generation(apps, schema_editor):
+    """
+    Events acknowledged so far were acknowledged for the generation of their
+    latest scheduled step.
+    """
+    Event = apps.get_model('events', 'Event')
+    Notification = apps.get_model('events', 'Notification')
+    latest_generation = Notification.objects.filter(
+        event=OuterRef('pk'), step_index__isnull=False
+    ).order_by('-id').values('generation')[:1]
+    Event.objects.filter(acknowledged_at__isnull=False).update(acknowledged_generation=Subquery(latest_generation))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0024_event_activated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='acknowledged_generation',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='The schedule generation that was acknowledged. A new generation clears the acknowledgement.', null=True),
+        ),
+        migrations.RunPython(backfill_acknowledged_generation, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0025_event_acknowledged_generation'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='deliverycallback',
+            index=models.Index(fields=['message_sid', 'processed_at'], name='events_deli_message_236c30_idx'),
+        ),
+    ]
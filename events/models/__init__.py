@@ -1,2 +1,7 @@
 from .event import Event
 from .notification import Notification
+from .notification_delivery import NotificationDelivery
+from .delivery_callback import DeliveryCallback
+from .notification_status_event import NotificationStatusEvent
+from .notification_daily_stats import NotificationDailyStats
+from .latency_bucket import LatencyBucket
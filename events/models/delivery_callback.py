@@ -0,0 +1,50 @@
+from django.db import models
+
+class DeliveryCallback(models.Model):
+    """
+    A delivery status callback received from a provider webhook, staged for
+    processing. Webhooks only append rows here so they can respond quickly;
+    the `apply_delivery_callbacks` command applies them to notifications in batches.
+    """
+
+    PROVIDER_CHOICES = [
+        ('mailgun', 'Mailgun'),
+        ('twilio', 'Twilio'),
+    ]
+
+    STATUS_CHOICES = [
+        ('delivered', 'Delivered'),
+        ('failed', 'Failed'),
+    ]
+
+    provider = models.CharField(max_length=20, choices=PROVIDER_CHOICES)
+    message_sid = models.CharField(max_length=255, help_text="The provider's message ID, matching Notification.message_sid.")
+    recipient = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        help_text="The recipient reported by the provider. Used to match fan-out deliveries that share a message ID."
+    )
+    raw_status = models.CharField(max_length=50, help_text="The event or status name as sent by the provider.")
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        null=True,
+        blank=True,
+        help_text="The terminal status this callback maps to, or null if it is only informational."
+    )
+    failure_reason = models.TextField(null=True, blank=True)
+
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.get_provider_display()} callback for {self.message_sid}: {self.raw_status}"
+
+    class Meta:
+        indexes = [
+            # The consumer reads unprocessed callbacks in arrival order.
+            models.Index(fields=['processed_at', 'id']),
+            # Matches a batch's callbacks to the other callbacks of the same message.
+            models.Index(fields=['message_sid', 'processed_at']),
+        ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 from datetime import timedelta
 from django.core.exceptions import ValidationError
 
@@ -46,10 +47,35 @@ class Event(models.Model):
         null=True, # Will be set during creation
         blank=True,
     )
+    source_notification = models.ForeignKey(
+        'events.Notification',
+        on_delete=models.SET_NULL,
+        related_name="admin_tasks",
+        null=True,
+        blank=True,
+        help_text="For admin tasks, the 'social_media' notification this task was generated from."
+    )
     is_active = models.BooleanField(
         default=False,
         help_text="Whether the event is active and notifications should be sent. Activated upon successful payment."
     )
+    activated_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="When the event was first activated. Kept if the event is later deactivated."
+    )
+    acknowledged_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the user acknowledged a reminder. Acknowledged events receive no further notifications."
+    )
+    acknowledged_generation = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="The schedule generation that was acknowledged. A new generation clears the acknowledgement."
+    )
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
@@ -65,6 +91,9 @@ class Event(models.Model):
         # Auto-calculate the notification start date before saving
         if self.event_date and self.weeks_in_advance is not None:
             self.notification_start_date = self.event_date - timedelta(weeks=self.weeks_in_advance)
+
+        if self.is_active and self.activated_at is None:
+            self.activated_at = timezone.now()
         
         # Only run this validation on updates, not on creation, to avoid a ValueError
         # when accessing a reverse relationship before the object has a PK.
@@ -90,5 +119,14 @@ class Event(models.Model):
         # based on the event's current state (tier, dates, active status).
         schedule_notifications_for_event(self)
 
+    def delete(self, *args, **kwargs):
+        # Local import to prevent circular dependency
+        from ..utils.cancel_scheduled_notifications import cancel_scheduled_notifications
+
+        # SMS pre-submitted to Twilio would still be delivered once the
+        # notifications are deleted, so they are cancelled at the provider first.
+        cancel_scheduled_notifications(self.notifications.all())
+        return super().delete(*args, **kwargs)
+
     class Meta:
         ordering = ['-event_date']
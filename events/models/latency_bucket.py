@@ -0,0 +1,39 @@
+from django.db import models
+from .notification import Notification
+
+class LatencyBucket(models.Model):
+    """
+    One bucket of an hourly latency histogram. Latencies are counted into
+    logarithmic buckets (see `record_latencies`), so an hour of a series is at
+    most a few dozen rows however many messages were sent, and percentiles can
+    be read back with a bounded relative error.
+    """
+
+    METRIC_CHOICES = [
+        ('provider_call', 'Provider Call Duration'),
+        ('delivery', 'Sent To Delivered'),
+    ]
+
+    PROVIDER_CHOICES = [
+        ('mailgun', 'Mailgun'),
+        ('twilio', 'Twilio'),
+    ]
+
+    hour = models.DateTimeField(help_text="The start of the hour the latencies were observed in.")
+    metric = models.CharField(max_length=20, choices=METRIC_CHOICES)
+    channel = models.CharField(max_length=30, choices=Notification.CHANNEL_CHOICES)
+    provider = models.CharField(max_length=20, choices=PROVIDER_CHOICES)
+    bucket = models.PositiveSmallIntegerField(help_text="The logarithmic bucket index.")
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.metric} {self.channel} {self.hour} bucket {self.bucket}: {self.count}"
+
+    class Meta:
+        constraints = [
+            # Also serves the time-window reads of the percentile endpoint.
+            models.UniqueConstraint(
+                fields=['hour', 'metric', 'channel', 'provider', 'bucket'],
+                name='unique_latency_bucket'
+            ),
+        ]
@@ -14,18 +14,41 @@ class Notification(models.Model):
         ('backup_sms', 'Backup SMS'),
         ('social_media', 'Social Media Outreach Task'),
         ('emergency_contact_email', 'Emergency Contact Email'),
+        ('all_backup_emails', 'All Backup Emails'),
+        ('all_emergency_contact_emails', 'All Emergency Contact Emails'),
+        ('all_emergency_contact_sms', 'All Emergency Contact SMS'),
     ]
 
     STATUS_CHOICES = [
         ('pending', 'Pending'),
+        ('scheduled', 'Scheduled With Provider'),
         ('sent', 'Sent'),
         ('failed', 'Failed'),
+        ('undeliverable', 'Undeliverable'),
         ('delivered', 'Delivered'),
         ('completed', 'Completed'),
         ('cancelled', 'Cancelled'),
         ('admin_task_created', 'Admin Task Created'),
     ]
 
+    # The statuses each status may move to. Every status change is applied by
+    # transition_notifications as a conditional UPDATE, so a concurrent writer
+    # can never revert a later state (e.g. a retry overwriting 'delivered').
+    # 'failed' is a send that did not reach the provider and is retried by the
+    # dispatcher; 'undeliverable' is a message the provider accepted but later
+    # reported as bounced or undelivered, which a retry would not fix.
+    STATUS_TRANSITIONS = {
+        'pending': ['scheduled', 'sent', 'failed', 'cancelled', 'admin_task_created'],
+        'failed': ['scheduled', 'sent', 'failed', 'cancelled'],
+        'scheduled': ['pending', 'sent', 'delivered', 'undeliverable', 'cancelled'],
+        'sent': ['delivered', 'undeliverable', 'completed'],
+        'delivered': ['completed'],
+        'undeliverable': [],
+        'completed': [],
+        'cancelled': [],
+        'admin_task_created': [],
+    }
+
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='notifications')
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='notifications')
     scheduled_send_time = models.DateTimeField(db_index=True)
@@ -34,7 +57,7 @@ class Notification(models.Model):
     
     recipient_contact_info = models.CharField(
         max_length=255,
-        help_text="The contact info used for sending. Populated after the notification is sent.",
+        help_text="The contact info used for sending. Populated after the notification is sent. Fan-out channels record their recipients in `deliveries` instead.",
         null=True,
         blank=True
     )
@@ -43,9 +66,8 @@ class Notification(models.Model):
         max_length=255, 
         null=True, 
         blank=True, 
-        unique=True, 
         db_index=True,
-        help_text="The unique identifier for the message from the provider (e.g., Twilio SID)."
+        help_text="The identifier for the message from the provider (e.g., Twilio SID). Shared by all notifications merged into one digest."
     )
 
     failure_reason = models.TextField(
@@ -54,38 +76,49 @@ class Notification(models.Model):
         help_text="Reason for failure, captured from provider or sending exception."
     )
 
+    sms_segments = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text="Billable SMS segments of the message sent for this notification. For a digest, the whole count is on its first notification."
+    )
+
+    step_index = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="The position of this notification in its event's schedule. Null for notifications created outside the scheduler."
+    )
+    generation = models.PositiveIntegerField(
+        default=0,
+        help_text="Fingerprint of the schedule inputs (tier, manifest, dates) this notification was generated from."
+    )
+
+    # Set by transition_notifications whenever the status moves to the matching
+    # value. Unlike updated_at, they are not touched by unrelated writes.
+    sent_at = models.DateTimeField(null=True, blank=True, help_text="When the message was last handed to the provider for immediate or scheduled delivery.")
+    delivered_at = models.DateTimeField(null=True, blank=True, help_text="When the provider reported the message as delivered.")
+    failed_at = models.DateTimeField(null=True, blank=True, help_text="When the notification last failed.")
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Notification for {self.event.name} to {self.user.email} via {self.get_channel_display()} on {self.scheduled_send_time}"
 
-    def save(self, *args, **kwargs):
-        # --- Handle Social Media Task Creation ---
-        # On the first save of a 'social_media' notification, intercept it,
-        # create the admin tasks, and update the status.
-        if self._state.adding and self.channel == 'social_media':
-            # Local import to prevent circular dependency
-            from ..utils.create_admin_tasks_for_notification import create_admin_tasks_for_notification
-            
-            try:
-                tasks_created = create_admin_tasks_for_notification(self)
-                if tasks_created > 0:
-                    self.status = 'admin_task_created'
-                    self.failure_reason = f"Successfully generated {tasks_created} admin task(s)."
-                else:
-                    self.status = 'failed'
-                    self.failure_reason = "User has no social media handles specified."
-            except Exception as e:
-                # Catch exceptions from the utility (e.g., Admin user not found)
-                self.status = 'failed'
-                self.failure_reason = f"Failed to create admin tasks: {e}"
-
-        super().save(*args, **kwargs)
-
     class Meta:
         ordering = ['scheduled_send_time']
         indexes = [
             models.Index(fields=['status', 'scheduled_send_time']),
             models.Index(fields=['message_sid']),
+            # Time-window analytics filter on one of the timing columns per status.
+            models.Index(fields=['sent_at', 'channel']),
+            models.Index(fields=['delivered_at', 'channel']),
+            models.Index(fields=['failed_at', 'channel']),
+        ]
+        constraints = [
+            # A schedule step can only exist once per generation, so concurrent
+            # rescheduling of the same event can never duplicate a send.
+            models.UniqueConstraint(
+                fields=['event', 'step_index', 'generation'],
+                name='unique_notification_step_per_generation'
+            ),
         ]
\ No newline at end of file
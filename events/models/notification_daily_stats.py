@@ -0,0 +1,40 @@
+from django.db import models
+from .notification import Notification
+
+class NotificationDailyStats(models.Model):
+    """
+    The number of notifications of a channel that first reached a status on a
+    day. A notification is counted once per status, so retries that fail
+    again do not add to the 'failed' count.
+    Kept up to date incrementally by `transition_notifications`, so analytics
+    read one row per day, channel and status instead of every notification.
+    The `rebuild_notification_daily_stats` command recomputes any date range
+    from the NotificationStatusEvent log.
+    """
+
+    day = models.DateField()
+    channel = models.CharField(max_length=30, choices=Notification.CHANNEL_CHOICES)
+    status = models.CharField(max_length=20, choices=Notification.STATUS_CHOICES)
+    count = models.PositiveIntegerField(default=0)
+    sms_segments = models.PositiveIntegerField(
+        default=0,
+        help_text="Billable SMS segments of the notifications counted, for the 'sent' status."
+    )
+    latency_count = models.PositiveIntegerField(
+        default=0,
+        help_text="How many of the counted notifications contributed to latency_seconds_total."
+    )
+    latency_seconds_total = models.FloatField(
+        default=0,
+        help_text="Summed seconds from the scheduled send time to 'sent', or from 'sent' to 'delivered'."
+    )
+
+    def __str__(self):
+        return f"{self.day} {self.channel} {self.status}: {self.count}"
+
+    class Meta:
+        verbose_name_plural = 'notification daily stats'
+        constraints = [
+            # Also serves the day-range reads of the analytics views.
+            models.UniqueConstraint(fields=['day', 'channel', 'status'], name='unique_daily_stats_per_channel_status'),
+        ]
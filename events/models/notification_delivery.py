@@ -0,0 +1,43 @@
+from django.db import models
+from .notification import Notification
+
+class NotificationDelivery(models.Model):
+    """
+    Records the result of a fan-out notification for one of its recipients.
+    Fan-out channels send a single schedule step to every configured contact,
+    e.g. all of a user's emergency contacts.
+    """
+
+    STATUS_CHOICES = [
+        ('sent', 'Sent'),
+        ('delivered', 'Delivered'),
+        ('failed', 'Failed'),
+        ('undeliverable', 'Undeliverable'),
+        ('skipped', 'Skipped'),
+    ]
+
+    notification = models.ForeignKey(Notification, on_delete=models.CASCADE, related_name='deliveries')
+    recipient = models.CharField(
+        max_length=255,
+        help_text="The email address or phone number this delivery was sent to."
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, db_index=True)
+    message_sid = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="The provider's message ID. A Mailgun batch shares one ID across its recipients."
+    )
+    failure_reason = models.TextField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Delivery of notification {self.notification_id} to {self.recipient}: {self.status}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['notification', 'recipient'], name='unique_delivery_per_recipient'),
+        ]
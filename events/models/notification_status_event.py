@@ -0,0 +1,29 @@
+from django.db import models
+from .notification import Notification
+
+class NotificationStatusEvent(models.Model):
+    """
+    An append-only record of a notification moving from one status to another.
+    Rows are only ever inserted, in batches, by `transition_notifications`, so
+    the history survives later changes to the notification itself.
+    """
+
+    notification = models.ForeignKey(Notification, on_delete=models.CASCADE, related_name='status_events')
+    channel = models.CharField(
+        max_length=30,
+        choices=Notification.CHANNEL_CHOICES,
+        help_text="The notification's channel, copied so time-window analytics do not need to join the notification table."
+    )
+    from_status = models.CharField(max_length=20, choices=Notification.STATUS_CHOICES)
+    to_status = models.CharField(max_length=20, choices=Notification.STATUS_CHOICES)
+    occurred_at = models.DateTimeField(help_text="When the transition happened, e.g. the provider's delivery time.")
+
+    def __str__(self):
+        return f"Notification {self.notification_id}: {self.from_status} -> {self.to_status} at {self.occurred_at}"
+
+    class Meta:
+        ordering = ['occurred_at']
+        indexes = [
+            models.Index(fields=['to_status', 'occurred_at']),
+            models.Index(fields=['channel', 'to_status', 'occurred_at']),
+        ]
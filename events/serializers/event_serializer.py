@@ -21,6 +21,7 @@ class EventSerializer(serializers.ModelSerializer):
             'weeks_in_advance',
             'user',
             'is_active',
+            'acknowledged_at',
             'created_at',
             'updated_at',
             'payment_details',
@@ -28,7 +29,7 @@ class EventSerializer(serializers.ModelSerializer):
         ]
         # The user should not be able to update these fields directly
         # 'user' is set automatically, and 'is_active' is controlled by payment status.
-        read_only_fields = ['user', 'is_active', 'created_at', 'updated_at', 'tier']
+        read_only_fields = ['user', 'is_active', 'acknowledged_at', 'created_at', 'updated_at', 'tier']
 
     def get_payment_details(self, obj):
         """
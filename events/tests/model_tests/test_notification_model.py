@@ -37,10 +37,10 @@ def user_with_socials():
         snapchat_handle=None
     )
 
-def test_social_media_notification_creates_admin_tasks_on_save(admin_user, admin_task_tier, user_with_socials):
+def test_social_media_notification_defers_admin_tasks_on_save(admin_user, admin_task_tier, user_with_socials):
     """
-    Tests that saving a 'social_media' notification correctly triggers the creation
-    of admin tasks and updates the notification's status.
+    Tests that saving a 'social_media' notification no longer creates admin tasks
+    inline. It stays pending for the dispatcher's batched admin task job.
     """
     # Arrange
     event = EventFactory(user=user_with_socials)
@@ -54,15 +54,9 @@ def test_social_media_notification_creates_admin_tasks_on_save(admin_user, admin
     )
 
     # Assert
-    # Refetch from DB to ensure we have the version with the updated status
-    notification.refresh_from_db() 
-    
-    assert notification.status == 'admin_task_created'
-    assert "Successfully generated 2 admin task(s)" in notification.failure_reason
-    
-    admin_events = Event.objects.filter(user=admin_user)
-    assert admin_events.count() == 2
-    assert admin_events.first().tier == admin_task_tier
+    notification.refresh_from_db()
+    assert notification.status == 'pending'
+    assert not Event.objects.filter(user=admin_user).exists()
 
 def test_non_social_media_notification_does_not_create_tasks(admin_user, admin_task_tier, user_with_socials):
     """
@@ -83,24 +77,3 @@ def test_non_social_media_notification_does_not_create_tasks(admin_user, admin_t
     # Assert
     assert notification.status == 'pending' # Should remain the default
     assert not Event.objects.filter(user=admin_user).exists()
-
-def test_failed_admin_task_creation_updates_status(user_with_socials):
-    """
-    Tests that if the admin task creation fails (e.g., admin user doesn't exist),
-    the notification status is set to 'failed'.
-    """
-    # Arrange - an admin user and tier are NOT created for this test
-    event = EventFactory(user=user_with_socials)
-
-    # Act
-    notification = Notification.objects.create(
-        event=event,
-        user=user_with_socials,
-        channel='social_media',
-        scheduled_send_time=timezone.now() + timezone.timedelta(days=10)
-    )
-
-    # Assert
-    notification.refresh_from_db()
-    assert notification.status == 'failed'
-    assert "Failed to create admin tasks" in notification.failure_reason
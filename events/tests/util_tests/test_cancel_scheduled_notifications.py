@@ -0,0 +1,121 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from events.models import Notification, NotificationDelivery
+from events.tests.factories.event_factory import EventFactory
+from events.utils.cancel_scheduled_notifications import cancel_scheduled_notifications
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def mock_twilio(mocker):
+    return mocker.patch('events.utils.cancel_scheduled_notifications.get_twilio_client').return_value
+
+def _scheduled(event, channel, sid):
+    return Notification.objects.create(
+        event=event, user=event.user, channel=channel, status='scheduled',
+        message_sid=sid, scheduled_send_time=timezone.now() + timedelta(hours=2)
+    )
+
+def test_cancels_scheduled_sms_at_provider(mock_twilio):
+    """
+    Test that a scheduled SMS is cancelled at Twilio and marked cancelled.
+    """
+    event = EventFactory(is_active=False, tier=None)
+    notification = _scheduled(event, 'primary_sms', 'SM1')
+
+    assert cancel_scheduled_notifications(Notification.objects.filter(event=event)) == 1
+
+    mock_twilio.messages.assert_called_once_with('SM1')
+    mock_twilio.messages.return_value.update.assert_called_once_with(status='canceled')
+    notification.refresh_from_db()
+    assert notification.status == 'cancelled'
+
+def test_ignores_scheduled_emails(mock_twilio):
+    """
+    Test that only SMS, the only messages pre-submitted, are cancelled.
+    """
+    event = EventFactory(is_active=False, tier=None)
+    notification = _scheduled(event, 'primary_email', 'mailgun-id')
+
+    assert cancel_scheduled_notifications(Notification.objects.filter(event=event)) == 0
+
+    mock_twilio.messages.assert_not_called()
+    notification.refresh_from_db()
+    assert notification.status == 'scheduled'
+
+def test_shared_digest_sms_is_not_cancelled_at_provider(mock_twilio):
+    """
+    Test that a digest SMS still covering another event is kept at the provider.
+    """
+    event = EventFactory(is_active=False, tier=None)
+    other_event = EventFactory(user=event.user, is_active=False, tier=None)
+    notification = _scheduled(event, 'primary_sms', 'SM_DIGEST')
+    other = _scheduled(other_event, 'primary_sms', 'SM_DIGEST')
+
+    cancel_scheduled_notifications(Notification.objects.filter(event=event))
+
+    mock_twilio.messages.assert_not_called()
+    notification.refresh_from_db()
+    other.refresh_from_db()
+    assert notification.status == 'cancelled'
+    assert other.status == 'scheduled'
+
+def test_failed_provider_cancellation_keeps_status(mock_twilio):
+    """
+    Test that a message Twilio refuses to cancel stays scheduled.
+    """
+    mock_twilio.messages.return_value.update.side_effect = Exception("Message is already being sent")
+    event = EventFactory(is_active=False, tier=None)
+    notification = _scheduled(event, 'primary_sms', 'SM1')
+
+    assert cancel_scheduled_notifications(Notification.objects.filter(event=event)) == 0
+
+    notification.refresh_from_db()
+    assert notification.status == 'scheduled'
+
+def test_ignores_other_statuses(mock_twilio):
+    """
+    Test that pending and sent notifications are left untouched.
+    """
+    event = EventFactory(is_active=False, tier=None)
+    pending = Notification.objects.create(
+        event=event, user=event.user, channel='primary_sms', status='pending',
+        scheduled_send_time=timezone.now() + timedelta(days=1)
+    )
+
+    assert cancel_scheduled_notifications(Notification.objects.filter(event=event)) == 0
+
+    pending.refresh_from_db()
+    assert pending.status == 'pending'
+
+def test_requeue_moves_fanout_sms_back_to_pending(mock_twilio):
+    """
+    Test that a re-queued fan-out SMS is cancelled per recipient and sent again from scratch.
+    """
+    event = EventFactory(is_active=False, tier=None)
+    notification = _scheduled(event, 'all_emergency_contact_sms', None)
+    for phone, sid in (('+15550001111', 'SM_A'), ('+15550002222', 'SM_B')):
+        NotificationDelivery.objects.create(notification=notification, recipient=phone, status='sent', message_sid=sid)
+
+    assert cancel_scheduled_notifications(Notification.objects.filter(event=event), requeue=True) == 1
+
+    assert sorted(call.args[0] for call in mock_twilio.messages.call_args_list) == ['SM_A', 'SM_B']
+    notification.refresh_from_db()
+    assert notification.status == 'pending'
+    assert not notification.deliveries.exists()
+
+def test_requeue_keeps_fanout_sms_twilio_refused_to_cancel(mock_twilio):
+    """
+    Test that a fan-out SMS with a recipient message Twilio could not cancel stays scheduled.
+    """
+    mock_twilio.messages.return_value.update.side_effect = Exception("Message is already being sent")
+    event = EventFactory(is_active=False, tier=None)
+    notification = _scheduled(event, 'all_emergency_contact_sms', None)
+    NotificationDelivery.objects.create(notification=notification, recipient='+15550001111', status='sent', message_sid='SM_A')
+
+    assert cancel_scheduled_notifications(Notification.objects.filter(event=event), requeue=True) == 0
+
+    notification.refresh_from_db()
+    assert notification.status == 'scheduled'
+    assert notification.deliveries.count() == 1
@@ -0,0 +1,90 @@
+import pytest
+from events.utils.compose_sms import compose_sms
+
+LINK = "https://www.futurereminder.app/api/events/ack/2s-0123456789ab/"
+
+def test_plain_message_is_single_gsm_segment():
+    """
+    Test that a short ASCII message is sent as one GSM-7 segment, unchanged.
+    """
+    composed = compose_sms("Reminder: {name} on 2026-01-01.", fields={'name': "Dentist"})
+
+    assert composed.body == "Reminder: Dentist on 2026-01-01."
+    assert composed.encoding == 'GSM-7'
+    assert composed.segments == 1
+
+def test_smart_punctuation_is_transliterated():
+    """
+    Test that smart quotes, dashes and accents without a GSM-7 form are replaced.
+    """
+    composed = compose_sms("{name}", fields={'name': "Mum’s “big” day — Málaga…"})
+
+    assert composed.body == 'Mum\'s "big" day - Malaga...'
+    assert composed.encoding == 'GSM-7'
+
+def test_gsm_accents_are_kept():
+    """
+    Test that accented characters in the GSM-7 alphabet are not changed.
+    """
+    composed = compose_sms("{name}", fields={'name': "Café in Zürich"})
+
+    assert composed.body == "Café in Zürich"
+    assert composed.encoding == 'GSM-7'
+
+def test_emoji_forces_ucs2():
+    """
+    Test that characters without a safe equivalent switch the message to UCS-2.
+    """
+    composed = compose_sms("{name}", fields={'name': "Birthday 🎂"})
+
+    assert composed.body == "Birthday 🎂"
+    assert composed.encoding == 'UCS-2'
+    assert composed.segments == 1
+
+@pytest.mark.parametrize("name, expected_segments", [("x" * 160, 1), ("x" * 161, 2), ("€" * 80, 1), ("€" * 81, 2)])
+def test_segment_counting(name, expected_segments):
+    """
+    Test segment boundaries, with GSM-7 extension characters counting double.
+    """
+    composed = compose_sms("{name}", fields={'name': name}, max_segments=10)
+
+    assert composed.segments == expected_segments
+
+def test_long_name_is_truncated_to_budget_keeping_link():
+    """
+    Test that an over-long field is shortened with an ellipsis while the fixed text and link survive.
+    """
+    composed = compose_sms(
+        "Reminder from FutureReminder: {name} on 2026-01-01. Mark as done:",
+        fields={'name': "Renew the passport for the whole family " * 5},
+        link=LINK,
+        max_segments=1
+    )
+
+    assert composed.segments == 1
+    assert len(composed.body) <= 160
+    assert composed.body.startswith("Reminder from FutureReminder: Renew the passport")
+    assert "... on 2026-01-01. Mark as done: " in composed.body
+    assert composed.body.endswith(LINK)
+
+def test_longest_field_is_truncated_first():
+    """
+    Test that truncation shortens the longest field and leaves short ones intact.
+    """
+    composed = compose_sms(
+        "{name0}\n{name1}",
+        fields={'name0': "Dentist", 'name1': "y" * 200},
+        max_segments=1
+    )
+
+    assert composed.body.startswith("Dentist\n")
+    assert composed.segments == 1
+
+def test_budget_can_be_exceeded_when_fields_are_exhausted():
+    """
+    Test that a message whose fixed text cannot fit reports its real segment count.
+    """
+    composed = compose_sms("z" * 200 + " {name}", fields={'name': "A long event name here"}, max_segments=1)
+
+    assert composed.segments == 2
+    assert composed.body.endswith("A long ev...")
@@ -4,7 +4,7 @@ from django.utils import timezone
 from events.models import Event, Notification
 from payments.models import Tier
 from users.models import User
-from events.utils.create_admin_tasks_for_notification import create_admin_tasks_for_notification
+from events.utils.create_admin_tasks_for_notifications import create_admin_tasks_for_notifications
 from users.tests.factories.user_factory import UserFactory
 from events.tests.factories.event_factory import EventFactory
 from payments.tests.factories.tier_factory import TierFactory
@@ -57,10 +57,10 @@ def test_create_admin_tasks_success(admin_user, admin_task_tier, notification_wi
     Event.objects.filter(user=admin_user).delete()
 
     # Act
-    tasks_created = create_admin_tasks_for_notification(notification_with_socials)
+    tasks_created = create_admin_tasks_for_notifications([notification_with_socials])
 
     # Assert
-    assert tasks_created == 2
+    assert tasks_created == {notification_with_socials.pk: 2}
     
     admin_events = Event.objects.filter(user=admin_user)
     assert admin_events.count() == 2
@@ -68,6 +68,7 @@ def test_create_admin_tasks_success(admin_user, admin_task_tier, notification_wi
     # Check the details of one of the created events
     first_admin_event = admin_events.first()
     assert first_admin_event.tier == admin_task_tier
+    assert first_admin_event.source_notification == notification_with_socials
     assert "Manual Post for" in first_admin_event.name
     assert "Original User:" in first_admin_event.notes
     assert "Platform: Facebook" in first_admin_event.notes or "Platform: X (Twitter)" in first_admin_event.notes
@@ -75,6 +76,42 @@ def test_create_admin_tasks_success(admin_user, admin_task_tier, notification_wi
     # Check that event_date and weeks_in_advance are set correctly
     assert first_admin_event.event_date == notification_with_socials.scheduled_send_time.date()
     assert first_admin_event.weeks_in_advance == 1
+    assert first_admin_event.notification_start_date == first_admin_event.event_date - timezone.timedelta(weeks=1)
+
+def test_create_admin_tasks_schedules_admin_reminders(admin_user, admin_task_tier, notification_with_socials):
+    """
+    Tests that each admin task gets the 'Admin Task' tier's reminders without
+    going through Event.save().
+    """
+    create_admin_tasks_for_notifications([notification_with_socials])
+
+    admin_notifications = Notification.objects.filter(user=admin_user)
+    assert admin_notifications.count() == 2
+    assert set(admin_notifications.values_list('channel', flat=True)) == {'primary_email'}
+    assert set(admin_notifications.values_list('step_index', flat=True)) == {0}
+
+def test_create_admin_tasks_in_a_batch_uses_constant_queries(
+    admin_user, admin_task_tier, user_with_socials, django_assert_max_num_queries
+):
+    """
+    Tests that a batch of notifications does not cost queries per notification.
+    """
+    notifications = []
+    for _ in range(5):
+        event = EventFactory(user=user_with_socials)
+        notifications.append(Notification.objects.create(
+            event=event,
+            user=user_with_socials,
+            channel='social_media',
+            scheduled_send_time=timezone.now() + timezone.timedelta(days=10)
+        ))
+    notifications = list(Notification.objects.filter(pk__in=[n.pk for n in notifications]).select_related('event', 'user'))
+
+    with django_assert_max_num_queries(6):
+        tasks_created = create_admin_tasks_for_notifications(notifications)
+
+    assert sum(tasks_created.values()) == 10
+    assert Event.objects.filter(user=admin_user).count() == 10
 
 def test_create_admin_tasks_no_handles(admin_user, admin_task_tier):
     """
@@ -95,10 +132,10 @@ def test_create_admin_tasks_no_handles(admin_user, admin_task_tier):
         scheduled_send_time=timezone.now()
     )
     # Act
-    tasks_created = create_admin_tasks_for_notification(notification)
+    tasks_created = create_admin_tasks_for_notifications([notification])
 
     # Assert
-    assert tasks_created == 0
+    assert tasks_created == {notification.pk: 0}
     assert not Event.objects.filter(user=admin_user).exists()
 
 def test_missing_admin_user_raises_error(admin_task_tier, notification_with_socials):
@@ -106,11 +143,11 @@ def test_missing_admin_user_raises_error(admin_task_tier, notification_with_soci
     Tests that an exception is raised if the admin user does not exist.
     """
     with pytest.raises(User.DoesNotExist):
-        create_admin_tasks_for_notification(notification_with_socials)
+        create_admin_tasks_for_notifications([notification_with_socials])
 
 def test_missing_admin_tier_raises_error(admin_user, notification_with_socials):
     """
     Tests that an exception is raised if the 'Admin Task' tier does not exist.
     """
     with pytest.raises(Tier.DoesNotExist):
-        create_admin_tasks_for_notification(notification_with_socials)
+        create_admin_tasks_for_notifications([notification_with_socials])
@@ -0,0 +1,88 @@
+import pytest
+from datetime import timedelta, datetime, time
+from django.core.cache import cache
+from django.utils import timezone
+from events.models import Notification
+from events.utils.forecast_notification_volume import forecast_notification_volume
+from events.tests.factories.event_factory import EventFactory
+from payments.tests.factories.tier_factory import TierFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _at(day, hour):
+    return timezone.make_aware(datetime.combine(day, time(hour, 0)))
+
+
+def test_counts_pending_notifications_per_channel_and_hour():
+    """
+    Tests that pending notifications are counted by day, channel and hour,
+    and that non-pending rows are ignored.
+    """
+    event = EventFactory(is_active=False, tier=None)
+    tomorrow = timezone.localdate() + timedelta(days=1)
+    for channel in ['primary_email', 'primary_email', 'primary_sms']:
+        Notification.objects.create(
+            event=event, user=event.user, channel=channel, status='pending',
+            scheduled_send_time=_at(tomorrow, 10)
+        )
+    Notification.objects.create(
+        event=event, user=event.user, channel='primary_email', status='sent',
+        scheduled_send_time=_at(tomorrow, 10)
+    )
+
+    forecast = forecast_notification_volume(days=3)
+
+    assert len(forecast) == 3
+    day = forecast[1]
+    assert day['date'] == tomorrow.strftime('%Y-%m-%d')
+    assert day['scheduled'] == {'primary_email': 2, 'primary_sms': 1}
+    assert day['hourly']['10'] == {'primary_email': 2, 'primary_sms': 1}
+
+
+def test_projects_inactive_events_weighted_by_activation_rate():
+    """
+    Tests that the schedules of inactive events are projected and weighted by
+    the share of recent events that were activated.
+    """
+    today = timezone.localdate()
+    tier = TierFactory(manifest=['primary_email'])
+    # One active event with no schedule in range, one inactive candidate: a 50% activation rate.
+    EventFactory(is_active=True, tier=None)
+    inactive = EventFactory(
+        is_active=False,
+        tier=tier,
+        event_date=today + timedelta(days=9),
+        weeks_in_advance=1
+    )
+
+    forecast = forecast_notification_volume(days=5)
+
+    start_day = forecast[(inactive.notification_start_date - today).days]
+    assert start_day['projected'] == {'primary_email': 0.5}
+    assert start_day['scheduled'] == {}
+
+
+def test_cached_days_are_reused_until_refreshed():
+    """
+    Tests that a second call reuses cached days, and refresh recomputes them.
+    """
+    event = EventFactory(is_active=False, tier=None)
+    today = timezone.localdate()
+
+    assert forecast_notification_volume(days=2)[1]['scheduled'] == {}
+
+    Notification.objects.create(
+        event=event, user=event.user, channel='backup_sms', status='pending',
+        scheduled_send_time=_at(today + timedelta(days=1), 12)
+    )
+
+    assert forecast_notification_volume(days=2)[1]['scheduled'] == {}
+    assert forecast_notification_volume(days=2, refresh=True)[1]['scheduled'] == {'backup_sms': 1}
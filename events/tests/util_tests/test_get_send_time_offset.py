@@ -0,0 +1,45 @@
+import pytest
+from datetime import timedelta
+from django.test import override_settings
+from events.utils.get_send_time_offset import get_send_time_offset
+from events.tests.factories.event_factory import EventFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_offset_is_stable_for_the_same_event():
+    """
+    Tests that repeated calls for the same event return the same slot.
+    """
+    event = EventFactory(is_active=False)
+
+    assert get_send_time_offset(event) == get_send_time_offset(event)
+
+
+@override_settings(
+    NOTIFICATION_SEND_WINDOW_START_HOUR=9,
+    NOTIFICATION_SEND_WINDOW_MINUTES=120,
+    NOTIFICATION_SEND_SLOT_MINUTES=10,
+)
+def test_offset_falls_inside_the_send_window():
+    """
+    Tests that every offset lands on a slot boundary within the configured window.
+    """
+    offsets = {get_send_time_offset(EventFactory(is_active=False)) for _ in range(20)}
+
+    for offset in offsets:
+        assert timedelta(hours=9) <= offset < timedelta(hours=11)
+        assert offset.total_seconds() % 600 == 0
+
+    # Twenty events should not all collapse onto a single slot.
+    assert len(offsets) > 1
+
+
+@override_settings(NOTIFICATION_SEND_WINDOW_START_HOUR=6, NOTIFICATION_SEND_WINDOW_MINUTES=0)
+def test_empty_window_falls_back_to_window_start():
+    """
+    Tests that a zero-length window schedules everything at the window start.
+    """
+    event = EventFactory(is_active=False)
+
+    assert get_send_time_offset(event) == timedelta(hours=6)
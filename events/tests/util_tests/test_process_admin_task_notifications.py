@@ -0,0 +1,86 @@
+import pytest
+from unittest.mock import patch
+from django.conf import settings
+from django.utils import timezone
+from events.models import Event, Notification
+from payments.models import Tier
+from users.models import User
+from events.utils.process_admin_task_notifications import process_admin_task_notifications
+from users.tests.factories.user_factory import UserFactory
+from events.tests.factories.event_factory import EventFactory
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def admin_user():
+    """Fixture to create the admin user."""
+    return User.objects.create_user(
+        username=settings.ADMIN_EMAIL,
+        email=settings.ADMIN_EMAIL,
+        is_staff=True
+    )
+
+@pytest.fixture
+def admin_task_tier():
+    """Fixture to create the 'Admin Task' tier."""
+    return Tier.objects.create(name="Admin Task", manifest=['primary_email'])
+
+def _social_notification(user):
+    event = EventFactory(user=user)
+    return Notification.objects.create(
+        event=event,
+        user=user,
+        channel='social_media',
+        scheduled_send_time=timezone.now() + timezone.timedelta(days=10)
+    )
+
+def test_pending_social_notifications_are_processed_in_batches(admin_user, admin_task_tier):
+    """
+    Tests that every pending social media notification is processed across
+    several batches and moved to its terminal status.
+    """
+    with_socials = UserFactory(facebook_handle="fb", instagram_handle=None, snapchat_handle=None, x_handle=None)
+    no_socials = UserFactory(facebook_handle=None, instagram_handle=None, snapchat_handle=None, x_handle=None)
+    created = [_social_notification(with_socials) for _ in range(3)]
+    skipped = _social_notification(no_socials)
+
+    processed = process_admin_task_notifications(batch_size=2)
+
+    assert processed == 4
+    for notification in created:
+        notification.refresh_from_db()
+        assert notification.status == 'admin_task_created'
+        assert "Successfully generated 1 admin task(s)" in notification.failure_reason
+    skipped.refresh_from_db()
+    assert skipped.status == 'failed'
+    assert "no social media handles" in skipped.failure_reason
+    assert Event.objects.filter(user=admin_user).count() == 3
+
+def test_missing_admin_configuration_leaves_notifications_pending(admin_task_tier):
+    """
+    Tests that notifications stay pending for a later run when the admin user
+    is not configured.
+    """
+    notification = _social_notification(UserFactory())
+
+    processed = process_admin_task_notifications()
+
+    notification.refresh_from_db()
+    assert processed == 0
+    assert notification.status == 'pending'
+
+def test_failed_status_change_rolls_back_the_created_tasks(admin_user, admin_task_tier):
+    """
+    Tests that the task events and their reminders are not kept when the
+    batch's status change fails, so the next run does not duplicate them.
+    """
+    notification = _social_notification(UserFactory(facebook_handle="fb"))
+
+    with patch('events.utils.process_admin_task_notifications.transition_notifications', side_effect=RuntimeError):
+        with pytest.raises(RuntimeError):
+            process_admin_task_notifications()
+
+    notification.refresh_from_db()
+    assert notification.status == 'pending'
+    assert not Event.objects.filter(user=admin_user).exists()
+    assert not Notification.objects.filter(user=admin_user).exists()
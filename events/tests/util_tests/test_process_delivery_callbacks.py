@@ -0,0 +1,131 @@
+import pytest
+from datetime import timedelta
+from django.core.management import call_command
+from django.utils import timezone
+from events.models import Notification, NotificationDelivery, DeliveryCallback
+from events.tests.factories.event_factory import EventFactory
+from events.utils.process_delivery_callbacks import process_delivery_callbacks
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def event():
+    return EventFactory(is_active=False, tier=None)
+
+def _notification(event, status='sent', sid='MSG1', channel='primary_email'):
+    return Notification.objects.create(
+        event=event, user=event.user, channel=channel, status=status, message_sid=sid,
+        scheduled_send_time=timezone.now() - timedelta(hours=1)
+    )
+
+def _callback(sid='MSG1', status='delivered', recipient=None, failure_reason=None, provider='mailgun'):
+    return DeliveryCallback.objects.create(
+        provider=provider, message_sid=sid, recipient=recipient, raw_status=status or 'queued',
+        status=status, failure_reason=failure_reason
+    )
+
+def test_applies_terminal_status_and_marks_processed(event):
+    """
+    Test that a staged callback resolves its notification and is marked processed.
+    """
+    notification = _notification(event)
+    callback = _callback()
+
+    assert process_delivery_callbacks() == 1
+
+    notification.refresh_from_db()
+    callback.refresh_from_db()
+    assert notification.status == 'delivered'
+    assert callback.processed_at is not None
+
+def test_delivered_at_is_the_callback_time(event):
+    """
+    Test that delivered_at records when the provider reported delivery, not when it was applied.
+    """
+    notification = _notification(event)
+    callback = _callback()
+    reported_at = timezone.now() - timedelta(minutes=10)
+    DeliveryCallback.objects.filter(pk=callback.pk).update(received_at=reported_at)
+
+    process_delivery_callbacks()
+
+    notification.refresh_from_db()
+    assert notification.delivered_at == reported_at
+    assert notification.status_events.get().occurred_at == reported_at
+
+def test_last_terminal_callback_wins(event):
+    """
+    Test that several callbacks for one message are coalesced to the latest terminal status.
+    """
+    notification = _notification(event)
+    _callback(status=None)
+    _callback(status='delivered')
+    _callback(status='failed', failure_reason='Bounced')
+
+    process_delivery_callbacks()
+
+    notification.refresh_from_db()
+    assert notification.status == 'undeliverable'
+    assert notification.failure_reason == 'Bounced'
+    assert notification.failed_at is not None
+
+def test_bounced_notification_is_not_retried(event, mocker):
+    """
+    Test that a message the provider reported as failed is terminal, so the dispatcher does not send it again.
+    """
+    event.user.is_email_verified = True
+    event.user.save()
+    notification = _notification(event)
+    _callback(status='failed', failure_reason='Bounced')
+    mock_send_email = mocker.patch('data_management.management.commands.process_notifications.send_reminder_email')
+
+    process_delivery_callbacks()
+    call_command('process_notifications')
+
+    mock_send_email.assert_not_called()
+    notification.refresh_from_db()
+    assert notification.status == 'undeliverable'
+
+def test_resolved_notifications_are_not_overwritten(event):
+    """
+    Test that a late callback cannot change a notification that is no longer awaiting delivery.
+    """
+    notification = _notification(event, status='delivered')
+    _callback(status='failed', failure_reason='Late bounce')
+
+    process_delivery_callbacks()
+
+    notification.refresh_from_db()
+    assert notification.status == 'delivered'
+
+def test_fanout_deliveries_are_matched_by_recipient(event):
+    """
+    Test that batch email callbacks resolve the matching delivery, not the whole fan-out notification.
+    """
+    notification = _notification(event, sid='BATCH', channel='all_emergency_contact_emails')
+    delivered = NotificationDelivery.objects.create(notification=notification, recipient='a@example.com', status='sent', message_sid='BATCH')
+    bounced = NotificationDelivery.objects.create(notification=notification, recipient='b@example.com', status='sent', message_sid='BATCH')
+    _callback(sid='BATCH', recipient='a@example.com')
+    _callback(sid='BATCH', recipient='b@example.com', status='failed', failure_reason='Bounced')
+
+    process_delivery_callbacks()
+
+    delivered.refresh_from_db()
+    bounced.refresh_from_db()
+    notification.refresh_from_db()
+    assert delivered.status == 'delivered'
+    assert bounced.status == 'undeliverable'
+    assert notification.status == 'sent'
+
+def test_processes_in_batches(event):
+    """
+    Test that the consumer drains the staging table across several batches.
+    """
+    notifications = [_notification(event, sid=f"MSG{i}") for i in range(5)]
+    for i in range(5):
+        _callback(sid=f"MSG{i}")
+
+    assert process_delivery_callbacks(batch_size=2) == 5
+
+    assert not DeliveryCallback.objects.filter(processed_at__isnull=True).exists()
+    assert Notification.objects.filter(pk__in=[n.pk for n in notifications], status='delivered').count() == 5
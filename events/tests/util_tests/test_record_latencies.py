@@ -0,0 +1,51 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from events.models import LatencyBucket
+from events.utils.record_latencies import record_latencies, latency_bucket, bucket_upper_bound
+from events.utils.get_latency_percentiles import get_latency_percentiles
+
+pytestmark = pytest.mark.django_db
+
+def test_bucket_bounds_are_within_relative_error():
+    """
+    Test that every latency is counted in a bucket whose upper bound is at most ~19% above it.
+    """
+    for milliseconds in (0.5, 1, 3, 47, 250, 999, 12_345, 3_600_000):
+        upper = bucket_upper_bound(latency_bucket(milliseconds))
+        assert milliseconds <= upper <= max(milliseconds * 1.19, 1)
+
+def test_observations_are_counted_per_hour_and_bucket():
+    """
+    Test that observations in the same hour and bucket share one row, and manual channels are ignored.
+    """
+    now = timezone.now()
+    record_latencies([
+        ('provider_call', 'primary_sms', now, 200),
+        ('provider_call', 'primary_sms', now, 201),
+        ('provider_call', 'primary_email', now, 200),
+        ('provider_call', 'social_media', now, 200),
+    ])
+    record_latencies([('provider_call', 'primary_sms', now, 202)])
+
+    sms = LatencyBucket.objects.get(channel='primary_sms')
+    assert sms.count == 3
+    assert sms.provider == 'twilio'
+    assert sms.hour == now.replace(minute=0, second=0, microsecond=0)
+    assert LatencyBucket.objects.get(channel='primary_email').provider == 'mailgun'
+    assert LatencyBucket.objects.count() == 2
+
+def test_percentiles_per_series():
+    """
+    Test that p50/p95/p99 are read from the summed buckets of the window.
+    """
+    now = timezone.now()
+    record_latencies([('delivery', 'primary_sms', now, 1000)] * 90 + [('delivery', 'primary_sms', now, 60_000)] * 10)
+    record_latencies([('delivery', 'primary_sms', now - timedelta(days=3), 500_000)])
+
+    [result] = get_latency_percentiles(now - timedelta(hours=1))
+
+    assert (result['metric'], result['channel'], result['provider'], result['count']) == ('delivery', 'primary_sms', 'twilio', 100)
+    assert 1000 <= result['p50_ms'] < 1200
+    assert 60_000 <= result['p95_ms'] < 72_000
+    assert result['p99_ms'] == result['p95_ms']
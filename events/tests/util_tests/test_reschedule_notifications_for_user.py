@@ -0,0 +1,93 @@
+import pytest
+from datetime import timedelta, time, date
+from zoneinfo import ZoneInfo
+from events.models import Notification
+from events.utils.reschedule_notifications_for_user import reschedule_notifications_for_user
+from events.tests.factories.event_factory import EventFactory
+from payments.tests.factories.tier_factory import TierFactory
+from users.tests.factories.user_factory import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_pending_notifications_move_to_the_new_timezone():
+    """
+    Tests that pending notifications keep their local day but move onto the
+    send window in the user's new timezone.
+    """
+    user = UserFactory(timezone='UTC', send_window_start=time(9, 0), send_window_end=time(9, 5))
+    tier = TierFactory(manifest=['primary_email', 'primary_sms'])
+    event = EventFactory(
+        user=user,
+        tier=tier,
+        is_active=True,
+        event_date=date.today() + timedelta(days=60),
+        weeks_in_advance=2
+    )
+    original_days = [
+        n.scheduled_send_time.date()
+        for n in Notification.objects.filter(event=event).order_by('scheduled_send_time')
+    ]
+
+    previous_timezone = ZoneInfo('UTC')
+    user.timezone = 'America/Los_Angeles'
+    user.save()
+
+    rescheduled = reschedule_notifications_for_user(user, previous_timezone=previous_timezone)
+
+    assert rescheduled == 2
+    los_angeles = ZoneInfo('America/Los_Angeles')
+    notifications = Notification.objects.filter(event=event).order_by('scheduled_send_time')
+    for notification, original_day in zip(notifications, original_days):
+        local_time = notification.scheduled_send_time.astimezone(los_angeles)
+        assert local_time.date() == original_day
+        assert local_time.time() == time(9, 0)
+
+
+def test_sent_notifications_are_not_moved():
+    """
+    Tests that only pending notifications are rescheduled.
+    """
+    user = UserFactory(timezone='Europe/London')
+    event = EventFactory(user=user, is_active=False)
+    sent_time = event.created_at
+    sent = Notification.objects.create(
+        event=event,
+        user=user,
+        channel='primary_email',
+        status='sent',
+        scheduled_send_time=sent_time
+    )
+
+    rescheduled = reschedule_notifications_for_user(user, previous_timezone=ZoneInfo('UTC'))
+
+    sent.refresh_from_db()
+    assert rescheduled == 0
+    assert sent.scheduled_send_time == sent_time
+
+
+def test_steps_keep_their_own_send_window():
+    """
+    Tests that a manifest step with its own send window is moved into that
+    window, not the user's, in the new timezone.
+    """
+    user = UserFactory(timezone='UTC', send_window_start=time(9, 0), send_window_end=time(9, 5))
+    tier = TierFactory(manifest=['T-7d primary_email', 'T-2d primary_sms @18:00-18:05'])
+    event = EventFactory(
+        user=user,
+        tier=tier,
+        is_active=True,
+        event_date=date.today() + timedelta(days=60),
+        weeks_in_advance=2
+    )
+
+    user.timezone = 'America/Los_Angeles'
+    user.save()
+    reschedule_notifications_for_user(user, previous_timezone=ZoneInfo('UTC'))
+
+    los_angeles = ZoneInfo('America/Los_Angeles')
+    local_times = {
+        n.channel: n.scheduled_send_time.astimezone(los_angeles).time()
+        for n in Notification.objects.filter(event=event)
+    }
+    assert local_times == {'primary_email': time(9, 0), 'primary_sms': time(18, 0)}
@@ -1,11 +1,15 @@
 import pytest
 from datetime import timedelta, time
+from zoneinfo import ZoneInfo
 from django.utils import timezone
 from unittest.mock import patch
+from django.db import IntegrityError
 from events.models import Notification
 from events.utils.schedule_notifications_for_event import schedule_notifications_for_event
+from events.utils.get_send_time_offset import get_send_time_offset
 from events.tests.factories.event_factory import EventFactory
 from payments.tests.factories.tier_factory import TierFactory
+from users.tests.factories.user_factory import UserFactory
 
 pytestmark = pytest.mark.django_db
 
@@ -142,4 +146,151 @@ def test_handles_single_item_manifest(base_time):
     
     notification = notifications.first()
     assert notification.channel == 'primary_email'
-    assert notification.scheduled_send_time.date() == event.notification_start_date
\ No newline at end of file
+    assert notification.scheduled_send_time.date() == event.notification_start_date
+
+def test_notifications_share_the_event_send_slot(base_time):
+    """
+    Tests that notifications are sent at the event's slot rather than midnight,
+    and that the escalation order is preserved.
+    """
+    manifest = ['primary_email', 'primary_sms', 'backup_email']
+    tier = TierFactory(manifest=manifest)
+    event = EventFactory(
+        is_active=True,
+        tier=tier,
+        event_date=base_time.date() + timedelta(days=30),
+        weeks_in_advance=4
+    )
+
+    schedule_notifications_for_event(event)
+
+    notifications = Notification.objects.filter(event=event).order_by('scheduled_send_time')
+    expected_offset = get_send_time_offset(event)
+
+    assert [n.channel for n in notifications] == manifest
+    for notification in notifications:
+        local_time = timezone.localtime(notification.scheduled_send_time)
+        midnight = local_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        assert local_time - midnight == expected_offset
+
+
+def test_send_times_are_computed_in_the_users_timezone(base_time):
+    """
+    Tests that send times land inside the user's own send window in their
+    timezone, rather than the server's.
+    """
+    user = UserFactory(
+        timezone='Australia/Perth',
+        send_window_start=time(9, 0),
+        send_window_end=time(10, 0)
+    )
+    tier = TierFactory(manifest=['primary_email', 'primary_sms'])
+    event = EventFactory(
+        user=user,
+        is_active=True,
+        tier=tier,
+        event_date=base_time.date() + timedelta(days=30),
+        weeks_in_advance=2
+    )
+
+    notifications = Notification.objects.filter(event=event).order_by('scheduled_send_time')
+    perth = ZoneInfo('Australia/Perth')
+
+    assert notifications.count() == 2
+    for notification in notifications:
+        local_time = notification.scheduled_send_time.astimezone(perth)
+        assert time(9, 0) <= local_time.time() < time(10, 0)
+    assert notifications[0].scheduled_send_time.astimezone(perth).date() == event.notification_start_date
+
+
+def test_offset_manifest_schedules_relative_to_event_date(base_time):
+    """
+    Tests that offset manifests schedule each step at its offset from the event
+    date, honour per-step send windows, and drop steps before the start date.
+    """
+    user = UserFactory(timezone='UTC')
+    tier = TierFactory(manifest=[
+        'T-6w primary_email',
+        'T-28d primary_email',
+        'T-1d emergency_contact_email @18:00-18:05',
+    ])
+    event = EventFactory(
+        user=user,
+        is_active=True,
+        tier=tier,
+        event_date=base_time.date() + timedelta(days=60),
+        weeks_in_advance=4
+    )
+
+    notifications = Notification.objects.filter(event=event).order_by('scheduled_send_time')
+
+    assert [n.channel for n in notifications] == ['primary_email', 'emergency_contact_email']
+    assert notifications[0].scheduled_send_time.date() == event.event_date - timedelta(days=28)
+    assert notifications[1].scheduled_send_time.date() == event.event_date - timedelta(days=1)
+    assert notifications[1].scheduled_send_time.time() == time(18, 0)
+
+
+def test_rescheduling_is_idempotent(base_time):
+    """
+    Tests that scheduling the same event twice keeps the original rows rather
+    than inserting a second copy of the schedule.
+    """
+    tier = TierFactory(manifest=['primary_email', 'primary_sms', 'backup_email'])
+    event = EventFactory(
+        is_active=True,
+        tier=tier,
+        event_date=base_time.date() + timedelta(days=30),
+        weeks_in_advance=4
+    )
+    original_ids = set(Notification.objects.filter(event=event).values_list('id', flat=True))
+
+    schedule_notifications_for_event(event)
+    event.save()
+
+    notifications = Notification.objects.filter(event=event)
+    assert set(notifications.values_list('id', flat=True)) == original_ids
+    assert sorted(notifications.values_list('step_index', flat=True)) == [0, 1, 2]
+
+
+def test_sent_steps_are_not_recreated(base_time):
+    """
+    Tests that re-saving an event does not schedule a step that was already sent.
+    """
+    tier = TierFactory(manifest=['primary_email', 'primary_sms'])
+    event = EventFactory(
+        is_active=True,
+        tier=tier,
+        event_date=base_time.date() + timedelta(days=30),
+        weeks_in_advance=4
+    )
+    Notification.objects.filter(event=event, step_index=0).update(status='sent')
+
+    event.notes = "Updated notes"
+    event.save()
+
+    assert Notification.objects.filter(event=event).count() == 2
+    assert Notification.objects.filter(event=event, status='pending').count() == 1
+
+
+def test_duplicate_step_is_rejected_by_the_database(base_time):
+    """
+    Tests that the unique constraint prevents two rows for the same step and generation.
+    """
+    tier = TierFactory(manifest=['primary_email'])
+    event = EventFactory(
+        is_active=True,
+        tier=tier,
+        event_date=base_time.date() + timedelta(days=30),
+        weeks_in_advance=4
+    )
+    existing = Notification.objects.get(event=event)
+
+    with pytest.raises(IntegrityError):
+        Notification.objects.create(
+            event=event,
+            user=event.user,
+            channel='primary_email',
+            scheduled_send_time=existing.scheduled_send_time,
+            step_index=existing.step_index,
+            generation=existing.generation
+        )
@@ -0,0 +1,42 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from events.models import Notification
+from events.tests.factories.event_factory import EventFactory
+from events.utils.send_digest_sms import send_digest_sms
+from events.views.acknowledgement_view import make_short_digest_acknowledgement_code
+from users.tests.factories.user_factory import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def notifications():
+    user = UserFactory()
+    return [
+        Notification.objects.create(
+            event=EventFactory(user=user, is_active=False, tier=None, name=name), user=user,
+            channel='primary_sms', scheduled_send_time=timezone.now() + timedelta(hours=1)
+        )
+        for name in ('Renew the passport before the trip', 'Dentist')
+    ]
+
+@pytest.fixture
+def mock_client(mocker):
+    client = mocker.patch('events.utils.send_digest_sms.get_twilio_client').return_value
+    client.messages.create.return_value.sid = 'SM_DIGEST'
+    return client
+
+def test_digest_ends_with_one_link_for_every_event(notifications, mock_client, settings):
+    """
+    Test that a digest SMS ends with a short link acknowledging all its events, kept within the segment budget.
+    """
+    settings.SMS_SEGMENT_BUDGET = 1
+
+    assert send_digest_sms(notifications, '+15550001111') == 'SM_DIGEST'
+
+    body = mock_client.messages.create.call_args.kwargs['body']
+    code = make_short_digest_acknowledgement_code(notifications[0].pk)
+    assert body.endswith(f"Mark all done: {settings.SITE_URL}/api/events/ack/all/{code}/")
+    assert 'Dentist' in body
+    assert notifications[0].sms_segments == 1
+    assert notifications[1].sms_segments == 0
@@ -0,0 +1,62 @@
+import json
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from data_management.models import BlockedEmail
+from events.models import Notification
+from events.tests.factories.event_factory import EventFactory
+from events.utils.send_fanout_email import send_fanout_email
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def notification():
+    event = EventFactory(is_active=False, tier=None)
+    return Notification.objects.create(
+        event=event, user=event.user, channel='all_emergency_contact_emails',
+        scheduled_send_time=timezone.now() + timedelta(days=1)
+    )
+
+@pytest.fixture
+def mock_post(mocker):
+    mock = mocker.patch('events.utils.send_fanout_email.requests.post')
+    mock.return_value.json.return_value = {'id': '<batch@mailgun.org>'}
+    return mock
+
+def test_sends_one_batch_to_all_recipients(notification, mock_post):
+    """
+    Test that every recipient is sent in a single Mailgun call with its own unsubscribe link.
+    """
+    recipients = ['a@example.com', 'b@example.com']
+
+    results = send_fanout_email(notification, recipients)
+
+    mock_post.assert_called_once()
+    data = mock_post.call_args.kwargs['data']
+    assert data['to'] == recipients
+    assert set(json.loads(data['recipient-variables'])) == set(recipients)
+    assert '%recipient.unsubscribe_url%' in data['text']
+    assert results == {r: {'message_sid': 'batch@mailgun.org', 'failure_reason': None, 'skipped': False} for r in recipients}
+
+def test_blocklisted_recipients_are_skipped(notification, mock_post):
+    """
+    Test that blocklisted addresses are left out of the batch and reported as skipped.
+    """
+    BlockedEmail.objects.create(email='blocked@example.com')
+
+    results = send_fanout_email(notification, ['a@example.com', 'blocked@example.com'])
+
+    assert mock_post.call_args.kwargs['data']['to'] == ['a@example.com']
+    assert results['blocked@example.com']['message_sid'] is None
+    assert 'blocklist' in results['blocked@example.com']['failure_reason']
+    assert results['blocked@example.com']['skipped'] is True
+
+def test_provider_error_fails_every_recipient(notification, mock_post):
+    """
+    Test that a failed batch call is reported for each recipient instead of raising.
+    """
+    mock_post.side_effect = Exception("Mailgun is down")
+
+    results = send_fanout_email(notification, ['a@example.com', 'b@example.com'])
+
+    assert all(r == {'message_sid': None, 'failure_reason': 'Mailgun is down', 'skipped': False} for r in results.values())
@@ -0,0 +1,181 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from django.db.models import F
+from events.models import Notification, NotificationStatusEvent, NotificationDailyStats, LatencyBucket
+from events.tests.factories.event_factory import EventFactory
+from events.utils.transition_notifications import transition_notifications
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def mock_schedule_notifications(mocker):
+    """Prevents EventFactory saves from creating notifications of their own."""
+    mocker.patch('events.utils.schedule_notifications_for_event.schedule_notifications_for_event')
+
+def _notification(status):
+    event = EventFactory()
+    return Notification.objects.create(
+        event=event, user=event.user, channel='primary_email', status=status,
+        scheduled_send_time=timezone.now() - timedelta(hours=1)
+    )
+
+def test_applies_allowed_transition():
+    """
+    Test that an allowed transition updates the status and the extra fields.
+    """
+    notification = _notification('pending')
+
+    assert transition_notifications(Notification.objects.filter(pk=notification.pk), 'sent', message_sid='SM1') == 1
+
+    notification.refresh_from_db()
+    assert notification.status == 'sent'
+    assert notification.message_sid == 'SM1'
+
+def test_skips_disallowed_transition():
+    """
+    Test that a cancelled notification cannot be moved back to sent.
+    """
+    notification = _notification('cancelled')
+
+    assert transition_notifications(Notification.objects.filter(pk=notification.pk), 'sent', message_sid='SM1') == 0
+
+    notification.refresh_from_db()
+    assert notification.status == 'cancelled'
+    assert notification.message_sid is None
+
+def test_delivered_is_not_reverted_by_a_late_failure():
+    """
+    Test that a delivered notification is not overwritten by an out-of-order failure.
+    """
+    delivered = _notification('delivered')
+    sent = _notification('sent')
+
+    updated = transition_notifications(Notification.objects.all(), 'undeliverable', failure_reason='Bounced')
+
+    assert updated == 1
+    delivered.refresh_from_db()
+    sent.refresh_from_db()
+    assert delivered.status == 'delivered'
+    assert sent.status == 'undeliverable'
+
+def test_unreachable_status_raises():
+    """
+    Test that a status no other status can move to is rejected.
+    """
+    with pytest.raises(ValueError):
+        transition_notifications(Notification.objects.all(), 'archived')
+
+def test_sets_timing_column_and_appends_status_event():
+    """
+    Test that a transition stamps the matching timing column and is logged.
+    """
+    notification = _notification('pending')
+
+    transition_notifications(Notification.objects.filter(pk=notification.pk), 'sent')
+
+    notification.refresh_from_db()
+    assert notification.sent_at is not None
+    assert notification.delivered_at is None
+    status_event = NotificationStatusEvent.objects.get(notification=notification)
+    assert (status_event.from_status, status_event.to_status) == ('pending', 'sent')
+    assert status_event.channel == 'primary_email'
+    assert status_event.occurred_at == notification.sent_at
+
+def test_timing_column_can_be_an_expression():
+    """
+    Test that a passed timing value is stored and used as the event time.
+    """
+    notification = _notification('scheduled')
+
+    transition_notifications(Notification.objects.filter(pk=notification.pk), 'sent', sent_at=F('scheduled_send_time'))
+
+    notification.refresh_from_db()
+    assert notification.sent_at == notification.scheduled_send_time
+    assert NotificationStatusEvent.objects.get(notification=notification).occurred_at == notification.scheduled_send_time
+
+def test_skipped_rows_are_not_logged():
+    """
+    Test that only the rows that actually transitioned are appended to the log.
+    """
+    _notification('cancelled')
+    pending = _notification('pending')
+
+    transition_notifications(Notification.objects.all(), 'failed', failure_reason='Error')
+
+    assert list(NotificationStatusEvent.objects.values_list('notification_id', 'to_status')) == [(pending.pk, 'failed')]
+
+def test_logs_the_status_each_row_moved_from(mocker):
+    """
+    Test that rows moving from different statuses in one call are each logged with their own previous status,
+    and that a row changed by another writer after it was read is skipped.
+    """
+    pending = _notification('pending')
+    failed = _notification('failed')
+    raced = _notification('pending')
+    candidates = Notification.objects.all()
+    original_filter = Notification.objects.filter
+
+    def filter_after_a_concurrent_write(*args, **kwargs):
+        # Another worker sends `raced` between the read and the first UPDATE.
+        if Notification.objects.filter.call_count == 1:
+            original_filter(pk=raced.pk).update(status='sent')
+        return original_filter(*args, **kwargs)
+
+    mocker.patch.object(Notification.objects, 'filter', side_effect=filter_after_a_concurrent_write)
+
+    assert transition_notifications(candidates, 'failed', failure_reason='Error') == 2
+
+    assert sorted(NotificationStatusEvent.objects.values_list('notification_id', 'from_status')) == sorted([
+        (pending.pk, 'pending'), (failed.pk, 'failed')
+    ])
+    raced.refresh_from_db()
+    assert raced.status == 'sent'
+
+def test_increments_daily_stats():
+    """
+    Test that transitions are added to the daily rollup, including the dispatch latency.
+    """
+    first = _notification('pending')
+    second = _notification('pending')
+    Notification.objects.filter(pk=second.pk).update(sms_segments=2)
+
+    transition_notifications(Notification.objects.filter(pk=first.pk), 'sent')
+    transition_notifications(Notification.objects.filter(pk=second.pk), 'sent')
+
+    stats = NotificationDailyStats.objects.get(status='sent')
+    assert stats.day == timezone.localdate()
+    assert stats.channel == 'primary_email'
+    assert stats.count == 2
+    assert stats.sms_segments == 2
+    assert stats.latency_count == 2
+    # Both were due an hour before they were sent.
+    assert 7100 < stats.latency_seconds_total < 7300
+
+def test_retried_notification_is_counted_once_per_status():
+    """
+    Test that a row that fails several times before it is sent adds one error and one send to the rollup,
+    while every attempt is still logged.
+    """
+    notification = _notification('pending')
+    row = Notification.objects.filter(pk=notification.pk)
+
+    for _ in range(3):
+        transition_notifications(row, 'failed', failure_reason='Error')
+    transition_notifications(row, 'sent')
+
+    assert NotificationStatusEvent.objects.filter(notification=notification).count() == 4
+    assert NotificationDailyStats.objects.get(status='failed').count == 1
+    assert NotificationDailyStats.objects.get(status='sent').count == 1
+
+def test_delivery_latency_is_recorded():
+    """
+    Test that a delivery adds its sent-to-delivered time to the latency histogram.
+    """
+    notification = _notification('sent')
+    Notification.objects.filter(pk=notification.pk).update(sent_at=timezone.now() - timedelta(seconds=30))
+
+    transition_notifications(Notification.objects.filter(pk=notification.pk), 'delivered')
+
+    bucket = LatencyBucket.objects.get(metric='delivery')
+    assert (bucket.channel, bucket.provider, bucket.count) == ('primary_email', 'mailgun', 1)
@@ -0,0 +1,238 @@
+import pytest
+from datetime import timedelta
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from events.models import Notification
+from events.views.acknowledgement_view import (
+    acknowledgement_signer, make_short_acknowledgement_code, make_short_digest_acknowledgement_code
+)
+from events.tests.factories.event_factory import EventFactory
+from payments.tests.factories.tier_factory import TierFactory
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.fixture
+def event_with_chain():
+    """An event with one sent reminder and two pending escalation steps."""
+    event = EventFactory(is_active=False, tier=None)
+    now = timezone.now()
+    sent = Notification.objects.create(
+        event=event, user=event.user, channel='primary_email', status='sent',
+        scheduled_send_time=now - timedelta(days=1)
+    )
+    for days, channel in [(3, 'primary_sms'), (6, 'emergency_contact_email')]:
+        Notification.objects.create(
+            event=event, user=event.user, channel=channel, status='pending',
+            scheduled_send_time=now + timedelta(days=days)
+        )
+    return event, sent
+
+@pytest.fixture
+def failed_step(event_with_chain):
+    """A step whose send failed and is waiting for the dispatcher to retry it."""
+    event, _ = event_with_chain
+    return Notification.objects.create(
+        event=event, user=event.user, channel='backup_email', status='failed',
+        scheduled_send_time=timezone.now() - timedelta(hours=1)
+    )
+
+def _url(notification):
+    token = acknowledgement_signer.sign(str(notification.pk))
+    return reverse('acknowledge-event', kwargs={'token': token})
+
+def test_acknowledgement_cancels_remaining_chain(api_client, event_with_chain):
+    """
+    Test that a valid link acknowledges the event, cancels pending steps and redirects.
+    """
+    event, sent = event_with_chain
+
+    response = api_client.post(_url(sent))
+
+    assert response.status_code == 302
+    assert response.url == 'https://www.futurereminder.app/acknowledgement-success/'
+    event.refresh_from_db()
+    assert event.acknowledged_at is not None
+    assert Notification.objects.filter(event=event, status='pending').count() == 0
+    assert Notification.objects.filter(event=event, status='cancelled').count() == 2
+    sent.refresh_from_db()
+    assert sent.status == 'sent'
+
+def test_opening_the_link_only_shows_a_confirmation(api_client, event_with_chain):
+    """
+    Test that a GET or HEAD of the link, as made by email link scanners,
+    shows the confirmation page without acknowledging the event.
+    """
+    event, sent = event_with_chain
+
+    response = api_client.get(_url(sent))
+    head_response = api_client.head(_url(sent))
+
+    assert response.status_code == 200
+    assert head_response.status_code == 200
+    assert event.name in response.content.decode()
+    assert '<form method="post">' in response.content.decode()
+    event.refresh_from_db()
+    assert event.acknowledged_at is None
+    assert Notification.objects.filter(event=event, status='pending').count() == 2
+
+def test_acknowledgement_cancels_failed_steps(api_client, event_with_chain, failed_step):
+    """
+    Test that a step waiting for a retry is cancelled too, so it is never sent.
+    """
+    event, sent = event_with_chain
+
+    api_client.post(_url(sent))
+
+    failed_step.refresh_from_db()
+    assert failed_step.status == 'cancelled'
+
+def test_acknowledgement_is_idempotent(api_client, event_with_chain):
+    """
+    Test that clicking the link again keeps the first acknowledgement time.
+    """
+    event, sent = event_with_chain
+
+    api_client.post(_url(sent))
+    event.refresh_from_db()
+    first_acknowledged_at = event.acknowledged_at
+
+    response = api_client.post(_url(sent))
+
+    assert response.status_code == 302
+    event.refresh_from_db()
+    assert event.acknowledged_at == first_acknowledged_at
+
+def test_acknowledgement_invalid_signature(api_client):
+    """
+    Test that a tampered token returns a 400 Bad Request.
+    """
+    url = reverse('acknowledge-event', kwargs={'token': '123:not-a-signature'})
+    response = api_client.get(url)
+    assert response.status_code == 400
+
+def test_acknowledged_event_is_not_rescheduled(event_with_chain, api_client):
+    """
+    Test that saving an acknowledged event does not re-arm its escalation chain.
+    """
+    event, sent = event_with_chain
+    api_client.post(_url(sent))
+    event.refresh_from_db()
+
+    event.notes = "Edited after acknowledgement"
+    event.save()
+
+    assert Notification.objects.filter(event=event, status='pending').count() == 0
+
+def test_moving_an_acknowledged_event_schedules_it_again(api_client):
+    """
+    Test that an acknowledgement only covers the schedule it was given for, so a new date gets reminders.
+    """
+    event = EventFactory(
+        is_active=True, tier=TierFactory(manifest=['primary_email', 'primary_sms']),
+        event_date=timezone.localdate() + timedelta(days=60), weeks_in_advance=4
+    )
+    first = Notification.objects.filter(event=event, status='pending').earliest('scheduled_send_time')
+    api_client.post(_url(first))
+    assert Notification.objects.filter(event=event, status='pending').count() == 0
+
+    event.refresh_from_db()
+    event.event_date += timedelta(days=7)
+    event.save()
+
+    event.refresh_from_db()
+    assert event.acknowledged_at is None
+    assert event.acknowledged_generation is None
+    rescheduled = Notification.objects.filter(event=event, status='pending')
+    assert rescheduled.count() == 2
+    assert all(n.scheduled_send_time > first.scheduled_send_time for n in rescheduled)
+
+def test_acknowledgement_cancels_presubmitted_sms(api_client, event_with_chain, mocker):
+    """
+    Test that steps already handed to the provider for scheduled delivery are cancelled there.
+    """
+    mock_client = mocker.patch('events.utils.cancel_scheduled_notifications.get_twilio_client').return_value
+    event, sent = event_with_chain
+    scheduled = Notification.objects.create(
+        event=event, user=event.user, channel='primary_sms', status='scheduled',
+        message_sid='SM_SCHEDULED', scheduled_send_time=timezone.now() + timedelta(hours=2)
+    )
+
+    api_client.post(_url(sent))
+
+    mock_client.messages.assert_called_once_with('SM_SCHEDULED')
+    scheduled.refresh_from_db()
+    assert scheduled.status == 'cancelled'
+
+def test_short_acknowledgement_link(api_client, event_with_chain):
+    """
+    Test that the short link sent by SMS acknowledges the event.
+    """
+    event, sent = event_with_chain
+    code = make_short_acknowledgement_code(sent.pk)
+
+    response = api_client.post(reverse('short-acknowledge-event', kwargs={'token': code}))
+
+    assert response.status_code == 302
+    event.refresh_from_db()
+    assert event.acknowledged_at is not None
+
+def test_short_acknowledgement_link_rejects_tampered_code(api_client, event_with_chain):
+    """
+    Test that a short code with a signature for another notification is rejected.
+    """
+    event, sent = event_with_chain
+    other_signature = make_short_acknowledgement_code(sent.pk + 1).split('-')[1]
+    code = f"{make_short_acknowledgement_code(sent.pk).split('-')[0]}-{other_signature}"
+
+    response = api_client.post(reverse('short-acknowledge-event', kwargs={'token': code}))
+
+    assert response.status_code == 400
+    event.refresh_from_db()
+    assert event.acknowledged_at is None
+
+def test_digest_acknowledgement_link_acknowledges_every_event_in_the_digest(api_client, event_with_chain):
+    """
+    Test that the single link of a digest SMS acknowledges each event sent in that message, and no other.
+    """
+    event, _ = event_with_chain
+    other_event = EventFactory(user=event.user, is_active=False, tier=None)
+    unrelated_event = EventFactory(user=event.user, is_active=False, tier=None)
+    now = timezone.now()
+    digest = [
+        Notification.objects.create(
+            event=e, user=event.user, channel='primary_sms', status='sent',
+            message_sid='SM_DIGEST', scheduled_send_time=now
+        )
+        for e in (event, other_event)
+    ]
+    Notification.objects.create(
+        event=unrelated_event, user=event.user, channel='primary_sms', status='sent',
+        message_sid='SM_OTHER', scheduled_send_time=now
+    )
+    url = reverse('short-acknowledge-digest', kwargs={'token': make_short_digest_acknowledgement_code(digest[0].pk)})
+
+    assert b'these events' in api_client.get(url).content
+    response = api_client.post(url)
+
+    assert response.status_code == 302
+    for e in (event, other_event, unrelated_event):
+        e.refresh_from_db()
+    assert event.acknowledged_at is not None
+    assert other_event.acknowledged_at is not None
+    assert unrelated_event.acknowledged_at is None
+    assert Notification.objects.filter(event=event, status='pending').count() == 0
+
+def test_single_reminder_code_is_not_a_digest_code(api_client, event_with_chain):
+    """
+    Test that a single reminder's short code cannot be used on the digest link.
+    """
+    _, sent = event_with_chain
+
+    response = api_client.post(reverse('short-acknowledge-digest', kwargs={'token': make_short_acknowledgement_code(sent.pk)}))
+
+    assert response.status_code == 400
@@ -1,10 +1,11 @@
 # events/tests/view_tests/test_event_view.py
 import pytest
+from django.utils import timezone
 from rest_framework.test import APIClient
 from users.tests.factories.user_factory import UserFactory
 from payments.tests.factories.tier_factory import TierFactory
 from payments.tests.factories.price_factory import PriceFactory
-from events.models import Event
+from events.models import Event, Notification
 from events.tests.factories.event_factory import EventFactory
 
 @pytest.mark.django_db
@@ -115,6 +116,20 @@ class TestEventViewSet:
         assert response.status_code == 204
         assert Event.objects.count() == 0
 
+    def test_destroy_event_cancels_presubmitted_sms(self, mocker):
+        mock_client = mocker.patch('events.utils.cancel_scheduled_notifications.get_twilio_client').return_value
+        Notification.objects.create(
+            event=self.event, user=self.user, channel='primary_sms', status='scheduled',
+            message_sid='SM_SCHEDULED', scheduled_send_time=timezone.now()
+        )
+
+        response = self.client.delete(f'/api/events/{self.event.id}/')
+
+        assert response.status_code == 204
+        mock_client.messages.assert_called_once_with('SM_SCHEDULED')
+        mock_client.messages.return_value.update.assert_called_once_with(status='canceled')
+        assert Notification.objects.count() == 0
+
     def test_activate_free_tier_event(self):
         free_tier = TierFactory(name="Free Tier")
         PriceFactory(tier=free_tier, amount=0)
@@ -0,0 +1,112 @@
+import pytest
+from datetime import timedelta
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from users.models import User
+from events.models import NotificationDailyStats
+from events.utils.record_latencies import record_latencies
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture
+def api_client():
+    cache.clear()
+    return APIClient()
+
+@pytest.fixture
+def admin_client(api_client):
+    api_client.force_authenticate(user=User.objects.create_superuser('admin@example.com', 'password'))
+    return api_client
+
+def _stats(days_ago, channel, status, count, sms_segments=0):
+    return NotificationDailyStats.objects.create(
+        day=timezone.localdate() - timedelta(days=days_ago),
+        channel=channel, status=status, count=count, sms_segments=sms_segments
+    )
+
+def test_stats_require_admin(api_client):
+    """
+    Test that a non-admin user cannot access the stats.
+    """
+    api_client.force_authenticate(user=User.objects.create_user('user@example.com', 'password'))
+    response = api_client.get(reverse('notification-stats'))
+    assert response.status_code == 403
+
+def test_stats_are_grouped_per_status_and_channel(admin_client):
+    """
+    Test that the last seven days are summed per status and channel by default.
+    """
+    _stats(1, 'primary_sms', 'sent', 2, sms_segments=3)
+    _stats(2, 'primary_sms', 'sent', 1, sms_segments=1)
+    _stats(1, 'primary_email', 'failed', 1)
+    _stats(1, 'primary_sms', 'undeliverable', 2)
+    _stats(1, 'primary_email', 'delivered', 5)
+    _stats(30, 'primary_sms', 'sent', 9, sms_segments=9)
+
+    response = admin_client.get(reverse('notification-stats'))
+
+    assert response.status_code == 200
+    assert response.data == {
+        'sent': {'primary_sms': 3},
+        'failed': {'primary_email': 1},
+        'undeliverable': {'primary_sms': 2},
+        'sms_segments': {'primary_sms': 4},
+    }
+
+def test_stats_window_parameters(admin_client):
+    """
+    Test that ?days= and ?since= widen the window.
+    """
+    _stats(1, 'primary_sms', 'sent', 1)
+    _stats(30, 'primary_sms', 'sent', 9)
+    since = (timezone.localdate() - timedelta(days=40)).isoformat()
+
+    assert admin_client.get(reverse('notification-stats'), {'days': 31}).data['sent'] == {'primary_sms': 10}
+    assert admin_client.get(reverse('notification-stats'), {'since': since}).data['sent'] == {'primary_sms': 10}
+
+def test_stats_window_covers_exactly_the_requested_days(admin_client):
+    """
+    Test that ?days=1 covers today only and the default covers today and the six days before it.
+    """
+    _stats(0, 'primary_sms', 'sent', 1)
+    _stats(1, 'primary_sms', 'sent', 2)
+    _stats(6, 'primary_sms', 'sent', 4)
+    _stats(7, 'primary_sms', 'sent', 8)
+
+    assert admin_client.get(reverse('notification-stats'), {'days': 1}).data['sent'] == {'primary_sms': 1}
+    assert admin_client.get(reverse('notification-stats')).data['sent'] == {'primary_sms': 7}
+
+def test_stats_invalid_parameters(admin_client):
+    """
+    Test that malformed or out-of-range parameters are rejected.
+    """
+    for params in ({'days': 'abc'}, {'days': 0}, {'since': '2025-13-40'}):
+        assert admin_client.get(reverse('notification-stats'), params).status_code == 400
+
+def test_stats_are_cached_per_window(admin_client, django_assert_num_queries):
+    """
+    Test that a repeat request for the same window is served from the cache.
+    """
+    _stats(1, 'primary_sms', 'sent', 1)
+    admin_client.get(reverse('notification-stats'))
+
+    with django_assert_num_queries(0):
+        response = admin_client.get(reverse('notification-stats'))
+
+    assert response.data['sent'] == {'primary_sms': 1}
+
+def test_latency_percentiles(admin_client):
+    """
+    Test that the latency endpoint reports percentiles per metric, channel and provider.
+    """
+    record_latencies([('provider_call', 'primary_email', timezone.now(), 150)])
+
+    response = admin_client.get(reverse('notification-latency'))
+
+    assert response.status_code == 200
+    [series] = response.data
+    assert (series['metric'], series['channel'], series['provider'], series['count']) == ('provider_call', 'primary_email', 'mailgun', 1)
+    assert 150 <= series['p99_ms'] < 180
+    assert admin_client.get(reverse('notification-latency'), {'hours': 0}).status_code == 400
@@ -0,0 +1,173 @@
+import hashlib
+import hmac
+import json
+import secrets
+import time
+import pytest
+from datetime import timedelta
+from django.conf import settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from twilio.request_validator import RequestValidator
+from events.models import DeliveryCallback, Notification
+from events.tests.factories.event_factory import EventFactory
+from events.utils.process_delivery_callbacks import process_delivery_callbacks
+
+pytestmark = pytest.mark.django_db
+
+SIGNING_KEY = 'test-signing-key'
+TWILIO_AUTH_TOKEN = 'test-auth-token'
+
+@pytest.fixture
+def api_client(settings):
+    settings.MAILGUN_WEBHOOK_SIGNING_KEY = SIGNING_KEY
+    settings.TWILIO_AUTH_TOKEN = TWILIO_AUTH_TOKEN
+    return APIClient()
+
+def _mailgun_payload(event_data, timestamp=None, key=SIGNING_KEY, token=None):
+    timestamp = str(timestamp or int(time.time()))
+    token = token or secrets.token_hex(25)
+    signature = hmac.new(key.encode(), f"{timestamp}{token}".encode(), hashlib.sha256).hexdigest()
+    return json.dumps({
+        'signature': {'timestamp': timestamp, 'token': token, 'signature': signature},
+        'event-data': event_data,
+    })
+
+def _post(api_client, payload):
+    return api_client.post(reverse('mailgun-events-webhook'), payload, content_type='application/json')
+
+def _event(event, **extra):
+    return {
+        'event': event,
+        'recipient': 'user@example.com',
+        'message': {'headers': {'message-id': '20260101.1@mail.example.com'}},
+        **extra,
+    }
+
+def test_mailgun_delivered_event_is_staged(api_client):
+    """
+    Test that a signed delivered event is appended to the staging table.
+    """
+    response = _post(api_client, _mailgun_payload(_event('delivered')))
+
+    assert response.status_code == 200
+    callback = DeliveryCallback.objects.get()
+    assert callback.provider == 'mailgun'
+    assert callback.message_sid == '20260101.1@mail.example.com'
+    assert callback.recipient == 'user@example.com'
+    assert callback.status == 'delivered'
+    assert callback.processed_at is None
+
+def test_mailgun_permanent_failure_is_staged_with_reason(api_client):
+    """
+    Test that a permanent failure is staged as failed with the provider's reason.
+    """
+    event = _event('failed', severity='permanent', **{'delivery-status': {'code': 550, 'description': 'No such mailbox'}})
+
+    _post(api_client, _mailgun_payload(event))
+
+    callback = DeliveryCallback.objects.get()
+    assert callback.status == 'failed'
+    assert callback.failure_reason == 'Mailgun Error 550: No such mailbox'
+
+@pytest.mark.parametrize("event", [_event('failed', severity='temporary'), _event('opened')])
+def test_mailgun_non_terminal_events_are_ignored(api_client, event):
+    """
+    Test that temporary failures and engagement events are acknowledged but not staged.
+    """
+    response = _post(api_client, _mailgun_payload(event))
+
+    assert response.status_code == 200
+    assert not DeliveryCallback.objects.exists()
+
+@pytest.mark.parametrize("payload_kwargs", [{'key': 'wrong-key'}, {'timestamp': int(time.time()) - 3600}])
+def test_mailgun_invalid_signature_is_rejected(api_client, payload_kwargs):
+    """
+    Test that a forged or stale signature returns 403 and stages nothing.
+    """
+    response = _post(api_client, _mailgun_payload(_event('delivered'), **payload_kwargs))
+
+    assert response.status_code == 403
+    assert not DeliveryCallback.objects.exists()
+
+def test_mailgun_replayed_token_is_rejected(api_client):
+    """
+    Test that a validly signed request is only accepted once within the signature window.
+    """
+    payload = _mailgun_payload(_event('delivered'))
+
+    assert _post(api_client, payload).status_code == 200
+    assert _post(api_client, payload).status_code == 403
+    assert DeliveryCallback.objects.count() == 1
+
+def _twilio_post(api_client, auth_token=TWILIO_AUTH_TOKEN, **data):
+    url = reverse('twilio-status-webhook')
+    signature = RequestValidator(auth_token).compute_signature(f"{settings.SITE_URL}{url}", data)
+    return api_client.post(url, data, HTTP_X_TWILIO_SIGNATURE=signature)
+
+def test_twilio_callback_is_queued_without_touching_notification(api_client):
+    """
+    Test that a Twilio callback is appended to the inbox and the notification is left for the consumer.
+    """
+    event = EventFactory(is_active=False, tier=None)
+    notification = Notification.objects.create(
+        event=event, user=event.user, channel='primary_sms', status='sent', message_sid='SM123',
+        scheduled_send_time=timezone.now() - timedelta(hours=1)
+    )
+
+    response = _twilio_post(api_client, MessageSid='SM123', MessageStatus='delivered')
+
+    assert response.status_code == 200
+    callback = DeliveryCallback.objects.get()
+    assert (callback.provider, callback.message_sid, callback.status) == ('twilio', 'SM123', 'delivered')
+    notification.refresh_from_db()
+    assert notification.status == 'sent'
+
+def test_twilio_callbacks_are_coalesced_to_terminal_status(api_client):
+    """
+    Test that the consumer applies only the terminal status from a message's callbacks.
+    """
+    event = EventFactory(is_active=False, tier=None)
+    notification = Notification.objects.create(
+        event=event, user=event.user, channel='primary_sms', status='sent', message_sid='SM123',
+        scheduled_send_time=timezone.now() - timedelta(hours=1)
+    )
+
+    _twilio_post(api_client, MessageSid='SM123', MessageStatus='sent')
+    _twilio_post(api_client, MessageSid='SM123', MessageStatus='undelivered', ErrorCode='30003')
+    _twilio_post(api_client, MessageSid='SM123', MessageStatus='queued')
+    process_delivery_callbacks()
+
+    notification.refresh_from_db()
+    assert notification.status == 'undeliverable'
+    assert notification.failure_reason == 'Twilio Error Code: 30003'
+
+def test_twilio_forged_callback_is_rejected(api_client):
+    """
+    Test that a callback not signed with the account's auth token returns 403 and stages nothing.
+    """
+    event = EventFactory(is_active=False, tier=None)
+    notification = Notification.objects.create(
+        event=event, user=event.user, channel='primary_sms', status='sent', message_sid='SM123',
+        scheduled_send_time=timezone.now() - timedelta(hours=1)
+    )
+
+    forged = _twilio_post(api_client, auth_token='guessed-token', MessageSid='SM123', MessageStatus='failed')
+    unsigned = api_client.post(reverse('twilio-status-webhook'), {'MessageSid': 'SM123', 'MessageStatus': 'failed'})
+
+    assert forged.status_code == 403
+    assert unsigned.status_code == 403
+    assert not DeliveryCallback.objects.exists()
+    process_delivery_callbacks()
+    notification.refresh_from_db()
+    assert notification.status == 'sent'
+
+def test_twilio_callback_requires_sid(api_client):
+    """
+    Test that a callback without a MessageSid is rejected.
+    """
+    response = _twilio_post(api_client, MessageStatus='delivered')
+
+    assert response.status_code == 400
+    assert not DeliveryCallback.objects.exists()
@@ -1,15 +1,22 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views.event_view import EventViewSet
-from .views.webhook_views import twilio_status_webhook
-from .views.notification_views import NotificationStatsView, AdminTaskListView
+from .views.webhook_views import twilio_status_webhook, mailgun_events_webhook
+from .views.notification_views import NotificationStatsView, NotificationLatencyView, AdminTaskListView
+from .views.acknowledgement_view import AcknowledgeEventView, ShortAcknowledgeEventView, ShortAcknowledgeDigestView
 
 router = DefaultRouter()
 router.register(r'', EventViewSet, basename='event')
 
 urlpatterns = [
-    path('', include(router.urls)),
     path('webhooks/twilio/status/', twilio_status_webhook, name='twilio-status-webhook'),
+    path('webhooks/mailgun/events/', mailgun_events_webhook, name='mailgun-events-webhook'),
     path('stats/', NotificationStatsView.as_view(), name='notification-stats'),
+    path('stats/latency/', NotificationLatencyView.as_view(), name='notification-latency'),
     path('admin-tasks/', AdminTaskListView.as_view(), name='notification-admin-tasks'),
+    path('acknowledge/<str:token>/', AcknowledgeEventView.as_view(), name='acknowledge-event'),
+    path('ack/<str:token>/', ShortAcknowledgeEventView.as_view(), name='short-acknowledge-event'),
+    path('ack/all/<str:token>/', ShortAcknowledgeDigestView.as_view(), name='short-acknowledge-digest'),
+    # Last, so the event detail route does not capture paths like 'stats/'.
+    path('', include(router.urls)),
 ]
\ No newline at end of file
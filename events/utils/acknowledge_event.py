@@ -0,0 +1,32 @@
+from django.utils import timezone
+from ..models import Event, Notification
+from .cancel_scheduled_notifications import cancel_scheduled_notifications
+from .get_schedule_generation import get_schedule_generation
+from .transition_notifications import transition_notifications
+
+
+def acknowledge_event(event: 'Event') -> int:
+    """
+    Marks an event as acknowledged and cancels the rest of its escalation chain.
+
+    Both writes are single conditional UPDATEs, so repeated acknowledgements
+    are harmless: the first acknowledgement time is kept and there is nothing
+    left to cancel. Failed steps waiting for a retry and steps already
+    pre-submitted to a provider are cancelled too. The acknowledged schedule
+    generation is stored, so moving the event to a new date arms it again.
+
+    Args:
+        event: The Event the user has acknowledged.
+
+    Returns:
+        The number of pending, failed or scheduled notifications that were cancelled.
+    """
+    Event.objects.filter(pk=event.pk, acknowledged_at__isnull=True).update(
+        acknowledged_at=timezone.now(),
+        acknowledged_generation=get_schedule_generation(event)
+    )
+
+    cancelled = transition_notifications(
+        Notification.objects.filter(event=event, status__in=['pending', 'failed']), 'cancelled'
+    )
+    return cancelled + cancel_scheduled_notifications(Notification.objects.filter(event=event))
@@ -0,0 +1,107 @@
+from datetime import timedelta, datetime, time
+from django.utils import timezone
+from .get_send_time_offset import get_send_time_offset
+from users.utils.get_user_timezone import get_user_timezone
+
+
+def _iter_offset_steps(event: 'Event'):
+    """
+    Yields (channel, target_date, send_offset) for each of the tier's compiled
+    offset steps. Each send date is the event date plus the step's offset;
+    steps that would fall before the event's notification start date are
+    dropped. The send offset honours the step's own window, if it has one.
+    """
+    send_offsets = {}
+    for step in event.tier.compiled_schedule:
+        target_date = event.event_date + timedelta(days=step['offset_days'])
+        if target_date < event.notification_start_date:
+            continue
+
+        window = tuple(step['window']) if step['window'] else None
+        if window not in send_offsets:
+            send_offsets[window] = get_send_time_offset(event, window=window)
+        yield step['channel'], target_date, send_offsets[window]
+
+
+def _build_offset_schedule(event: 'Event', user_tz) -> list:
+    """
+    Builds a schedule from the tier's compiled offset steps.
+    """
+    return [
+        (channel, timezone.make_aware(datetime.combine(target_date, time.min) + send_offset, user_tz))
+        for channel, target_date, send_offset in _iter_offset_steps(event)
+    ]
+
+
+def get_step_send_offsets(event: 'Event') -> list:
+    """
+    Returns the offset from local midnight of every step of an event's
+    schedule, indexed like Notification.step_index. Steps with their own send
+    window get a slot inside it; the others use the event's slot in the
+    user's window.
+
+    Returns:
+        A list of timedeltas, or an empty list if the event has no schedule.
+    """
+    if not all([event.tier, event.notification_start_date, event.event_date]) or \
+       event.notification_start_date >= event.event_date:
+        return []
+
+    if event.tier.compiled_schedule:
+        return [send_offset for _, _, send_offset in _iter_offset_steps(event)]
+
+    return [get_send_time_offset(event)] * len(event.tier.manifest or [])
+
+
+def build_notification_schedule(event: 'Event') -> list:
+    """
+    Computes the notification schedule for an event's tier manifest without
+    touching the database.
+
+    Tiers with an offset manifest use their compiled schedule template. Plain
+    channel lists are spread evenly between the notification start date and
+    the event date.
+
+    The event's active status is not checked, so this can also be used to
+    project the schedule an inactive event would get once activated.
+
+    Args:
+        event: The Event instance to build a schedule for.
+
+    Returns:
+        A list of (channel, send_time) tuples in escalation order. Empty if the
+        event has no tier, no manifest, or an invalid date range.
+    """
+    if not all([event.tier, event.notification_start_date, event.event_date]) or \
+       event.notification_start_date >= event.event_date:
+        return []
+
+    user_tz = get_user_timezone(event.user)
+    if event.tier.compiled_schedule:
+        return _build_offset_schedule(event, user_tz)
+
+    manifest = event.tier.manifest
+    if not manifest:
+        return []
+
+    # Calculate timing intervals
+    total_duration = event.event_date - event.notification_start_date
+    total_notifications = len(manifest)
+
+    # If there's only one notification, schedule it at the start.
+    # Otherwise, calculate the interval to spread them out.
+    interval = total_duration / total_notifications if total_notifications > 1 else timedelta(0)
+
+    # Spread load across the send window instead of firing everything at midnight.
+    send_offset = get_send_time_offset(event)
+
+    schedule = []
+    for i, channel in enumerate(manifest):
+        # Calculate the target date for the notification
+        target_date = event.notification_start_date + (interval * i)
+
+        # Combine date with the event's send slot and make it aware in the user's timezone
+        send_time_naive = datetime.combine(target_date, time.min) + send_offset
+        schedule.append((channel, timezone.make_aware(send_time_naive, user_tz)))
+
+    return schedule
@@ -0,0 +1,77 @@
+from ..models import Notification, NotificationDelivery
+from .get_twilio_client import get_twilio_client
+from .transition_notifications import transition_notifications
+
+SMS_CHANNELS = ['primary_sms', 'backup_sms']
+FANOUT_SMS_CHANNELS = ['all_emergency_contact_sms']
+
+
+def cancel_scheduled_notifications(notifications, requeue: bool = False) -> int:
+    """
+    Cancels notifications that were pre-submitted to a provider with a
+    scheduled delivery time but have not been delivered yet.
+
+    Scheduled Twilio messages are cancelled at the provider. A digest SMS is
+    only cancelled if every notification sharing its SID is being cancelled,
+    so other events in the digest are still delivered. Fan-out SMS are
+    cancelled per recipient through their deliveries. Messages that Twilio
+    refuses to cancel keep their 'scheduled' status.
+
+    With `requeue`, the cancelled rows move back to 'pending' instead, with
+    their provider details and fan-out deliveries cleared, so they are sent
+    again, e.g. to a new phone number or at a new local time.
+
+    Args:
+        notifications: A Notification queryset to cancel. Rows that are not
+            scheduled SMS are ignored.
+        requeue: Whether to move the rows back to 'pending' rather than
+            'cancelled'.
+
+    Returns:
+        The number of notifications that were cancelled or re-queued.
+    """
+    scheduled = list(
+        notifications.filter(status='scheduled', channel__in=SMS_CHANNELS + FANOUT_SMS_CHANNELS)
+        .values_list('pk', 'channel', 'message_sid')
+    )
+    if not scheduled:
+        return 0
+
+    pks = [pk for pk, _, _ in scheduled]
+    sms_sids = {sid for _, channel, sid in scheduled if channel in SMS_CHANNELS and sid}
+    fanout_pks = [pk for pk, channel, _ in scheduled if channel in FANOUT_SMS_CHANNELS]
+    fanout_sids = set(
+        NotificationDelivery.objects.filter(notification_id__in=fanout_pks, message_sid__isnull=False)
+        .values_list('message_sid', flat=True)
+    )
+
+    # Keep digests that still cover notifications which are not being cancelled.
+    shared_sids = set(
+        Notification.objects.filter(message_sid__in=sms_sids, status='scheduled')
+        .exclude(pk__in=pks)
+        .values_list('message_sid', flat=True)
+    )
+
+    client = None
+    failed_sids = set()
+    for sid in (sms_sids - shared_sids) | fanout_sids:
+        try:
+            client = client or get_twilio_client()
+            client.messages(sid).update(status='canceled')
+        except Exception as e:
+            # Usually the message is already on its way; leave it scheduled.
+            print(f"Could not cancel scheduled Twilio message {sid}: {e}")
+            failed_sids.add(sid)
+
+    cancellable = Notification.objects.filter(pk__in=pks, status='scheduled').exclude(message_sid__in=failed_sids).exclude(
+        pk__in=NotificationDelivery.objects.filter(notification_id__in=fanout_pks, message_sid__in=failed_sids)
+        .values('notification_id')
+    )
+    if not requeue:
+        return transition_notifications(cancellable, 'cancelled')
+
+    requeued = transition_notifications(
+        cancellable, 'pending', message_sid=None, recipient_contact_info=None, sms_segments=None, sent_at=None
+    )
+    NotificationDelivery.objects.filter(notification_id__in=fanout_pks, notification__status='pending').delete()
+    return requeued
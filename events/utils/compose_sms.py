@@ -0,0 +1,131 @@
+import math
+import unicodedata
+from typing import NamedTuple
+from django.conf import settings
+
+# The GSM 03.38 default alphabet. Characters in GSM7_EXTENDED take two septets.
+GSM7_BASIC = set(
+    "@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞÆæßÉ !\"#¤%&'()*+,-./0123456789:;<=>?"
+    "¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà"
+)
+GSM7_EXTENDED = set("^{}\\[~]|€\f")
+
+# Characters that are commonly pasted into event names (e.g. by phone keyboards)
+# and have a safe GSM-7 equivalent.
+TRANSLITERATIONS = {
+    '‘': "'", '’': "'", '‚': "'", '‛': "'", '′': "'", '`': "'", '´': "'",
+    '“': '"', '”': '"', '„': '"', '‟': '"', '″': '"', '«': '"', '»': '"',
+    '–': '-', '—': '-', '―': '-', '−': '-', '•': '-',
+    '…': '...', '×': 'x',
+    '\u00a0': ' ', '\u2009': ' ', '\u202f': ' ', '\t': ' ',
+    '\u200b': '', '\u200d': '', '\ufe0f': '',
+}
+
+# Single-segment capacity and per-segment capacity of concatenated messages.
+SEGMENT_LIMITS = {
+    'GSM-7': (160, 153),
+    'UCS-2': (70, 67),
+}
+
+# Truncated fields are never shortened below this many characters.
+MIN_FIELD_LENGTH = 12
+ELLIPSIS = '...'
+
+
+class ComposedSms(NamedTuple):
+    body: str
+    encoding: str
+    segments: int
+
+
+def _transliterate(text: str) -> str:
+    """
+    Replaces characters outside the GSM-7 alphabet with a safe equivalent where
+    one exists. Characters without one (e.g. emoji) are kept as they are.
+    """
+    result = []
+    for char in text:
+        if char in GSM7_BASIC or char in GSM7_EXTENDED:
+            result.append(char)
+        elif char in TRANSLITERATIONS:
+            result.append(TRANSLITERATIONS[char])
+        else:
+            # Strip accents that GSM-7 does not have, e.g. 'á' -> 'a'.
+            stripped = ''.join(
+                c for c in unicodedata.normalize('NFKD', char) if not unicodedata.combining(c)
+            )
+            if stripped and all(c in GSM7_BASIC for c in stripped):
+                result.append(stripped)
+            else:
+                result.append(char)
+    return ''.join(result)
+
+
+def _get_encoding(text: str) -> str:
+    if all(char in GSM7_BASIC or char in GSM7_EXTENDED for char in text):
+        return 'GSM-7'
+    return 'UCS-2'
+
+
+def _count_segments(text: str, encoding: str) -> int:
+    if encoding == 'GSM-7':
+        length = sum(2 if char in GSM7_EXTENDED else 1 for char in text)
+    else:
+        # UCS-2 is counted in UTF-16 code units, so emoji take two.
+        length = len(text.encode('utf-16-le')) // 2
+
+    single_limit, multi_limit = SEGMENT_LIMITS[encoding]
+    if length <= single_limit:
+        return 1
+    return math.ceil(length / multi_limit)
+
+
+def _truncate(value: str, length: int) -> str:
+    if len(value) <= length:
+        return value
+    return value[:length - len(ELLIPSIS)].rstrip() + ELLIPSIS
+
+
+def compose_sms(template: str, fields: dict = None, link: str = None, max_segments: int = None) -> ComposedSms:
+    """
+    Builds an SMS body that fits a segment budget.
+
+    Text is transliterated to GSM-7 where that is safe, so a smart quote in an
+    event name does not switch the whole message to UCS-2. If the message
+    still needs more segments than the budget allows, the longest of the
+    `fields` is shortened with an ellipsis until it fits; the fixed text of
+    the template and the link are never cut.
+
+    Args:
+        template: The message text, with str.format placeholders for `fields`.
+        fields: User-provided values that may be truncated, e.g. event names.
+        link: Optional. A short link appended to the end of the message.
+        max_segments: The segment budget. Defaults to SMS_SEGMENT_BUDGET.
+
+    Returns:
+        A ComposedSms with the body, its encoding and its segment count. The
+        count can exceed the budget if the fields cannot be shortened further.
+    """
+    if max_segments is None:
+        max_segments = getattr(settings, 'SMS_SEGMENT_BUDGET', 1)
+
+    template = _transliterate(template)
+    originals = {name: _transliterate(str(value)) for name, value in (fields or {}).items()}
+    lengths = {name: len(value) for name, value in originals.items()}
+
+    while True:
+        body = template.format(**{name: _truncate(originals[name], lengths[name]) for name in originals})
+        if link:
+            body = f"{body} {link}"
+
+        encoding = _get_encoding(body)
+        segments = _count_segments(body, encoding)
+        if segments <= max_segments:
+            break
+
+        longest = max(lengths, key=lengths.get, default=None)
+        if longest is None or lengths[longest] <= MIN_FIELD_LENGTH:
+            break
+        lengths[longest] -= 1
+
+    return ComposedSms(body, encoding, segments)
@@ -0,0 +1,125 @@
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from django.db import transaction
+from events.models import Event, Notification
+from payments.models import Tier
+from users.models import User
+from .build_notification_schedule import build_notification_schedule
+from .get_schedule_generation import get_schedule_generation
+
+SOCIAL_PLATFORMS = {
+    'Facebook': 'facebook_handle',
+    'Instagram': 'instagram_handle',
+    'Snapchat': 'snapchat_handle',
+    'X (Twitter)': 'x_handle',
+}
+
+
+def _build_admin_task(notification, admin_user, admin_tier, platform, handle):
+    """
+    Builds (but does not save) a single 'Admin Task' event for one social media handle.
+    """
+    original_user = notification.user
+    original_event = notification.event
+
+    # Prepare the notes for the admin task
+    notes_content = f"""
+    A manual social media post is required.
+
+    --------------------------------
+    Original User: {original_user.username} ({original_user.email})
+    Original Event: {original_event.name}
+    Original Event Date: {original_event.event_date.strftime('%Y-%m-%d')}
+    --------------------------------
+
+    Platform: {platform}
+    User's Handle: {handle}
+
+    Suggested Content:
+    "Friendly reminder from FutureReminder for {original_user.first_name} about their upcoming event: '{original_event.name}' on {original_event.event_date.strftime('%B %d, %Y')}!"
+    """
+
+    event_date = notification.scheduled_send_time.date()
+    weeks_in_advance = 1 # Give the admin a 1-week heads up
+
+    return Event(
+        user=admin_user,
+        tier=admin_tier,
+        source_notification=notification,
+        name=f"Manual Post for {original_user.username}: {platform}",
+        notes=notes_content.strip(),
+        event_date=event_date,
+        weeks_in_advance=weeks_in_advance,
+        # bulk_create bypasses Event.save(), so derive the start date and
+        # activation time here.
+        notification_start_date=event_date - timedelta(weeks=weeks_in_advance),
+        is_active=True,
+        activated_at=timezone.now()
+    )
+
+
+def create_admin_tasks_for_notifications(notifications) -> dict:
+    """
+    Creates 'Admin Task' events for a designated admin user from a batch of
+    'social_media' notifications.
+
+    The admin user and tier are looked up once for the whole batch. The task
+    events and their reminder notifications are then inserted with one bulk
+    insert each, instead of one Event.save() (and schedule) per task.
+
+    Args:
+        notifications: Notification instances with the 'social_media' channel,
+            with `user` and `event` already loaded.
+
+    Returns:
+        A dictionary mapping each notification's ID to the number of admin
+        tasks (Events) created for it.
+
+    Raises:
+        User.DoesNotExist: If the admin user is not configured.
+        Tier.DoesNotExist: If the 'Admin Task' tier is missing.
+    """
+    admin_user = User.objects.get(email=settings.ADMIN_EMAIL)
+    admin_tier = Tier.objects.get(name="Admin Task")
+
+    tasks_created = {}
+    task_events = []
+    for notification in notifications:
+        tasks_created[notification.pk] = 0
+        for platform, field_name in SOCIAL_PLATFORMS.items():
+            handle = getattr(notification.user, field_name)
+            if handle:
+                task_events.append(_build_admin_task(notification, admin_user, admin_tier, platform, handle))
+                tasks_created[notification.pk] += 1
+
+    if not task_events:
+        return tasks_created
+
+    # The tasks and their reminders are inserted together or not at all.
+    with transaction.atomic():
+        Event.objects.bulk_create(task_events)
+
+        # Not every database backend returns primary keys from a bulk insert, so
+        # reload the new tasks through their source notification.
+        if any(task.pk is None for task in task_events):
+            task_events = list(
+                Event.objects.filter(source_notification__in=list(tasks_created)).select_related('tier', 'user')
+            )
+
+        # Schedule the admin's reminders for each task in a single insert.
+        task_notifications = []
+        for task in task_events:
+            generation = get_schedule_generation(task)
+            for step_index, (channel, send_time) in enumerate(build_notification_schedule(task)):
+                task_notifications.append(Notification(
+                    event=task,
+                    user=admin_user,
+                    channel=channel,
+                    scheduled_send_time=send_time,
+                    step_index=step_index,
+                    generation=generation,
+                ))
+        Notification.objects.bulk_create(task_notifications, ignore_conflicts=True)
+
+    return tasks_created
@@ -0,0 +1,129 @@
+from collections import defaultdict
+from datetime import timedelta, datetime, time
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+from ..models import Event, Notification
+from .build_notification_schedule import build_notification_schedule
+
+FORECAST_CACHE_KEY = 'notification_forecast:{day}'
+FORECAST_CACHE_TIMEOUT = 60 * 15
+
+# Inactive events created within this window are considered candidates for
+# activation, weighted by the activation rate observed over the same window.
+ACTIVATION_LOOKBACK_DAYS = 90
+
+
+def _empty_day():
+    return {'scheduled': defaultdict(int), 'projected': defaultdict(float), 'hourly': defaultdict(lambda: defaultdict(float))}
+
+
+def _get_activation_rate(since) -> float:
+    """
+    Returns the fraction of events created since the given time that are active.
+    """
+    counts = Event.objects.filter(created_at__gte=since).aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(is_active=True))
+    )
+    if not counts['total']:
+        return 0.0
+    return counts['active'] / counts['total']
+
+
+def _compute_forecast(start_date, end_date) -> dict:
+    """
+    Computes the per-channel forecast for every day in [start_date, end_date).
+    """
+    tz = timezone.get_current_timezone()
+    range_start = timezone.make_aware(datetime.combine(start_date, time.min), tz)
+    range_end = timezone.make_aware(datetime.combine(end_date, time.min), tz)
+
+    days = defaultdict(_empty_day)
+
+    # 1. Materialised schedules: pending rows grouped by hour and channel.
+    # The plain datetime range keeps the (status, scheduled_send_time) index usable.
+    scheduled_counts = Notification.objects.filter(
+        status='pending',
+        scheduled_send_time__gte=range_start,
+        scheduled_send_time__lt=range_end
+    ).annotate(hour=TruncHour('scheduled_send_time')).values('hour', 'channel').annotate(count=Count('id'))
+
+    for item in scheduled_counts:
+        hour = timezone.localtime(item['hour'], tz)
+        day = days[hour.date()]
+        day['scheduled'][item['channel']] += item['count']
+        day['hourly'][hour.strftime('%H')][item['channel']] += item['count']
+
+    # 2. Unmaterialised schedules: recent inactive events, weighted by how likely
+    # they are to be activated.
+    lookback_start = timezone.now() - timedelta(days=ACTIVATION_LOOKBACK_DAYS)
+    activation_rate = _get_activation_rate(lookback_start)
+
+    if activation_rate > 0:
+        candidate_events = Event.objects.filter(
+            is_active=False,
+            tier__isnull=False,
+            created_at__gte=lookback_start,
+            notification_start_date__lt=end_date,
+            event_date__gte=start_date
+        ).select_related('tier', 'user')
+
+        for event in candidate_events.iterator():
+            for channel, send_time in build_notification_schedule(event):
+                if not range_start <= send_time < range_end:
+                    continue
+                local_time = timezone.localtime(send_time, tz)
+                day = days[local_time.date()]
+                day['projected'][channel] += activation_rate
+                day['hourly'][local_time.strftime('%H')][channel] += activation_rate
+
+    forecast = {}
+    current_date = start_date
+    while current_date < end_date:
+        day = days[current_date]
+        forecast[current_date] = {
+            'date': current_date.strftime('%Y-%m-%d'),
+            'scheduled': dict(day['scheduled']),
+            'projected': {channel: round(count, 2) for channel, count in day['projected'].items()},
+            'hourly': {
+                hour: {channel: round(count, 2) for channel, count in channels.items()}
+                for hour, channels in sorted(day['hourly'].items())
+            },
+        }
+        current_date += timedelta(days=1)
+
+    return forecast
+
+
+def forecast_notification_volume(days: int = 30, refresh: bool = False) -> list:
+    """
+    Forecasts daily and hourly send volume per channel for the next `days` days.
+
+    Each day combines the pending notifications already in the database with the
+    projected schedules of recent inactive events, weighted by the recent
+    activation rate. Days are cached individually, so a request only computes
+    the days that are missing from the cache.
+
+    Args:
+        days: The number of days to forecast, starting today.
+        refresh: If True, ignore cached days and recompute the whole range.
+
+    Returns:
+        A list of per-day dictionaries in date order.
+    """
+    today = timezone.localdate()
+    dates = [today + timedelta(days=i) for i in range(days)]
+    keys = {day: FORECAST_CACHE_KEY.format(day=day.isoformat()) for day in dates}
+
+    cached = {} if refresh else cache.get_many(list(keys.values()))
+    missing = [day for day in dates if keys[day] not in cached]
+
+    if missing:
+        computed = _compute_forecast(missing[0], missing[-1] + timedelta(days=1))
+        fresh = {keys[day]: computed[day] for day in missing}
+        cache.set_many(fresh, FORECAST_CACHE_TIMEOUT)
+        cached.update(fresh)
+
+    return [cached[keys[day]] for day in dates]
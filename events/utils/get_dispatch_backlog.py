@@ -0,0 +1,51 @@
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+from ..models import Notification
+
+
+def get_dispatch_backlog(now=None) -> dict:
+    """
+    Reads the due notifications the dispatcher has not sent yet, per channel.
+
+    This matches the notifications process_notifications picks up: pending
+    or failed, due by `now`, for a verified user and an unacknowledged
+    event, and not a social media task. The status and send time filters
+    use the (status, scheduled_send_time) index, so only the due rows are
+    read.
+
+    Pending and failed rows are counted separately. The lag is measured on
+    pending rows only: a failed row keeps its original send time while it
+    waits for a retry, so it would otherwise report a lag that grows for as
+    long as it keeps failing.
+
+    Args:
+        now: Optional. The time to measure against. Defaults to now.
+
+    Returns:
+        A dictionary mapping each channel with a backlog to {'count',
+        'oldest_due', 'lag_seconds', 'retrying'}, where `count` is the number
+        of due pending notifications, `lag_seconds` is how long the oldest of
+        them has been waiting (None if there are none), and `retrying` is the
+        number of failed notifications waiting for a retry.
+    """
+    now = now or timezone.now()
+    rows = Notification.objects.filter(
+        status__in=['pending', 'failed'],
+        scheduled_send_time__lte=now,
+        user__is_email_verified=True,
+        event__acknowledged_at__isnull=True
+    ).exclude(channel='social_media').values('channel').annotate(
+        count=Count('pk', filter=Q(status='pending')),
+        oldest_due=Min('scheduled_send_time', filter=Q(status='pending')),
+        retrying=Count('pk', filter=Q(status='failed')),
+    ).order_by('channel')
+
+    return {
+        row['channel']: {
+            'count': row['count'],
+            'oldest_due': row['oldest_due'],
+            'lag_seconds': (now - row['oldest_due']).total_seconds() if row['oldest_due'] else None,
+            'retrying': row['retrying'],
+        }
+        for row in rows
+    }
@@ -0,0 +1,47 @@
+import math
+from itertools import groupby
+from django.db.models import Sum
+from ..models import LatencyBucket
+from .record_latencies import bucket_upper_bound
+
+
+def get_latency_percentiles(since, percentiles=(50, 95, 99)) -> list:
+    """
+    Reads latency percentiles per metric, channel and provider from the
+    hourly histograms.
+
+    The buckets of every hour since `since` are summed in the database, so
+    the work is bounded by the number of buckets, not of messages. Each
+    percentile is reported as the upper bound of the bucket it falls in.
+
+    Args:
+        since: The start of the window. Histograms are kept per hour, so the
+               hour containing `since` is included in full.
+        percentiles: The percentiles to report.
+
+    Returns:
+        A list of dicts with the metric, channel, provider, the number of
+        observations and a 'p<N>_ms' value per percentile.
+    """
+    since = since.replace(minute=0, second=0, microsecond=0)
+    rows = LatencyBucket.objects.filter(hour__gte=since).values(
+        'metric', 'channel', 'provider', 'bucket'
+    ).annotate(total=Sum('count')).order_by('metric', 'channel', 'provider', 'bucket')
+
+    results = []
+    for (metric, channel, provider), buckets in groupby(rows, key=lambda row: (row['metric'], row['channel'], row['provider'])):
+        buckets = [(row['bucket'], row['total']) for row in buckets]
+        count = sum(total for _, total in buckets)
+        result = {'metric': metric, 'channel': channel, 'provider': provider, 'count': count}
+
+        for percentile in percentiles:
+            rank = max(math.ceil(count * percentile / 100), 1)
+            seen = 0
+            for bucket, total in buckets:
+                seen += total
+                if seen >= rank:
+                    result[f'p{percentile}_ms'] = round(bucket_upper_bound(bucket), 1)
+                    break
+        results.append(result)
+
+    return results
@@ -0,0 +1,26 @@
+import json
+import zlib
+
+
+def get_schedule_generation(event: 'Event') -> int:
+    """
+    Returns a fingerprint of the inputs that define an event's schedule.
+
+    Two saves that would produce the same schedule get the same generation,
+    so their notification steps collide on the unique (event, step_index,
+    generation) constraint instead of being inserted twice. Changing the tier,
+    its manifest or the event's dates starts a new generation.
+
+    Args:
+        event: The Event instance being scheduled.
+
+    Returns:
+        A non-negative 31-bit integer.
+    """
+    inputs = json.dumps([
+        event.tier_id,
+        event.tier.manifest if event.tier else None,
+        event.event_date.isoformat() if event.event_date else None,
+        event.notification_start_date.isoformat() if event.notification_start_date else None,
+    ])
+    return zlib.crc32(inputs.encode('utf-8')) & 0x7fffffff
@@ -0,0 +1,59 @@
+import hashlib
+from datetime import timedelta
+from django.conf import settings
+
+
+def _get_send_window(user) -> tuple:
+    """
+    Returns the (start, length) of the daily send window for a user as timedeltas.
+    The user's preferred window is used when both ends are set, otherwise the
+    site-wide window from settings.
+    """
+    start = getattr(user, 'send_window_start', None)
+    end = getattr(user, 'send_window_end', None)
+    if start and end:
+        window_start = timedelta(hours=start.hour, minutes=start.minute)
+        window_end = timedelta(hours=end.hour, minutes=end.minute)
+        return window_start, max(window_end - window_start, timedelta(0))
+
+    window_start_hour = getattr(settings, 'NOTIFICATION_SEND_WINDOW_START_HOUR', 9)
+    window_minutes = getattr(settings, 'NOTIFICATION_SEND_WINDOW_MINUTES', 8 * 60)
+    return timedelta(hours=window_start_hour), timedelta(minutes=window_minutes)
+
+
+def get_send_time_offset(event: 'Event', window: tuple = None) -> timedelta:
+    """
+    Returns a stable offset from local midnight at which an event's notifications
+    should be sent.
+
+    Instead of every notification falling due at midnight, each event is assigned
+    a slot inside the user's send window. The slot is derived from a hash of
+    the user and event IDs, so rescheduling an event always lands on the same
+    slot. Every notification of an event shares the slot, which keeps the
+    escalation order within the event unchanged.
+
+    Args:
+        event: The Event instance being scheduled.
+        window: An optional (start, end) pair in minutes past midnight that
+            overrides the user's send window, e.g. for a single manifest step.
+
+    Returns:
+        A timedelta between the window start and the window end.
+    """
+    slot_minutes = getattr(settings, 'NOTIFICATION_SEND_SLOT_MINUTES', 5)
+    if window:
+        window_start = timedelta(minutes=window[0])
+        window_length = timedelta(minutes=window[1] - window[0])
+    else:
+        window_start, window_length = _get_send_window(event.user)
+
+    window_minutes = int(window_length.total_seconds() // 60)
+    total_slots = window_minutes // slot_minutes if slot_minutes > 0 else 0
+    if total_slots <= 0:
+        return window_start
+
+    seed = f"{event.user_id}:{event.pk}".encode('utf-8')
+    digest = hashlib.sha256(seed).digest()
+    slot = int.from_bytes(digest[:8], 'big') % total_slots
+
+    return window_start + timedelta(minutes=slot * slot_minutes)
@@ -0,0 +1,16 @@
+from twilio.rest import Client
+from django.conf import settings
+
+
+def get_twilio_client() -> Client:
+    """
+    Returns a Twilio REST client for the configured account.
+
+    If TWILIO_API_BASE_URL is set, requests are sent there instead of
+    https://api.twilio.com, which allows running against a local stub server.
+    """
+    client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+    base_url = getattr(settings, 'TWILIO_API_BASE_URL', None)
+    if base_url:
+        client.api.base_url = base_url
+    return client
@@ -0,0 +1,29 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from ..models import NotificationDailyStats
+from .summarize_status_events import summarize_status_events
+
+
+def increment_notification_daily_stats(entries):
+    """
+    Adds status transitions to the daily rollup.
+
+    Each (day, channel, status) is incremented with one UPDATE of its
+    counters, so concurrent workers add to the same row without losing
+    counts. A missing row is inserted; if another worker inserted it first,
+    the increment is applied to that row instead.
+
+    Args:
+        entries: The transitions to add, as accepted by summarize_status_events.
+    """
+    for (day, channel, status), totals in summarize_status_events(entries).items():
+        rows = NotificationDailyStats.objects.filter(day=day, channel=channel, status=status)
+        increments = {field: F(field) + value for field, value in totals.items()}
+
+        if rows.update(**increments):
+            continue
+        try:
+            with transaction.atomic():
+                NotificationDailyStats.objects.create(day=day, channel=channel, status=status, **totals)
+        except IntegrityError:
+            rows.update(**increments)
@@ -0,0 +1,67 @@
+from events.models import Notification
+from payments.models import Tier
+from users.models import User
+from collections import defaultdict
+from django.db import transaction
+from .create_admin_tasks_for_notifications import create_admin_tasks_for_notifications
+from .transition_notifications import transition_notifications
+
+
+def process_admin_task_notifications(batch_size: int = 200) -> int:
+    """
+    Turns pending 'social_media' notifications into admin tasks in batches.
+
+    This runs as a deferred job from the dispatcher, so scheduling an event
+    never creates admin tasks inline. Each processed notification is moved to
+    'admin_task_created', or to 'failed' if the user has no social media
+    handles. If the admin user or tier is not configured, the notifications
+    are left pending so they are picked up once it is.
+
+    Each batch is locked and handled in one transaction, so concurrent runs
+    never create the same tasks and a failure part way leaves nothing behind.
+
+    Args:
+        batch_size: The number of notifications handled per batch.
+
+    Returns:
+        The number of notifications processed.
+    """
+    processed = 0
+    last_pk = 0
+
+    while True:
+        try:
+            # The task events, their reminders and the status change are
+            # committed together, and the locked batch is skipped by any
+            # other run, so a notification never gets its tasks twice.
+            with transaction.atomic():
+                batch = list(
+                    Notification.objects.select_for_update(skip_locked=True, of=('self',)).filter(
+                        channel='social_media',
+                        status='pending',
+                        pk__gt=last_pk
+                    ).select_related('event', 'user').order_by('pk')[:batch_size]
+                )
+                if not batch:
+                    break
+                last_pk = batch[-1].pk
+
+                tasks_created = create_admin_tasks_for_notifications(batch)
+
+                # Group by outcome so each distinct outcome is one conditional UPDATE.
+                outcomes = defaultdict(list)
+                for notification in batch:
+                    count = tasks_created.get(notification.pk, 0)
+                    if count > 0:
+                        outcomes[('admin_task_created', f"Successfully generated {count} admin task(s).")].append(notification.pk)
+                    else:
+                        outcomes[('failed', "User has no social media handles specified.")].append(notification.pk)
+
+                for (status, failure_reason), pks in outcomes.items():
+                    transition_notifications(Notification.objects.filter(pk__in=pks), status, failure_reason=failure_reason)
+        except (User.DoesNotExist, Tier.DoesNotExist) as e:
+            print(f"Skipping admin task generation, admin user or tier is not configured: {e}")
+            break
+        processed += len(batch)
+
+    return processed
@@ -0,0 +1,104 @@
+from collections import defaultdict
+from functools import reduce
+from operator import or_
+from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.utils import timezone
+from ..models import Notification, NotificationDelivery, DeliveryCallback
+from .transition_notifications import transition_notifications, TIMESTAMP_FIELDS
+
+# Fan-out notifications are resolved per recipient through their deliveries.
+FANOUT_CHANNELS = ['all_backup_emails', 'all_emergency_contact_emails', 'all_emergency_contact_sms']
+
+# The notification status for each callback status. A failure reported by the
+# provider (a bounce or an undelivered SMS) is terminal, unlike a failed send,
+# so the dispatcher does not retry it.
+CALLBACK_STATUSES = {
+    'delivered': 'delivered',
+    'failed': 'undeliverable',
+}
+
+
+def _coalesce(callbacks) -> dict:
+    """
+    Reduces a batch of callbacks to the last terminal status per message and
+    recipient, grouped by (status, failure_reason) so each group can be
+    applied with a single UPDATE.
+    """
+    final = {}
+    for callback in callbacks:
+        if callback['status']:
+            key = (callback['message_sid'], callback['recipient'])
+            status = CALLBACK_STATUSES[callback['status']]
+            final[key] = (status, callback['failure_reason'] if status == 'undeliverable' else None)
+
+    grouped = defaultdict(list)
+    for key, outcome in final.items():
+        grouped[outcome].append(key)
+    return grouped
+
+
+def process_delivery_callbacks(batch_size: int = 1000) -> int:
+    """
+    Applies staged provider callbacks to notifications and fan-out deliveries.
+
+    Callbacks are read in arrival order in batches. Within a batch, only the
+    last terminal status per message is applied, and every distinct outcome
+    is written with one set-based UPDATE through the message_sid index.
+
+    Args:
+        batch_size: The number of callbacks to read per batch.
+
+    Returns:
+        The number of callbacks processed.
+    """
+    processed = 0
+
+    while True:
+        callbacks = list(
+            DeliveryCallback.objects.filter(processed_at__isnull=True)
+            .order_by('id')
+            .values('id', 'message_sid', 'recipient', 'status', 'failure_reason')[:batch_size]
+        )
+        if not callbacks:
+            break
+
+        now = timezone.now()
+        with transaction.atomic():
+            for (status, failure_reason), keys in _coalesce(callbacks).items():
+                # The transition table keeps late or replayed callbacks from
+                # overwriting a resolved status, e.g. 'undeliverable' after 'delivered'.
+                transition_notifications(
+                    Notification.objects.filter(
+                        message_sid__in={message_sid for message_sid, _ in keys}
+                    ).exclude(channel__in=FANOUT_CHANNELS),
+                    status,
+                    failure_reason=failure_reason,
+                    # Record when the provider reported the outcome, not when it was applied.
+                    **{TIMESTAMP_FIELDS[status]: Subquery(
+                        DeliveryCallback.objects.filter(
+                            message_sid=OuterRef('message_sid'),
+                            status__in=[key for key, value in CALLBACK_STATUSES.items() if value == status],
+                            processed_at__isnull=True
+                        ).order_by('-id').values('received_at')[:1]
+                    )}
+                )
+
+                # Batch emails share one ID across recipients, so match on both when known.
+                delivery_filter = reduce(or_, [
+                    Q(message_sid=message_sid, recipient=recipient) if recipient else Q(message_sid=message_sid)
+                    for message_sid, recipient in keys
+                ])
+                NotificationDelivery.objects.filter(delivery_filter, status='sent').update(
+                    status=status,
+                    failure_reason=failure_reason,
+                    updated_at=now
+                )
+
+            DeliveryCallback.objects.filter(id__in=[callback['id'] for callback in callbacks]).update(processed_at=now)
+
+        processed += len(callbacks)
+        if len(callbacks) < batch_size:
+            break
+
+    return processed
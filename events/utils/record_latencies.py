@@ -0,0 +1,67 @@
+import math
+from collections import Counter
+from datetime import timezone as dt_timezone
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from ..models import LatencyBucket
+
+# Each doubling of the latency is split into this many buckets, so a bucket's
+# upper bound is at most ~19% above any latency counted in it.
+SUB_BUCKETS_PER_DOUBLING = 4
+# Bucket 0 holds everything under 1 ms; the last bucket everything above ~12 days.
+MAX_BUCKET = 1 + 30 * SUB_BUCKETS_PER_DOUBLING
+
+
+def get_channel_provider(channel: str):
+    """Returns the provider a channel is sent through, or None for manual channels."""
+    if 'sms' in channel:
+        return 'twilio'
+    if 'email' in channel:
+        return 'mailgun'
+    return None
+
+
+def latency_bucket(milliseconds: float) -> int:
+    """Returns the logarithmic bucket a latency in milliseconds is counted in."""
+    if milliseconds < 1:
+        return 0
+    return min(1 + int(math.log2(milliseconds) * SUB_BUCKETS_PER_DOUBLING), MAX_BUCKET)
+
+
+def bucket_upper_bound(bucket: int) -> float:
+    """Returns the largest latency, in milliseconds, counted in a bucket."""
+    if bucket == 0:
+        return 1.0
+    return 2 ** (bucket / SUB_BUCKETS_PER_DOUBLING)
+
+
+def record_latencies(observations):
+    """
+    Adds latency observations to the hourly histograms.
+
+    Observations are counted per hour, series and bucket first, so each
+    bucket row is incremented with one UPDATE however many observations
+    fall into it. A missing row is inserted; if another worker inserted it
+    first, the increment is applied to that row instead.
+
+    Args:
+        observations: Tuples of (metric, channel, observed_at, milliseconds).
+                      Channels without a provider are ignored.
+    """
+    counts = Counter()
+    for metric, channel, observed_at, milliseconds in observations:
+        provider = get_channel_provider(channel)
+        if provider is None or milliseconds is None:
+            continue
+        hour = observed_at.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+        counts[(hour, metric, channel, provider, latency_bucket(milliseconds))] += 1
+
+    for (hour, metric, channel, provider, bucket), count in counts.items():
+        rows = LatencyBucket.objects.filter(hour=hour, metric=metric, channel=channel, provider=provider, bucket=bucket)
+        if rows.update(count=F('count') + count):
+            continue
+        try:
+            with transaction.atomic():
+                LatencyBucket.objects.create(hour=hour, metric=metric, channel=channel, provider=provider, bucket=bucket, count=count)
+        except IntegrityError:
+            rows.update(count=F('count') + count)
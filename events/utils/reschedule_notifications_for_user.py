@@ -0,0 +1,58 @@
+from datetime import datetime, time
+from django.utils import timezone
+from ..models import Notification
+from .get_send_time_offset import get_send_time_offset
+from .build_notification_schedule import get_step_send_offsets
+from users.utils.get_user_timezone import get_user_timezone
+
+
+def reschedule_notifications_for_user(user, previous_timezone=None, batch_size=500) -> int:
+    """
+    Recomputes the send times of all pending notifications for a user after
+    their timezone or send window has changed.
+
+    Each notification keeps its local calendar day (as seen in the previous
+    timezone) and is moved onto its step's send slot in the user's current
+    timezone: a slot in the step's own window if the tier manifest gives it
+    one, otherwise the event's slot in the user's window. The rows are written back with bulk updates rather than by
+    regenerating each event's schedule.
+
+    Args:
+        user: The User whose notifications should be rescheduled.
+        previous_timezone: The tzinfo the existing times were computed in.
+            Defaults to the user's current timezone.
+        batch_size: The number of rows written per UPDATE batch.
+
+    Returns:
+        The number of notifications rescheduled.
+    """
+    new_tz = get_user_timezone(user)
+    old_tz = previous_timezone or new_tz
+
+    pending_notifications = Notification.objects.filter(
+        user=user,
+        status='pending'
+    ).select_related('event__tier')
+
+    step_offsets = {}
+    event_offsets = {}
+    to_update = []
+    for notification in pending_notifications.iterator(chunk_size=batch_size):
+        event = notification.event
+        if event.pk not in event_offsets:
+            event.user = user
+            event_offsets[event.pk] = get_send_time_offset(event)
+            step_offsets[event.pk] = get_step_send_offsets(event)
+
+        offset = event_offsets[event.pk]
+        steps = step_offsets[event.pk]
+        if notification.step_index is not None and notification.step_index < len(steps):
+            offset = steps[notification.step_index]
+
+        local_date = notification.scheduled_send_time.astimezone(old_tz).date()
+        send_time_naive = datetime.combine(local_date, time.min) + offset
+        notification.scheduled_send_time = timezone.make_aware(send_time_naive, new_tz)
+        to_update.append(notification)
+
+    Notification.objects.bulk_update(to_update, ['scheduled_send_time'], batch_size=batch_size)
+    return len(to_update)
@@ -1,8 +1,9 @@
-from datetime import timedelta, datetime, time
-from django.utils import timezone
-from ..models import Event
+from django.db import transaction
+from ..models import Event, Notification
 from .clear_pending_notifications import clear_pending_notifications
-from ._create_notification import _create_notification
+from .cancel_scheduled_notifications import cancel_scheduled_notifications
+from .build_notification_schedule import build_notification_schedule
+from .get_schedule_generation import get_schedule_generation
 
 # The single source of truth for notification schedules per tier.
 # The order defines the escalation hierarchy (cheapest first).
@@ -36,52 +37,79 @@ TIER_MANIFESTS = {
 
 def schedule_notifications_for_event(event: 'Event'):
     """
-    Generates an evenly-distributed notification schedule for a given event
-    based on the 'Manifest and Interval' approach.
+    Generates the notification schedule for a given event based on the
+    'Manifest and Interval' approach.
+
+    Scheduling is an idempotent upsert under a per-event row lock. Each step
+    of the schedule is identified by its (step_index, generation), so
+    re-saving an event only inserts steps that are missing, moves pending
+    steps whose time changed, and never re-creates steps that were already
+    sent. Pending steps from an older generation are discarded, and steps of
+    an older generation that were pre-submitted to a provider are cancelled.
+    An acknowledgement only covers the generation it was given for, so a new
+    date or tier clears it and the new schedule is sent.
 
     This function should be called whenever an event is created or updated.
     """
-    # 1. Clear any existing pending notifications for this event
-    clear_pending_notifications(event)
-    print(f"Cleared pending notifications for event ID {event.id}")
+    with transaction.atomic():
+        # 1. Serialise concurrent schedulers for this event (e.g. the Stripe
+        # webhook racing a user edit).
+        list(Event.objects.select_for_update().filter(pk=event.pk).values_list('pk', flat=True))
+
+        generation = get_schedule_generation(event)
+        if event.acknowledged_at and event.acknowledged_generation != generation:
+            # The schedule changed since the acknowledgement, e.g. the event moved to a new date.
+            Event.objects.filter(pk=event.pk).update(acknowledged_at=None, acknowledged_generation=None)
+            event.acknowledged_at = event.acknowledged_generation = None
+
+        # 2. Basic validation. Acknowledged events have finished their escalation.
+        if not all([event.is_active, event.tier, event.notification_start_date, event.event_date]) or \
+           event.notification_start_date >= event.event_date or event.acknowledged_at:
+            clear_pending_notifications(event)
+            cancel_scheduled_notifications(Notification.objects.filter(event=event))
+            print(f"Skipping notification scheduling for event ID {event.id} due to invalid state.")
+            return
+
+        # 3. Build the schedule from the event's tier manifest
+        schedule = build_notification_schedule(event)
 
-    # 2. Basic validation
-    if not all([event.is_active, event.tier, event.notification_start_date, event.event_date]) or \
-       event.notification_start_date >= event.event_date:
-        print(f"Skipping notification scheduling for event ID {event.id} due to invalid state.")
-        return
+        # 4. Discard pending steps that belong to any other schedule generation
+        Notification.objects.filter(event=event, status='pending').exclude(generation=generation).delete()
+        cancel_scheduled_notifications(Notification.objects.filter(event=event).exclude(generation=generation))
 
-    # 3. Get the manifest from the event's tier
-    manifest = event.tier.manifest
-    if not manifest:
-        # Log this event? For now, we just stop.
-        return
+        if not schedule:
+            print(f"No notifications scheduled for event ID {event.id} (manifest is empty).")
+            return
 
-    # 4. Calculate timing intervals
-    total_duration = event.event_date - event.notification_start_date
-    total_notifications = len(manifest)
+        existing_steps = {
+            n.step_index: n for n in Notification.objects.filter(
+                event=event,
+                generation=generation,
+                step_index__isnull=False
+            )
+        }
 
-    if total_notifications == 0:
-        print(f"No notifications scheduled for event ID {event.id} (manifest is empty).")
-        return
-    
-    # If there's only one notification, schedule it at the start.
-    # Otherwise, calculate the interval to spread them out.
-    interval = total_duration / total_notifications if total_notifications > 1 else timedelta(0)
+        # 5. Upsert each step of the schedule
+        to_create = []
+        to_update = []
+        for step_index, (channel, send_time) in enumerate(schedule):
+            existing = existing_steps.get(step_index)
+            if existing is None:
+                # Social media steps stay pending until the dispatcher turns
+                # them into admin tasks in a batch.
+                to_create.append(Notification(
+                    event=event,
+                    user=event.user,
+                    channel=channel,
+                    scheduled_send_time=send_time,
+                    step_index=step_index,
+                    generation=generation,
+                ))
+                print(f"Scheduled {channel} notification for event ID {event.id} at {send_time.isoformat()}")
+            elif existing.status == 'pending' and existing.scheduled_send_time != send_time:
+                existing.scheduled_send_time = send_time
+                to_update.append(existing)
 
-    # 5. Create notifications based on the manifest
-    for i, channel in enumerate(manifest):
-        # Calculate the target date for the notification
-        target_date = event.notification_start_date + (interval * i)
-        
-        # Combine date with midnight time and make it timezone-aware
-        send_time_naive = datetime.combine(target_date, time.min)
-        send_time_aware = timezone.make_aware(send_time_naive, timezone.get_current_timezone())
-        
-        # Schedule the notification. The helper is simple and doesn't need contact info.
-        _create_notification(
-            event=event,
-            channel=channel,
-            send_time=send_time_aware
-        )
-        print(f"Scheduled {channel} notification for event ID {event.id} at {send_time_aware.isoformat()}")
+        # ignore_conflicts makes a racing insert of the same step a no-op.
+        Notification.objects.bulk_create(to_create, ignore_conflicts=True)
+        Notification.objects.bulk_update(to_update, ['scheduled_send_time'])
@@ -0,0 +1,89 @@
+import requests
+import json
+from django.template.loader import render_to_string
+from django.conf import settings
+from data_management.models import BlockedEmail
+from data_management.views.add_to_blocklist_view import signer # Import the signer
+from events.views.acknowledgement_view import acknowledgement_signer
+from typing import Union
+
+
+def send_digest_email(notifications: list, recipient_address: str) -> Union[str, bool]:
+    """
+    Sends one combined reminder email for several notifications that are due
+    to the same recipient on the same day, using the Mailgun API.
+
+    Each event in the digest gets its own acknowledgement link, so the user
+    can still stop each escalation chain independently.
+
+    Args:
+        notifications: The Notification instances to combine. All belong to the same user.
+        recipient_address: The email address to send the digest to.
+
+    Returns:
+        The message ID if the email was sent successfully, False otherwise.
+    """
+    # --- Blocklist Check ---
+    if BlockedEmail.objects.filter(email=recipient_address).exists():
+        print(f"Email to {recipient_address} suppressed because it is on the blocklist.")
+        return False # Returning False because the email was not sent.
+
+    if not notifications or not recipient_address:
+        return False
+
+    user = notifications[0].user
+
+    try:
+        # 1. Construct a unique acknowledgement URL per event
+        items = []
+        for notification in notifications:
+            acknowledgement_token = acknowledgement_signer.sign(str(notification.pk))
+            items.append({
+                'event': notification.event,
+                'acknowledgement_url': f"{settings.SITE_URL}/api/events/acknowledge/{acknowledgement_token}/",
+            })
+
+        # 2. Construct the unique blocklist URL
+        signed_email = signer.sign(recipient_address)
+        unsubscribe_url = f"{settings.SITE_URL}/api/data/blocklist/block/{signed_email}/"
+
+        # 3. Prepare the context and render the templates
+        context = {
+            'user': user,
+            'items': items,
+            'site_url': settings.SITE_URL,
+            'unsubscribe_url': unsubscribe_url,
+        }
+        subject = f"Reminder: {len(items)} upcoming events"
+        html_content = render_to_string("notifications/emails/event_digest.html", context)
+        text_content = render_to_string("notifications/emails/event_digest.txt", context)
+
+        # 4. Prepare webhook data
+        webhook_data = {'notification_ids': [notification.pk for notification in notifications]}
+
+        # 5. Send the email using Mailgun API
+        data = {"from": settings.DEFAULT_FROM_EMAIL,
+                "to": [recipient_address],
+                "subject": subject,
+                "text": text_content,
+                "html": html_content,
+                "h:X-Mailgun-Variables": json.dumps(webhook_data)}
+
+        response = requests.post(
+            f"{settings.MAILGUN_API_BASE_URL}/{settings.MAILGUN_DOMAIN}/messages",
+            auth=("api", settings.MAILGUN_API_KEY),
+            data=data)
+
+        response.raise_for_status() # Raise an HTTPError for bad responses (4xx or 5xx)
+
+        message_id = response.json().get('id')
+
+        # Mailgun message IDs are often enclosed in <>. We strip them for cleaner storage.
+        if message_id:
+            return message_id.strip('<>')
+
+        return False
+
+    except Exception as e:
+        # Re-raise the exception to be handled by the dispatcher
+        raise e
@@ -0,0 +1,67 @@
+from datetime import datetime
+from django.conf import settings
+from typing import Union
+from .get_twilio_client import get_twilio_client
+from .compose_sms import compose_sms
+from events.views.acknowledgement_view import make_short_digest_acknowledgement_code
+
+def send_digest_sms(notifications: list, recipient_phone_number: str, send_at: datetime = None) -> Union[str, bool]:
+    """
+    Sends one combined reminder SMS for several notifications that are due to
+    the same phone number on the same day, using the Twilio API.
+
+    The message ends with one short acknowledgement link that acknowledges
+    every event in the digest, as there is no room for a link per event.
+    Event names are shortened as needed to fit SMS_SEGMENT_BUDGET. The
+    message's segment count is stored on the first notification's
+    `sms_segments` and the rest are set to 0, so summing the field counts
+    each billable segment once.
+
+    Args:
+        notifications: The Notification instances to combine.
+        recipient_phone_number: The phone number to send the digest to.
+        send_at: Optional. When given, Twilio schedules the message for this time.
+
+    Returns:
+        The Message SID if the SMS was sent successfully, False otherwise.
+    """
+    if not notifications or not recipient_phone_number:
+        return False
+
+    try:
+        # 1. Construct the message, one line per event and a short acknowledgement
+        # link. The header is kept short so two events and the link fit in one segment.
+        event_lines = [f"- {{name{i}}} on {n.event.event_date}" for i, n in enumerate(notifications)]
+        acknowledgement_url = f"{settings.SITE_URL}/api/events/ack/all/{make_short_digest_acknowledgement_code(notifications[0].pk)}/"
+        composed = compose_sms(
+            "FutureReminder:\n" + "\n".join(event_lines) + "\nMark all done:",
+            fields={f"name{i}": n.event.name for i, n in enumerate(notifications)},
+            link=acknowledgement_url
+        )
+        for i, notification in enumerate(notifications):
+            notification.sms_segments = composed.segments if i == 0 else 0
+
+        # 2. Construct the full webhook URL
+        status_callback_url = f"{settings.SITE_URL}/api/events/webhooks/twilio/status/"
+
+        # 3. Send the SMS using Twilio API
+        client = get_twilio_client()
+
+        # Scheduled messages must be sent through a Messaging Service.
+        schedule = {'send_at': send_at, 'schedule_type': 'fixed'} if send_at else {}
+
+        message = client.messages.create(
+            body=composed.body,
+            messaging_service_sid=settings.TWILIO_MESSAGING_SERVICE_SID,
+            to=recipient_phone_number,
+            status_callback=status_callback_url,
+            **schedule
+        )
+
+        # 4. Return the SID on success
+        return message.sid or False
+
+    except Exception as e:
+        # The exception will be caught by the dispatcher,
+        # so we can just re-raise it to be handled there.
+        raise e
@@ -0,0 +1,88 @@
+import requests
+import json
+from django.template.loader import render_to_string
+from django.conf import settings
+from data_management.models import BlockedEmail
+from data_management.views.add_to_blocklist_view import signer # Import the signer
+from events.views.acknowledgement_view import acknowledgement_signer
+
+
+def send_fanout_email(notification: 'Notification', recipient_addresses: list) -> dict:
+    """
+    Sends one event reminder email to several recipients in a single Mailgun
+    batch call.
+
+    Mailgun's batch sending delivers a separate copy to each address, so
+    recipients never see each other. Each copy gets its own unsubscribe link
+    through Mailgun recipient variables.
+
+    Args:
+        notification: The fan-out Notification instance to be sent.
+        recipient_addresses: The email addresses to send the reminder to.
+
+    Returns:
+        A dictionary mapping each address to {'message_sid', 'failure_reason',
+        'skipped'}. The whole batch shares one message ID. Addresses on the
+        blocklist are not sent to and are marked as skipped.
+    """
+    blocked = set(BlockedEmail.objects.filter(email__in=recipient_addresses).values_list('email', flat=True))
+    results = {
+        address: {'message_sid': None, 'failure_reason': "Recipient is on the blocklist.", 'skipped': True}
+        for address in blocked
+    }
+    addresses = [address for address in recipient_addresses if address not in blocked]
+    if not addresses:
+        return results
+
+    try:
+        # 1. Construct the unique acknowledgement URL
+        acknowledgement_token = acknowledgement_signer.sign(str(notification.pk))
+        acknowledgement_url = f"{settings.SITE_URL}/api/events/acknowledge/{acknowledgement_token}/"
+
+        # 2. Construct a blocklist URL per recipient, filled in by Mailgun
+        recipient_variables = {
+            address: {'unsubscribe_url': f"{settings.SITE_URL}/api/data/blocklist/block/{signer.sign(address)}/"}
+            for address in addresses
+        }
+
+        # 3. Prepare the context and render the templates
+        context = {
+            'user': notification.user,
+            'event': notification.event,
+            'acknowledgement_url': acknowledgement_url,
+            'site_url': settings.SITE_URL,
+            'unsubscribe_url': '%recipient.unsubscribe_url%',
+        }
+        subject = f"Reminder: {notification.event.name}"
+        html_content = render_to_string("notifications/emails/event_reminder.html", context)
+        text_content = render_to_string("notifications/emails/event_reminder.txt", context)
+
+        # 4. Send the batch using Mailgun API
+        data = {"from": settings.DEFAULT_FROM_EMAIL,
+                "to": addresses,
+                "subject": subject,
+                "text": text_content,
+                "html": html_content,
+                "recipient-variables": json.dumps(recipient_variables),
+                "h:X-Mailgun-Variables": json.dumps({'notification_id': notification.pk})}
+
+        response = requests.post(
+            f"{settings.MAILGUN_API_BASE_URL}/{settings.MAILGUN_DOMAIN}/messages",
+            auth=("api", settings.MAILGUN_API_KEY),
+            data=data)
+
+        response.raise_for_status() # Raise an HTTPError for bad responses (4xx or 5xx)
+
+        message_id = response.json().get('id')
+        if not message_id:
+            raise Exception("Mailgun did not return a message ID.")
+
+        # Mailgun message IDs are often enclosed in <>. We strip them for cleaner storage.
+        for address in addresses:
+            results[address] = {'message_sid': message_id.strip('<>'), 'failure_reason': None, 'skipped': False}
+
+    except Exception as e:
+        for address in addresses:
+            results[address] = {'message_sid': None, 'failure_reason': str(e), 'skipped': False}
+
+    return results
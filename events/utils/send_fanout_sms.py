@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from django.conf import settings
+from .send_reminder_sms import send_reminder_sms
+
+
+def send_fanout_sms(notification: 'Notification', recipient_phone_numbers: list, send_at: datetime = None) -> dict:
+    """
+    Sends one event reminder SMS to several phone numbers.
+
+    Twilio has no batch endpoint, so the messages are sent concurrently,
+    with at most NOTIFICATION_FANOUT_MAX_WORKERS requests in flight. The
+    notification's `sms_segments` is set to the total across all messages
+    that were sent.
+
+    Args:
+        notification: The fan-out Notification instance to be sent.
+        recipient_phone_numbers: The phone numbers to send the reminder to.
+        send_at: Optional. When given, Twilio schedules the messages for this time.
+
+    Returns:
+        A dictionary mapping each phone number to {'message_sid', 'failure_reason',
+        'skipped'}.
+    """
+    if not recipient_phone_numbers:
+        return {}
+
+    def _send(phone_number):
+        try:
+            sid = send_reminder_sms(notification, phone_number, send_at=send_at)
+            if not sid:
+                raise Exception("Sending function returned a falsy value.")
+            return phone_number, {'message_sid': sid, 'failure_reason': None, 'skipped': False}
+        except Exception as e:
+            return phone_number, {'message_sid': None, 'failure_reason': str(e), 'skipped': False}
+
+    max_workers = min(getattr(settings, 'NOTIFICATION_FANOUT_MAX_WORKERS', 4), len(recipient_phone_numbers))
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        results = dict(executor.map(_send, recipient_phone_numbers))
+
+    # Every copy has the same body, so each successful send uses the same number of segments.
+    sent_count = sum(1 for result in results.values() if result['message_sid'])
+    notification.sms_segments = (notification.sms_segments or 0) * sent_count if sent_count else None
+
+    return results
@@ -4,6 +4,7 @@ from django.template.loader import render_to_string
 from django.conf import settings
 from data_management.models import BlockedEmail
 from data_management.views.add_to_blocklist_view import signer # Import the signer
+from events.views.acknowledgement_view import acknowledgement_signer
 from typing import Union
 
 
@@ -32,7 +33,8 @@ def send_reminder_email(notification: 'Notification', recipient_address: str) ->
 
     try:
         # 1. Construct the unique acknowledgement URL
-        acknowledgement_url = f"{settings.SITE_URL}/events/acknowledge/{notification.pk}/"
+        acknowledgement_token = acknowledgement_signer.sign(str(notification.pk))
+        acknowledgement_url = f"{settings.SITE_URL}/api/events/acknowledge/{acknowledgement_token}/"
 
         # 2. Construct the unique blocklist URL
         signed_email = signer.sign(recipient_address)
@@ -59,15 +61,17 @@ def send_reminder_email(notification: 'Notification', recipient_address: str) ->
         webhook_data = {'notification_id': notification.pk}
 
         # 6. Send the email using Mailgun API
+        data = {"from": settings.DEFAULT_FROM_EMAIL,
+                "to": [recipient_address],
+                "subject": subject,
+                "text": text_content,
+                "html": html_content,
+                "h:X-Mailgun-Variables": json.dumps(webhook_data)}
+
         response = requests.post(
-            f"https://api.mailgun.net/v3/{settings.MAILGUN_DOMAIN}/messages",
+            f"{settings.MAILGUN_API_BASE_URL}/{settings.MAILGUN_DOMAIN}/messages",
             auth=("api", settings.MAILGUN_API_KEY),
-            data={"from": settings.DEFAULT_FROM_EMAIL,
-                  "to": [recipient_address],
-                  "subject": subject,
-                  "text": text_content,
-                  "html": html_content,
-                  "h:X-Mailgun-Variables": json.dumps(webhook_data)})
+            data=data)
 
         response.raise_for_status() # Raise an HTTPError for bad responses (4xx or 5xx)
 
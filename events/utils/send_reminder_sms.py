@@ -1,16 +1,22 @@
-from twilio.rest import Client
+from datetime import datetime
 from django.conf import settings
 from typing import Union
+from .get_twilio_client import get_twilio_client
+from .compose_sms import compose_sms
+from events.views.acknowledgement_view import make_short_acknowledgement_code
 
-def send_reminder_sms(notification: 'Notification', recipient_phone_number: str) -> Union[str, bool]:
+def send_reminder_sms(notification: 'Notification', recipient_phone_number: str, send_at: datetime = None) -> Union[str, bool]:
     """
     Sends a single event reminder SMS based on a Notification object using Twilio API.
 
-    This function constructs the SMS and sends it via Twilio.
+    This function constructs the SMS and sends it via Twilio. The body is
+    composed to fit SMS_SEGMENT_BUDGET and its segment count is stored on
+    the notification's `sms_segments` for the caller to save.
 
     Args:
         notification: The Notification instance to be sent.
         recipient_phone_number: The phone number to send the reminder to.
+        send_at: Optional. When given, Twilio schedules the message for this time.
 
     Returns:
         The Message SID if the SMS was sent successfully, False otherwise.
@@ -20,20 +26,30 @@ def send_reminder_sms(notification: 'Notification', recipient_phone_number: str)
         return False
 
     try:
-        # 1. Construct the message
-        message_body = f"Reminder from FutureReminder: {notification.event.name} on {notification.event.event_date}."
-        
+        # 1. Construct the message, with a short acknowledgement link
+        acknowledgement_url = f"{settings.SITE_URL}/api/events/ack/{make_short_acknowledgement_code(notification.pk)}/"
+        composed = compose_sms(
+            f"Reminder from FutureReminder: {{name}} on {notification.event.event_date}. Mark as done:",
+            fields={'name': notification.event.name},
+            link=acknowledgement_url
+        )
+        notification.sms_segments = composed.segments
+
         # 2. Construct the full webhook URL
-        status_callback_url = f"{settings.SITE_URL}/api/webhooks/twilio/status/"
+        status_callback_url = f"{settings.SITE_URL}/api/events/webhooks/twilio/status/"
 
         # 3. Send the SMS using Twilio API
-        client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+        client = get_twilio_client()
+
+        # Scheduled messages must be sent through a Messaging Service.
+        schedule = {'send_at': send_at, 'schedule_type': 'fixed'} if send_at else {}
 
         message = client.messages.create(
-            body=message_body,
+            body=composed.body,
             messaging_service_sid=settings.TWILIO_MESSAGING_SERVICE_SID,
             to=recipient_phone_number,
-            status_callback=status_callback_url
+            status_callback=status_callback_url,
+            **schedule
         )
 
         # 4. Return the SID on success
@@ -0,0 +1,49 @@
+from collections import defaultdict
+from django.utils import timezone
+
+
+def _latency_seconds(entry: dict):
+    """
+    Returns how long a transition took: the dispatch delay for 'sent' and the
+    provider delay for 'delivered'. Other statuses have no latency.
+    """
+    if entry['to_status'] == 'sent':
+        start, end = entry['scheduled_send_time'], entry['sent_at']
+    elif entry['to_status'] == 'delivered':
+        start, end = entry['sent_at'], entry['delivered_at']
+    else:
+        return None
+
+    if start is None or end is None:
+        return None
+    return max((end - start).total_seconds(), 0)
+
+
+def summarize_status_events(entries) -> dict:
+    """
+    Totals status transitions per day, channel and status.
+
+    Args:
+        entries: Dicts with the transition's 'occurred_at', 'channel' and
+                 'to_status', and the notification's 'scheduled_send_time',
+                 'sent_at', 'delivered_at' and 'sms_segments'.
+
+    Returns:
+        A dict mapping (day, channel, status) to a dict of the
+        NotificationDailyStats counters for that key.
+    """
+    totals = defaultdict(lambda: {'count': 0, 'sms_segments': 0, 'latency_count': 0, 'latency_seconds_total': 0.0})
+
+    for entry in entries:
+        day = timezone.localtime(entry['occurred_at']).date()
+        total = totals[(day, entry['channel'], entry['to_status'])]
+        total['count'] += 1
+        if entry['to_status'] == 'sent':
+            total['sms_segments'] += entry['sms_segments'] or 0
+
+        latency = _latency_seconds(entry)
+        if latency is not None:
+            total['latency_count'] += 1
+            total['latency_seconds_total'] += latency
+
+    return totals
@@ -0,0 +1,119 @@
+from collections import defaultdict
+from django.db import transaction
+from django.utils import timezone
+from ..models import Notification, NotificationStatusEvent
+from .increment_notification_daily_stats import increment_notification_daily_stats
+from .record_latencies import record_latencies
+
+# The timing column stamped when a notification moves to each status.
+TIMESTAMP_FIELDS = {
+    'sent': 'sent_at',
+    'delivered': 'delivered_at',
+    'failed': 'failed_at',
+    'undeliverable': 'failed_at',
+}
+
+
+def transition_notifications(notifications, to_status: str, **fields) -> int:
+    """
+    Moves notifications to a new status with compare-and-set UPDATEs.
+
+    Only rows whose current status may move to `to_status` according to
+    Notification.STATUS_TRANSITIONS are changed: if another worker or webhook
+    changed a row first, the UPDATE simply skips it. No row is locked before
+    it is written. The candidates are read once, then one conditional UPDATE
+    per status they were seen in moves the rows still in that status, so the
+    status change log always records the status each row actually moved from.
+
+    The matching timing column (sent_at, delivered_at or failed_at) is set in
+    the same UPDATE, and every applied transition is appended to the
+    NotificationStatusEvent log with one bulk insert. The daily rollup counts
+    each notification once per status, so only a row's first entry into
+    `to_status` is added to it: a retried row that fails again, or a row
+    that reaches a status a second time after being re-queued, is logged but
+    not counted again. The rollup and, for deliveries, the sent-to-delivered
+    latency histogram are incremented after the status changes are
+    committed, so the shared rollup rows are never updated while the
+    notification rows are held.
+
+    Args:
+        notifications: A Notification queryset, e.g. filtered by pk.
+        to_status: The status to move to.
+        **fields: Other columns to set in the same UPDATE. The timing column
+                  defaults to now but can be passed, e.g. as an expression.
+
+    Returns:
+        The number of notifications that transitioned. For a single row,
+        this is 1 if the transition applied and 0 if it did not.
+
+    Raises:
+        ValueError: If no status can transition to `to_status`.
+    """
+    from_statuses = [
+        status for status, targets in Notification.STATUS_TRANSITIONS.items() if to_status in targets
+    ]
+    if not from_statuses:
+        raise ValueError(f"No notification status can transition to '{to_status}'.")
+
+    now = timezone.now()
+    timestamp_field = TIMESTAMP_FIELDS.get(to_status)
+    if timestamp_field:
+        fields.setdefault(timestamp_field, now)
+
+    pks_by_status = defaultdict(list)
+    for pk, status in notifications.filter(status__in=from_statuses).values_list('pk', 'status'):
+        pks_by_status[status].append(pk)
+    if not pks_by_status:
+        return 0
+
+    applied = []
+    with transaction.atomic():
+        for from_status, pks in pks_by_status.items():
+            if not Notification.objects.filter(pk__in=pks, status=from_status).update(
+                status=to_status,
+                updated_at=now,
+                **fields
+            ):
+                continue
+
+            # The UPDATE holds its row locks until commit, so the rows carrying
+            # this updated_at are exactly the ones it moved.
+            rows = list(Notification.objects.filter(
+                pk__in=pks, status=to_status, updated_at=now
+            ).values('pk', 'channel', 'scheduled_send_time', 'sent_at', 'delivered_at', 'failed_at', 'sms_segments'))
+            for row in rows:
+                row['from_status'] = from_status
+                row['to_status'] = to_status
+                row['occurred_at'] = (row[timestamp_field] if timestamp_field else None) or now
+            applied.extend(rows)
+
+        if not applied:
+            return 0
+
+        entered_before = set(NotificationStatusEvent.objects.filter(
+            notification_id__in=[row['pk'] for row in applied], to_status=to_status
+        ).values_list('notification_id', flat=True))
+        first_entries = [
+            row for row in applied
+            if row['from_status'] != to_status and row['pk'] not in entered_before
+        ]
+
+        NotificationStatusEvent.objects.bulk_create([
+            NotificationStatusEvent(
+                notification_id=row['pk'],
+                channel=row['channel'],
+                from_status=row['from_status'],
+                to_status=to_status,
+                occurred_at=row['occurred_at']
+            )
+            for row in applied
+        ], batch_size=500)
+
+    increment_notification_daily_stats(first_entries)
+    if to_status == 'delivered':
+        record_latencies(
+            ('delivery', row['channel'], row['delivered_at'], (row['delivered_at'] - row['sent_at']).total_seconds() * 1000)
+            for row in first_entries if row['sent_at'] and row['delivered_at'] and row['delivered_at'] >= row['sent_at']
+        )
+
+    return len(applied)
@@ -0,0 +1,147 @@
+from django.core.signing import Signer, BadSignature
+from django.utils.crypto import salted_hmac, constant_time_compare
+from django.utils.http import int_to_base36, base36_to_int
+from django.shortcuts import redirect, render
+from django.conf import settings
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+from rest_framework import status
+
+from ..models import Event, Notification
+from ..utils.acknowledge_event import acknowledge_event
+
+acknowledgement_signer = Signer(salt='events.acknowledgement')
+
+# Short codes keep SMS links inside a single segment: a base36 ID plus a
+# truncated HMAC, instead of the full signature used in emails.
+SHORT_CODE_SALT = 'events.acknowledgement.short'
+DIGEST_SHORT_CODE_SALT = 'events.acknowledgement.short.digest'
+SHORT_CODE_SIGNATURE_LENGTH = 12
+
+
+def _short_code_signature(encoded_id: str, salt: str = SHORT_CODE_SALT) -> str:
+    return salted_hmac(salt, encoded_id).hexdigest()[:SHORT_CODE_SIGNATURE_LENGTH]
+
+
+def make_short_acknowledgement_code(notification_pk: int, salt: str = SHORT_CODE_SALT) -> str:
+    """
+    Returns a compact signed code for a notification's acknowledgement link.
+    """
+    encoded_id = int_to_base36(int(notification_pk))
+    return f"{encoded_id}-{_short_code_signature(encoded_id, salt)}"
+
+
+def make_short_digest_acknowledgement_code(notification_pk: int) -> str:
+    """
+    Returns a compact signed code for a digest SMS's acknowledgement link,
+    which acknowledges every event in the digest.
+    """
+    return make_short_acknowledgement_code(notification_pk, DIGEST_SHORT_CODE_SALT)
+
+
+class AcknowledgeEventView(APIView):
+    """
+    Handles the acknowledgement link clicked by a user in a reminder.
+    Acknowledging stops the remaining escalation chain for the event.
+
+    Opening the link (GET or HEAD) only shows a confirmation page. Email
+    security scanners and link previews follow links without a user, so the
+    acknowledgement itself is only made by the page's POST.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get_notification_id(self, token):
+        """
+        Returns the notification ID from the token, or raises BadSignature.
+        """
+        return acknowledgement_signer.unsign(token)
+
+    def get_notification(self, token):
+        """
+        Returns the notification the token was signed for, or an error Response.
+        """
+        try:
+            notification_id = self.get_notification_id(token)
+        except BadSignature:
+            return Response(
+                {"detail": "Invalid acknowledgement link."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        notification = Notification.objects.select_related('event').filter(pk=notification_id).first()
+        if notification is None:
+            return Response(
+                {"detail": "This reminder no longer exists."},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return notification
+
+    def get_events(self, notification) -> list:
+        """
+        Returns the events the link acknowledges.
+        """
+        return [notification.event]
+
+    def get(self, request, token, *args, **kwargs):
+        """
+        Verifies the signed token and shows the confirmation page, without
+        acknowledging anything.
+        """
+        notification = self.get_notification(token)
+        if isinstance(notification, Response):
+            return notification
+
+        events = self.get_events(notification)
+        return render(request, 'events/acknowledge_confirm.html', {
+            'event_name': ', '.join(event.name for event in events),
+            'event_count': len(events),
+        })
+
+    def post(self, request, token, *args, **kwargs):
+        """
+        Verifies the signed token, acknowledges the event and cancels its
+        remaining notifications.
+        """
+        notification = self.get_notification(token)
+        if isinstance(notification, Response):
+            return notification
+
+        for event in self.get_events(notification):
+            acknowledge_event(event)
+
+        return redirect(f"{settings.SITE_URL}/acknowledgement-success/")
+
+
+class ShortAcknowledgeEventView(AcknowledgeEventView):
+    """
+    Handles the short acknowledgement link sent in reminder SMS.
+    """
+    salt = SHORT_CODE_SALT
+
+    def get_notification_id(self, token):
+        encoded_id, _, signature = token.partition('-')
+        if not encoded_id or not constant_time_compare(signature, _short_code_signature(encoded_id, self.salt)):
+            raise BadSignature("Invalid short acknowledgement code.")
+        try:
+            return base36_to_int(encoded_id)
+        except ValueError:
+            raise BadSignature("Invalid short acknowledgement code.")
+
+
+class ShortAcknowledgeDigestView(ShortAcknowledgeEventView):
+    """
+    Handles the short acknowledgement link sent in digest SMS. A digest has
+    room for a single link, so it acknowledges every event whose reminder
+    was sent in the same message as the signed notification.
+    """
+    salt = DIGEST_SHORT_CODE_SALT
+
+    def get_events(self, notification) -> list:
+        if not notification.message_sid:
+            return [notification.event]
+        return list(Event.objects.filter(
+            notifications__message_sid=notification.message_sid,
+            notifications__user_id=notification.user_id
+        ).distinct().order_by('event_date', 'pk'))
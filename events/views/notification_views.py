@@ -2,41 +2,108 @@ from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser
+from rest_framework import status
+from django.core.cache import cache
 from django.utils import timezone
-from datetime import timedelta
-from collections import Counter
+from datetime import date, timedelta
+from django.db.models import Sum
 
-from ..models import Notification
+from ..models import Notification, NotificationDailyStats
 from ..serializers.notification_serializer import AdminTaskSerializer
+from ..utils.get_latency_percentiles import get_latency_percentiles
+from futurereminder.db_router import ReplicaReadMixin
 
-class NotificationStatsView(APIView):
+STATS_CACHE_KEY = 'notification_stats:{since}'
+STATS_CACHE_TIMEOUT = 60
+MAX_STATS_DAYS = 365
+MAX_LATENCY_HOURS = 24 * 90
+
+class NotificationStatsView(ReplicaReadMixin, APIView):
     """
-    Provides statistics on automated notifications (sent vs. failed) over the
-    last 7 days.
+    Provides statistics on automated notifications (sent vs. failed vs.
+    undeliverable) per channel, and the SMS segments they used, over the last
+    `?days=` days (default 7) or since the `?since=` date.
+
+    The counts are grouped in the database from the NotificationDailyStats rollup,
+    whose (day, channel, status) index serves the window, and are cached briefly
+    per window.
     """
     permission_classes = [IsAdminUser]
 
     def get(self, request, *args, **kwargs):
-        seven_days_ago = timezone.now() - timedelta(days=7)
+        since = request.query_params.get('since')
+        if since is not None:
+            try:
+                start_day = date.fromisoformat(since)
+            except ValueError:
+                return Response({"error": "'since' must be a date in YYYY-MM-DD format."}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            try:
+                days = int(request.query_params.get('days', 7))
+            except ValueError:
+                return Response({"error": "'days' must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+            if not 1 <= days <= MAX_STATS_DAYS:
+                return Response(
+                    {"error": f"'days' must be between 1 and {MAX_STATS_DAYS}."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            # The window includes today, so `days` calendar days start days - 1 ago
+            start_day = timezone.localdate() - timedelta(days=days - 1)
+
+        cache_key = STATS_CACHE_KEY.format(since=start_day.isoformat())
+        stats = cache.get(cache_key)
+        if stats is None:
+            stats = self._get_stats(start_day)
+            cache.set(cache_key, stats, STATS_CACHE_TIMEOUT)
+
+        return Response(stats)
 
-        # Get relevant notifications
-        notifications = Notification.objects.filter(
-            updated_at__gte=seven_days_ago,
-            status__in=['sent', 'failed']
-        ).values('status', 'channel')
+    def _get_stats(self, start_day) -> dict:
+        # Sum the daily rollup rows of the window per status and channel
+        rows = NotificationDailyStats.objects.filter(
+            day__gte=start_day,
+            status__in=['sent', 'failed', 'undeliverable']
+        ).values('status', 'channel').annotate(count=Sum('count'), sms_segments=Sum('sms_segments')).order_by()
 
-        # Aggregate the stats
         stats = {
-            'sent': Counter(),
-            'failed': Counter()
+            'sent': {},
+            'failed': {},
+            'undeliverable': {},
+            'sms_segments': {}
         }
-        for notif in notifications:
-            stats[notif['status']][notif['channel']] += 1
+        for row in rows:
+            stats[row['status']][row['channel']] = row['count']
+            if row['status'] == 'sent' and row['sms_segments']:
+                stats['sms_segments'][row['channel']] = row['sms_segments']
 
-        return Response(stats)
+        return stats
+
+
+class NotificationLatencyView(ReplicaReadMixin, APIView):
+    """
+    Provides p50/p95/p99 latencies per channel and provider over the last
+    `?hours=` hours (default 24): how long provider API calls take
+    ('provider_call') and how long providers take to confirm delivery
+    ('delivery').
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            hours = int(request.query_params.get('hours', 24))
+        except ValueError:
+            return Response({"error": "'hours' must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not 1 <= hours <= MAX_LATENCY_HOURS:
+            return Response(
+                {"error": f"'hours' must be between 1 and {MAX_LATENCY_HOURS}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(get_latency_percentiles(timezone.now() - timedelta(hours=hours)))
 
 
-class AdminTaskListView(ListAPIView):
+class AdminTaskListView(ReplicaReadMixin, ListAPIView):
     """
     Provides a list of pending manual admin tasks scheduled for the current week.
     """
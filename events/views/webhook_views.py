@@ -1,20 +1,54 @@
+import hashlib
+import hmac
+import json
+import time
+from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
-from django.db import transaction
 from rest_framework.request import Request
+from twilio.request_validator import RequestValidator
+
+from data_management.utils.metrics import NOTIFICATION_FAILURES, observe_webhook
+from ..models import DeliveryCallback
+
+# Mailgun signatures older than this are rejected to prevent replays. Within
+# this window, a token that was already used is rejected too.
+MAILGUN_SIGNATURE_MAX_AGE_SECONDS = 15 * 60
+
+def _verify_twilio_signature(request) -> bool:
+    """
+    Verifies the X-Twilio-Signature header: an HMAC-SHA1 of the callback URL
+    and the POST parameters, keyed with the account's auth token. The URL is
+    the one given to Twilio as the status callback, so the check does not
+    depend on how a proxy in front of the site rewrites the request.
+    """
+    auth_token = getattr(settings, 'TWILIO_AUTH_TOKEN', None)
+    signature = request.META.get('HTTP_X_TWILIO_SIGNATURE', '')
+    if not auth_token or not signature:
+        return False
+
+    url = f"{settings.SITE_URL}{request.get_full_path()}"
+    return RequestValidator(auth_token).validate(url, request.POST, signature)
 
-from ..models import Notification
 
 @csrf_exempt
-@transaction.atomic
+@observe_webhook('twilio')
 def twilio_status_webhook(request: Request) -> HttpResponse:
     """
     Handles status update webhooks from Twilio.
 
-    Updates the Notification status based on the final delivery status
-    reported by Twilio.
+    The signature is verified before anything is stored, so only Twilio can
+    change a notification's status. Twilio sends several callbacks per
+    message (queued, sent, delivered), so each one is only appended to the
+    DeliveryCallback inbox and acknowledged right away, without locking any
+    notification rows. The apply_delivery_callbacks command coalesces them
+    per SID to the terminal status and applies them in bulk.
     """
     if request.method == 'POST':
+        if not _verify_twilio_signature(request):
+            return HttpResponse(status=403)
+
         # Data is form-encoded
         message_sid = request.POST.get('MessageSid')
         message_status = request.POST.get('MessageStatus')
@@ -22,27 +56,110 @@ def twilio_status_webhook(request: Request) -> HttpResponse:
         if not message_sid:
             return HttpResponse(status=400) # Bad Request if no SID
 
-        try:
-            notification = Notification.objects.select_for_update().get(message_sid=message_sid)
-        except Notification.DoesNotExist:
-            # If we don't have this SID, we can't do anything.
-            # Return 200 so Twilio doesn't retry.
-            return HttpResponse(status=200)
-
-        # Map Twilio statuses to our model's statuses
+        # Map Twilio statuses to our model's statuses. Other statuses
+        # ('queued', 'sent', etc.) are kept for reference but are not terminal.
+        status = None
+        failure_reason = None
         if message_status == 'delivered':
-            notification.status = 'delivered'
+            status = 'delivered'
         elif message_status in ['failed', 'undelivered']:
-            notification.status = 'failed'
+            status = 'failed'
             # Store the error code as the failure reason
-            error_code = request.POST.get('ErrorCode')
-            notification.failure_reason = f"Twilio Error Code: {error_code}"
-        
-        # We don't need to handle 'sent', 'queued', etc. as we only
-        # care about the terminal status.
-        
-        notification.save()
+            failure_reason = f"Twilio Error Code: {request.POST.get('ErrorCode')}"
+            NOTIFICATION_FAILURES.inc(source='twilio_callback', code=request.POST.get('ErrorCode') or 'unknown')
+
+        DeliveryCallback.objects.create(
+            provider='twilio',
+            message_sid=message_sid,
+            # Twilio SIDs are unique per recipient, so no recipient is needed to match deliveries.
+            raw_status=message_status or '',
+            status=status,
+            failure_reason=failure_reason,
+        )
 
         return HttpResponse(status=200)
 
     return HttpResponse(status=405) # Method Not Allowed
+
+
+def _verify_mailgun_signature(signature: dict) -> bool:
+    """
+    Verifies a Mailgun webhook signature: an HMAC-SHA256 of the timestamp and
+    token, keyed with the webhook signing key. Each token is only accepted
+    once, so a captured request cannot be replayed while its timestamp is
+    still recent.
+    """
+    signing_key = getattr(settings, 'MAILGUN_WEBHOOK_SIGNING_KEY', None)
+    timestamp = str(signature.get('timestamp', ''))
+    token = str(signature.get('token', ''))
+    if not signing_key or not timestamp.isdigit() or not token:
+        return False
+
+    if abs(time.time() - int(timestamp)) > MAILGUN_SIGNATURE_MAX_AGE_SECONDS:
+        return False
+
+    expected = hmac.new(signing_key.encode('utf-8'), f"{timestamp}{token}".encode('utf-8'), hashlib.sha256).hexdigest()
+    if not hmac.compare_digest(expected, str(signature.get('signature', ''))):
+        return False
+
+    # cache.add only succeeds for the first request carrying this token.
+    return cache.add(f"mailgun_webhook_token:{token}", True, MAILGUN_SIGNATURE_MAX_AGE_SECONDS)
+
+
+@csrf_exempt
+@observe_webhook('mailgun')
+def mailgun_events_webhook(request: Request) -> HttpResponse:
+    """
+    Handles delivery event webhooks from Mailgun.
+
+    The signature is verified and terminal events are appended to the
+    DeliveryCallback staging table; no notification rows are touched here,
+    so the response stays fast during delivery floods. The
+    apply_delivery_callbacks command applies the staged events.
+    """
+    if request.method != 'POST':
+        return HttpResponse(status=405) # Method Not Allowed
+
+    try:
+        payload = json.loads(request.body)
+    except ValueError:
+        return HttpResponse(status=400)
+
+    if not _verify_mailgun_signature(payload.get('signature') or {}):
+        return HttpResponse(status=403)
+
+    event_data = payload.get('event-data') or {}
+    event = event_data.get('event')
+    message_sid = ((event_data.get('message') or {}).get('headers') or {}).get('message-id')
+
+    if not message_sid:
+        return HttpResponse(status=400) # Bad Request if no message ID
+
+    # Temporary failures are retried by Mailgun, so only permanent ones are final.
+    status = None
+    failure_reason = None
+    if event == 'delivered':
+        status = 'delivered'
+    elif event == 'failed' and event_data.get('severity') == 'permanent':
+        status = 'failed'
+        delivery_status = event_data.get('delivery-status') or {}
+        failure_reason = (
+            f"Mailgun Error {delivery_status.get('code')}: "
+            f"{delivery_status.get('description') or delivery_status.get('message') or event_data.get('reason')}"
+        )
+        NOTIFICATION_FAILURES.inc(source='mailgun_callback', code=delivery_status.get('code') or 'unknown')
+
+    # Opens, clicks and temporary failures don't change the notification status.
+    if status is None:
+        return HttpResponse(status=200)
+
+    DeliveryCallback.objects.create(
+        provider='mailgun',
+        message_sid=message_sid.strip('<>'),
+        recipient=event_data.get('recipient'),
+        raw_status=event,
+        status=status,
+        failure_reason=failure_reason,
+    )
+
+    return HttpResponse(status=200)
@@ -38,6 +38,63 @@ HASHING_SALT = os.environ.get("HASHING_SALT")
 ADMIN_EMAIL = os.environ.get("ADMIN_EMAIL")
 ADMIN_NUMBER = os.environ.get("ADMIN_NUMBER")
 
+# Notification Scheduling
+# Each event is assigned a stable slot inside this daily window so that a day's
+# notifications are spread out instead of all falling due at midnight.
+NOTIFICATION_SEND_WINDOW_START_HOUR = 9
+NOTIFICATION_SEND_WINDOW_MINUTES = 8 * 60
+NOTIFICATION_SEND_SLOT_MINUTES = 5
+
+# When enabled, reminders due to the same recipient on the same day are merged
+# into a single digest email or SMS.
+NOTIFICATION_DIGEST_ENABLED = True
+
+# Fan-out channels (e.g. all emergency contacts) send concurrent Twilio requests,
+# at most this many at a time.
+NOTIFICATION_FANOUT_MAX_WORKERS = 4
+
+# Processed provider callbacks are kept this long for debugging, then purged.
+DELIVERY_CALLBACK_RETENTION_DAYS = 7
+
+# The number of SMS segments a reminder may use. Event names are shortened to fit.
+SMS_SEGMENT_BUDGET = 1
+
+# Pre-submission: SMS due within the horizon are handed to Twilio ahead of time
+# with a scheduled delivery time (`send_at`), in throttled batches. Emails are not
+# pre-submitted, as Mailgun cannot cancel a scheduled email. Twilio requires at
+# least 15 minutes of lead time.
+NOTIFICATION_PRESUBMIT_HORIZON_HOURS = 24
+NOTIFICATION_PRESUBMIT_MIN_LEAD_MINUTES = 15
+NOTIFICATION_PRESUBMIT_BATCH_SIZE = 50
+NOTIFICATION_PRESUBMIT_BATCH_DELAY_SECONDS = 1
+
+# The admin historical summary recomputes the months that are still open at most
+# this often. A month stays open for a grace period after it ends, as late Stripe
+# webhooks can still mark its payments as succeeded, and is then frozen.
+PLATFORM_SUMMARY_REFRESH_SECONDS = 5 * 60
+PLATFORM_SUMMARY_FINAL_AFTER_HOURS = 72
+
+# Signup cohorts (by week) keep converting for a while after they sign up. Cohorts
+# younger than this many weeks are recomputed on every funnel refresh.
+FUNNEL_OPEN_COHORT_WEEKS = 8
+
+# Metrics are shared between processes (gunicorn workers, dispatcher runs) through
+# per-process files in this directory. Leave it unset to keep them in memory for a
+# single process. Empty the directory on deploy.
+METRICS_DIR = os.environ.get("METRICS_DIR")
+METRICS_FLUSH_INTERVAL_SECONDS = 1
+
+# The dispatch health check (/api/data/health/dispatch/) is 'degraded' once the oldest
+# due, pending notification of a channel is this late, the backlog is this large or
+# this many failed notifications are waiting for a retry, and 'failing' (HTTP 503)
+# once it is later still or the dispatcher has not completed a run for
+# DISPATCHER_HEARTBEAT_MAX_AGE_SECONDS.
+DISPATCH_LAG_DEGRADED_SECONDS = 5 * 60
+DISPATCH_LAG_FAILING_SECONDS = 15 * 60
+DISPATCH_BACKLOG_DEGRADED_SIZE = 1000
+DISPATCH_RETRY_DEGRADED_SIZE = 100
+DISPATCHER_HEARTBEAT_MAX_AGE_SECONDS = 10 * 60
+
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = os.getenv('DEBUG') == 'True'
 
@@ -71,6 +128,8 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "data_management.middleware.QueryCountMiddleware",
+    "data_management.middleware.ReadYourWritesMiddleware",
 ]
 
 ROOT_URLCONF = "futurereminder.urls"
@@ -107,6 +166,29 @@ DATABASES = {
     }
 }
 
+# An optional read replica, enabled by DB_REPLICA_HOST (or DB_REPLICA_ENGINE for a
+# local database). Unset DB_REPLICA_* values default to the primary's. Analytics
+# views, read-only lists and exports read from it; everything else, and every write,
+# uses the primary.
+if os.environ.get('DB_REPLICA_HOST') or os.environ.get('DB_REPLICA_ENGINE'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'ENGINE': os.environ.get('DB_REPLICA_ENGINE', DATABASES['default']['ENGINE']),
+        'NAME': os.environ.get('DB_REPLICA_NAME', DATABASES['default']['NAME']),
+        'USER': os.environ.get('DB_REPLICA_USER', DATABASES['default']['USER']),
+        'PASSWORD': os.environ.get('DB_REPLICA_PASSWORD', DATABASES['default']['PASSWORD']),
+        'HOST': os.environ.get('DB_REPLICA_HOST', DATABASES['default']['HOST']),
+        'PORT': os.environ.get('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+    }
+
+READ_REPLICA_ALIAS = 'replica' if 'replica' in DATABASES else None
+
+DATABASE_ROUTERS = ['futurereminder.db_router.ReplicaRouter']
+
+# After a successful write, a user reads from the primary for this long, so they see
+# their own changes while the replica catches up.
+REPLICA_PIN_SECONDS = 30
+
 # Caching
 # https://docs.djangoproject.com/en/5.2/topics/cache/
 CACHES = {
@@ -187,10 +269,13 @@ REST_FRAMEWORK = {
 # Email Settings (Mailgun)
 MAILGUN_API_KEY = os.environ.get("MAILGUN_API_KEY")
 MAILGUN_DOMAIN = os.environ.get("MAILGUN_DOMAIN")
+MAILGUN_API_BASE_URL = os.environ.get("MAILGUN_API_BASE_URL", "https://api.mailgun.net/v3")
+MAILGUN_WEBHOOK_SIGNING_KEY = os.environ.get("MAILGUN_WEBHOOK_SIGNING_KEY")
 DEFAULT_FROM_EMAIL = "FutureReminder <postmaster@mail.futurereminder.app>"
 
 # Twilio Settings
 TWILIO_ACCOUNT_SID = os.environ.get("TWILIO_ACCOUNT_SID")
 TWILIO_AUTH_TOKEN = os.environ.get("TWILIO_AUTH_TOKEN")
 TWILIO_PHONE_NUMBER = os.environ.get("TWILIO_PHONE_NUMBER")
-TWILIO_MESSAGING_SERVICE_SID = os.environ.get("TWILIO_MESSAGING_SERVICE_SID")
\ No newline at end of file
+TWILIO_MESSAGING_SERVICE_SID = os.environ.get("TWILIO_MESSAGING_SERVICE_SID")
+TWILIO_API_BASE_URL = os.environ.get("TWILIO_API_BASE_URL") # Overrides https://api.twilio.com, e.g. for a local stub
\ No newline at end of file
@@ -10,6 +10,7 @@ from rest_framework_simplejwt.views import (
 )
 from django.contrib.sitemaps.views import sitemap
 from .sitemaps import StaticViewSitemap
+from data_management.views.metrics_view import MetricsView
 
 sitemaps = {
     'static': StaticViewSitemap,
@@ -25,6 +26,9 @@ urlpatterns = [
     # Sitemap
     path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap'),
 
+    # Prometheus metrics, for admins only
+    path('metrics', MetricsView.as_view(), name='metrics'),
+
     # JWT Token Authentication Endpoints
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
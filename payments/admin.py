@@ -0,0 +1,11 @@
+from django.contrib import admin
+from .models import Tier
+
+@admin.register(Tier)
+class TierAdmin(admin.ModelAdmin):
+    """
+    Tier admin configuration. The manifest is validated by Tier.clean(), and the
+    compiled schedule is shown read-only.
+    """
+    list_display = ('name', 'is_active')
+    readonly_fields = ('compiled_schedule',)
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0004_tier_manifest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tier',
+            name='compiled_schedule',
+            field=models.JSONField(default=list, editable=False, help_text='The offset steps compiled from the manifest. Empty for plain channel lists.'),
+        ),
+        migrations.AlterField(
+            model_name='tier',
+            name='manifest',
+            field=models.JSONField(default=list, help_text="The schedule for this tier. Either a list of channel strings spread evenly over the notification period, or offset steps such as 'T-28d primary_email'."),
+        ),
+    ]
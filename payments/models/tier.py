@@ -1,3 +1,4 @@
+from django.core.exceptions import ValidationError
 from django.db import models
 
 class Tier(models.Model):
@@ -16,7 +17,15 @@ class Tier(models.Model):
     )
     manifest = models.JSONField(
         default=list,
-        help_text="A list of notification channel strings defining the schedule for this tier."
+        help_text=(
+            "The schedule for this tier. Either a list of channel strings spread evenly "
+            "over the notification period, or offset steps such as 'T-28d primary_email'."
+        )
+    )
+    compiled_schedule = models.JSONField(
+        default=list,
+        editable=False,
+        help_text="The offset steps compiled from the manifest. Empty for plain channel lists."
     )
     stripe_product_id = models.CharField(
         max_length=255, 
@@ -32,3 +41,31 @@ class Tier(models.Model):
 
     def __str__(self):
         return self.name
+
+    def clean(self):
+        """
+        Rejects malformed manifests, so the admin form shows the error on the
+        manifest field instead of failing on save.
+        """
+        # Local import to prevent circular dependency
+        from ..utils.compile_manifest import compile_manifest
+
+        super().clean()
+        try:
+            compile_manifest(self.manifest)
+        except ValidationError as e:
+            raise ValidationError({'manifest': e.messages})
+
+    def save(self, *args, **kwargs):
+        # Local import to prevent circular dependency
+        from ..utils.compile_manifest import compile_manifest
+
+        # Compile the manifest once here so scheduling never has to re-parse it.
+        # Manifests are validated in clean().
+        self.compiled_schedule = compile_manifest(self.manifest)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'manifest' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'compiled_schedule'}
+
+        super().save(*args, **kwargs)
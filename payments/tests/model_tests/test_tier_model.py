@@ -1,4 +1,5 @@
 import pytest
+from django.core.exceptions import ValidationError
 from payments.models import Tier
 from payments.tests.factories.tier_factory import TierFactory
 
@@ -20,4 +21,27 @@ def test_tier_str_method():
     Tests the __str__ method of the Tier model.
     """
     tier = TierFactory(name="Test Tier")
-    assert str(tier) == "Test Tier"
\ No newline at end of file
+    assert str(tier) == "Test Tier"
+@pytest.mark.django_db
+def test_tier_save_compiles_offset_manifest():
+    """
+    Tests that saving a tier caches the compiled schedule for its manifest.
+    """
+    tier = TierFactory(manifest=['T-2d primary_sms', 'T-1w primary_email'])
+    tier.refresh_from_db()
+    assert [step['offset_days'] for step in tier.compiled_schedule] == [-7, -2]
+
+    tier.manifest = ['primary_email']
+    tier.save(update_fields=['manifest'])
+    tier.refresh_from_db()
+    assert tier.compiled_schedule == []
+
+@pytest.mark.django_db
+def test_tier_clean_rejects_malformed_manifest():
+    """
+    Tests that an invalid manifest is reported on the manifest field by clean().
+    """
+    tier = TierFactory.build(manifest=['T-2x primary_sms'])
+    with pytest.raises(ValidationError) as exc_info:
+        tier.full_clean()
+    assert 'manifest' in exc_info.value.message_dict
@@ -0,0 +1,53 @@
+import pytest
+from django.core.exceptions import ValidationError
+from payments.utils.compile_manifest import compile_manifest
+
+
+def test_plain_channel_manifest_compiles_to_empty_template():
+    """
+    Tests that legacy channel lists are left for even-interval scheduling.
+    """
+    assert compile_manifest(['primary_email', 'primary_sms']) == []
+    assert compile_manifest([]) == []
+
+
+def test_offset_steps_are_sorted_earliest_first():
+    """
+    Tests that offsets in days and weeks compile to negative day offsets,
+    sorted from the earliest step to the latest.
+    """
+    manifest = ['T-1d emergency_contact_email', 'T-4w primary_email', 'T-7d primary_sms']
+
+    assert compile_manifest(manifest) == [
+        {'offset_days': -28, 'channel': 'primary_email', 'window': None},
+        {'offset_days': -7, 'channel': 'primary_sms', 'window': None},
+        {'offset_days': -1, 'channel': 'emergency_contact_email', 'window': None},
+    ]
+
+
+def test_repeats_and_send_windows_are_expanded():
+    """
+    Tests that a repeated step expands into one entry per repeat, each carrying
+    the step's send window in minutes past midnight.
+    """
+    compiled = compile_manifest(['T-14d primary_email every 2d x3 @09:00-12:30'])
+
+    assert [step['offset_days'] for step in compiled] == [-14, -12, -10]
+    assert all(step['window'] == [540, 750] for step in compiled)
+
+
+@pytest.mark.parametrize('manifest', [
+    ['T-7d primary_email', 'primary_sms'],
+    ['T-7d carrier_pigeon'],
+    ['T-7x primary_email'],
+    ['T-2d primary_email every 2d x3'],
+    ['T-7d primary_email @12:00-09:00'],
+    ['T-7d primary_email @25:00-26:00'],
+])
+def test_invalid_manifests_raise_validation_error(manifest):
+    """
+    Tests that mixed formats, unknown channels, bad units, repeats past the
+    event date and invalid windows are rejected.
+    """
+    with pytest.raises(ValidationError):
+        compile_manifest(manifest)
@@ -0,0 +1,98 @@
+import re
+from django.core.exceptions import ValidationError
+
+# A single offset step, e.g. "T-14d primary_email every 2d x3 @09:00-12:00".
+#   T-<n><unit>               Days (d) or weeks (w) before the event date.
+#   <channel>                 Any Notification channel.
+#   every <n><unit> x<count>  Optional: repeat the step <count> times, <n><unit> apart.
+#   @HH:MM-HH:MM              Optional: send window for this step, in the user's timezone.
+STEP_PATTERN = re.compile(
+    r'^T-(?P<offset>\d+)(?P<offset_unit>[dw])\s+(?P<channel>[a-z_]+)'
+    r'(?:\s+every\s+(?P<every>\d+)(?P<every_unit>[dw])\s+x(?P<count>\d+))?'
+    r'(?:\s+@(?P<window_start>\d{2}:\d{2})-(?P<window_end>\d{2}:\d{2}))?$'
+)
+
+UNIT_DAYS = {'d': 1, 'w': 7}
+
+
+def _parse_minutes(value: str) -> int:
+    hours, minutes = (int(part) for part in value.split(':'))
+    if hours > 23 or minutes > 59:
+        raise ValueError(value)
+    return hours * 60 + minutes
+
+
+def is_offset_manifest(manifest) -> bool:
+    """
+    Returns True if the manifest uses the offset step format rather than a
+    plain list of channels.
+    """
+    return any(isinstance(step, str) and step.startswith('T-') for step in manifest or [])
+
+
+def compile_manifest(manifest) -> list:
+    """
+    Compiles an offset-based tier manifest into a schedule template.
+
+    Plain channel lists are spread evenly per event at scheduling time and
+    compile to an empty template. Offset manifests compile to a list of steps
+    sorted from earliest to latest, so scheduling an event only needs to add
+    each step's offset to its event date.
+
+    Args:
+        manifest: The Tier's manifest list.
+
+    Returns:
+        A list of {'offset_days', 'channel', 'window'} dictionaries, where
+        'window' is a [start, end] pair in minutes past midnight, or None.
+
+    Raises:
+        ValidationError: If the manifest mixes formats or a step is malformed.
+    """
+    # Local import to prevent circular dependency
+    from events.models import Notification
+
+    if not is_offset_manifest(manifest):
+        return []
+
+    valid_channels = {choice[0] for choice in Notification.CHANNEL_CHOICES}
+    steps = []
+
+    for position, raw_step in enumerate(manifest):
+        match = STEP_PATTERN.match(raw_step.strip()) if isinstance(raw_step, str) else None
+        if not match:
+            raise ValidationError(f"Manifest step {position} ('{raw_step}') is not a valid offset step.")
+
+        channel = match['channel']
+        if channel not in valid_channels:
+            raise ValidationError(f"Manifest step {position} uses an unknown channel '{channel}'.")
+
+        window = None
+        if match['window_start']:
+            try:
+                window = [_parse_minutes(match['window_start']), _parse_minutes(match['window_end'])]
+            except ValueError:
+                raise ValidationError(f"Manifest step {position} has an invalid send window.")
+            if window[0] >= window[1]:
+                raise ValidationError(f"Manifest step {position} has a send window that ends before it starts.")
+
+        offset_days = -int(match['offset']) * UNIT_DAYS[match['offset_unit']]
+        count = int(match['count']) if match['count'] else 1
+        every_days = int(match['every']) * UNIT_DAYS[match['every_unit']] if match['every'] else 0
+
+        if count < 1 or (count > 1 and every_days < 1):
+            raise ValidationError(f"Manifest step {position} has an invalid repeat.")
+
+        for repeat in range(count):
+            repeat_offset = offset_days + repeat * every_days
+            if repeat_offset > 0:
+                raise ValidationError(f"Manifest step {position} repeats past the event date.")
+            steps.append((repeat_offset, position, {
+                'offset_days': repeat_offset,
+                'channel': channel,
+                'window': window,
+            }))
+
+    # Sort by offset, keeping manifest order for steps on the same day.
+    steps.sort(key=lambda step: (step[0], step[1]))
+    return [step for _, _, step in steps]
@@ -16,6 +16,7 @@ class CustomUserAdmin(UserAdmin):
     inlines = (EmergencyContactInline,)
     fieldsets = UserAdmin.fieldsets + (
         ('Additional Contact Info', {'fields': ('country_code', 'phone',)}),
+        ('Notification Preferences', {'fields': ('timezone', 'send_window_start', 'send_window_end',)}),
     )
     add_fieldsets = UserAdmin.add_fieldsets + (
         ('Additional Contact Info', {'fields': ('country_code', 'phone',)}),
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='send_window_end',
+            field=models.TimeField(blank=True, help_text='Latest local time of day to send notifications. Uses the site-wide window if not set.', null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='send_window_start',
+            field=models.TimeField(blank=True, help_text='Earliest local time of day to send notifications. Uses the site-wide window if not set.', null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='timezone',
+            field=models.CharField(default='UTC', help_text="IANA timezone name (e.g., 'Australia/Perth') used to schedule this user's notifications.", max_length=64),
+        ),
+    ]
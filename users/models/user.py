@@ -22,6 +22,23 @@ class User(AbstractUser):
     snapchat_handle = models.CharField(max_length=255, blank=True, null=True)
     x_handle = models.CharField(max_length=255, blank=True, null=True)
 
+    # Notification Preferences
+    timezone = models.CharField(
+        max_length=64,
+        default='UTC',
+        help_text="IANA timezone name (e.g., 'Australia/Perth') used to schedule this user's notifications."
+    )
+    send_window_start = models.TimeField(
+        null=True,
+        blank=True,
+        help_text="Earliest local time of day to send notifications. Uses the site-wide window if not set."
+    )
+    send_window_end = models.TimeField(
+        null=True,
+        blank=True,
+        help_text="Latest local time of day to send notifications. Uses the site-wide window if not set."
+    )
+
     # Account Status
     is_email_verified = models.BooleanField(
         default=False,
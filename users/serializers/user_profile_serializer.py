@@ -1,5 +1,10 @@
+from zoneinfo import available_timezones
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from users.utils.get_user_timezone import get_user_timezone
+from events.models import Notification
+from events.utils.cancel_scheduled_notifications import cancel_scheduled_notifications
+from events.utils.reschedule_notifications_for_user import reschedule_notifications_for_user
 
 User = get_user_model()
 
@@ -25,6 +30,9 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'instagram_handle',
             'snapchat_handle',
             'x_handle',
+            'timezone',
+            'send_window_start',
+            'send_window_end',
             'is_staff',
             'is_superuser',
             'is_email_verified',
@@ -50,3 +58,52 @@ class UserProfileSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("An account with this email address already exists.")
         return lower_email
 
+
+
+    def validate_timezone(self, value):
+        """
+        Ensure the timezone is a recognised IANA timezone name.
+        """
+        if value not in available_timezones():
+            raise serializers.ValidationError("Unknown timezone.")
+        return value
+
+    def validate(self, attrs):
+        """
+        Ensure a preferred send window has both ends set and starts before it ends.
+        """
+        start = attrs.get('send_window_start', getattr(self.instance, 'send_window_start', None))
+        end = attrs.get('send_window_end', getattr(self.instance, 'send_window_end', None))
+
+        if (start is None) != (end is None):
+            raise serializers.ValidationError("Both send window start and end must be set, or neither.")
+        if start is not None and start >= end:
+            raise serializers.ValidationError("The send window must start before it ends.")
+        return attrs
+
+    def update(self, instance, validated_data):
+        """
+        Update the user and, if their timezone or send window changed, move their
+        pending notifications onto the new local send times.
+
+        SMS already pre-submitted to Twilio would still go out at the old time or
+        to the old number, so they are cancelled there and re-queued as pending
+        when the timezone, send window, phone or backup phone changes.
+        """
+        previous_timezone = get_user_timezone(instance)
+        previous_schedule = (instance.timezone, instance.send_window_start, instance.send_window_end)
+        previous_phones = {'primary_sms': instance.phone, 'backup_sms': instance.backup_phone}
+
+        instance = super().update(instance, validated_data)
+
+        user_notifications = Notification.objects.filter(user=instance)
+        if (instance.timezone, instance.send_window_start, instance.send_window_end) != previous_schedule:
+            cancel_scheduled_notifications(user_notifications, requeue=True)
+            reschedule_notifications_for_user(instance, previous_timezone=previous_timezone)
+        else:
+            current_phones = {'primary_sms': instance.phone, 'backup_sms': instance.backup_phone}
+            changed_channels = [channel for channel, phone in current_phones.items() if phone != previous_phones[channel]]
+            if changed_channels:
+                cancel_scheduled_notifications(user_notifications.filter(channel__in=changed_channels), requeue=True)
+
+        return instance
@@ -26,6 +26,9 @@ def test_user_profile_serializer():
         'instagram_handle': user.instagram_handle,
         'snapchat_handle': user.snapchat_handle,
         'x_handle': user.x_handle,
+        'timezone': user.timezone,
+        'send_window_start': user.send_window_start,
+        'send_window_end': user.send_window_end,
         'is_staff': user.is_staff,
         'is_superuser': user.is_superuser,
         'is_email_verified': user.is_email_verified,
@@ -5,7 +5,7 @@ from users.utils.hash_value import hash_value
 from users.tests.factories.user_factory import UserFactory
 from events.tests.factories.event_factory import EventFactory
 from events.tests.factories.notification_factory import NotificationFactory
-from events.models import Notification
+from events.models import Notification, NotificationDelivery
 
 @pytest.mark.django_db
 def test_anonymize_user_full_process():
@@ -62,3 +62,17 @@ def test_anonymize_user_full_process():
     assert user.phone == ""
     assert user.email == f"deleted_{user.pk}@deleted.com"
     assert user.hash_first_name == hash_value("John", salt)
+
+@pytest.mark.django_db
+def test_anonymize_user_hashes_fanout_recipients():
+    """
+    Tests that the recipients recorded on fan-out deliveries are hashed.
+    """
+    user = UserFactory()
+    notification = NotificationFactory(user=user, event=EventFactory(user=user), status='sent', channel='all_backup_emails')
+    delivery = NotificationDelivery.objects.create(notification=notification, recipient="backup@example.com", status='sent')
+
+    anonymize_user(user)
+
+    delivery.refresh_from_db()
+    assert delivery.recipient == hash_value("backup@example.com", getattr(settings, 'HASHING_SALT'))
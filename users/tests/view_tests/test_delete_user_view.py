@@ -59,6 +59,19 @@ class TestDeleteUserView:
         assert self.user.notifications.filter(status='pending').count() == 0
         assert self.user.notifications.filter(status='sent').count() == 1
 
+    @override_settings(HASHING_SALT="a-secure-test-salt")
+    def test_delete_user_cancels_presubmitted_sms(self, mocker):
+        mock_client = mocker.patch('events.utils.cancel_scheduled_notifications.get_twilio_client').return_value
+        scheduled = NotificationFactory(user=self.user, channel='primary_sms', status='scheduled', message_sid='SM_SCHEDULED')
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.delete(self.url)
+
+        assert response.status_code == 204
+        mock_client.messages.assert_called_once_with('SM_SCHEDULED')
+        scheduled.refresh_from_db()
+        assert scheduled.status == 'cancelled'
+
     @override_settings(HASHING_SALT=None)
     def test_delete_fails_if_salt_is_not_configured(self):
         self.client.force_authenticate(user=self.user)
@@ -1,6 +1,10 @@
 # users/tests/view_tests/test_user_profile_view.py
 import pytest
+from datetime import timedelta
+from django.utils import timezone
 from rest_framework.test import APIClient
+from events.models import Notification
+from events.tests.factories.event_factory import EventFactory
 from users.tests.factories.user_factory import UserFactory
 
 @pytest.mark.django_db
@@ -76,3 +80,70 @@ class TestUserProfileView:
         
         self.user.refresh_from_db()
         assert self.user.is_staff is False
+
+    def test_update_timezone_reschedules_pending_notifications(self, mocker):
+        mock_reschedule = mocker.patch(
+            'users.serializers.user_profile_serializer.reschedule_notifications_for_user'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.patch(self.url, {'timezone': 'Australia/Sydney'}, format='json')
+
+        assert response.status_code == 200
+        self.user.refresh_from_db()
+        assert self.user.timezone == 'Australia/Sydney'
+        mock_reschedule.assert_called_once()
+
+    def _scheduled_sms(self, channel, sid):
+        event = EventFactory(user=self.user, is_active=False, tier=None)
+        return Notification.objects.create(
+            event=event, user=self.user, channel=channel, status='scheduled', message_sid=sid,
+            sms_segments=1, sent_at=timezone.now(), scheduled_send_time=timezone.now() + timedelta(hours=2)
+        )
+
+    def test_update_phone_requeues_sms_presubmitted_to_the_old_number(self, mocker):
+        mock_client = mocker.patch('events.utils.cancel_scheduled_notifications.get_twilio_client').return_value
+        primary = self._scheduled_sms('primary_sms', 'SM_PRIMARY')
+        backup = self._scheduled_sms('backup_sms', 'SM_BACKUP')
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.patch(self.url, {'phone': '+15550009999'}, format='json')
+
+        assert response.status_code == 200
+        mock_client.messages.assert_called_once_with('SM_PRIMARY')
+        primary.refresh_from_db()
+        backup.refresh_from_db()
+        assert primary.status == 'pending'
+        assert primary.message_sid is None
+        assert primary.sent_at is None
+        assert backup.status == 'scheduled'
+
+    def test_update_timezone_requeues_presubmitted_sms_at_the_new_time(self, mocker):
+        mock_client = mocker.patch('events.utils.cancel_scheduled_notifications.get_twilio_client').return_value
+        scheduled = self._scheduled_sms('backup_sms', 'SM_BACKUP')
+        previous_time = scheduled.scheduled_send_time
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.patch(self.url, {'timezone': 'Australia/Sydney'}, format='json')
+
+        assert response.status_code == 200
+        mock_client.messages.assert_called_once_with('SM_BACKUP')
+        scheduled.refresh_from_db()
+        assert scheduled.status == 'pending'
+        assert scheduled.scheduled_send_time != previous_time
+
+    def test_update_with_unknown_timezone_is_rejected(self):
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.patch(self.url, {'timezone': 'Mars/Olympus_Mons'}, format='json')
+
+        assert response.status_code == 400
+        assert 'timezone' in response.data
+
+    def test_send_window_must_start_before_it_ends(self):
+        self.client.force_authenticate(user=self.user)
+        update_data = {'send_window_start': '18:00', 'send_window_end': '09:00'}
+
+        response = self.client.patch(self.url, update_data, format='json')
+
+        assert response.status_code == 400
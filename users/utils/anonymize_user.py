@@ -2,7 +2,8 @@ from django.conf import settings
 from django.utils import timezone
 from users.models import User
 from users.utils.hash_value import hash_value
-from events.models import Notification
+from events.models import Notification, NotificationDelivery
+from events.utils.cancel_scheduled_notifications import cancel_scheduled_notifications
 
 
 def anonymize_user(user: User):
@@ -10,7 +11,7 @@ def anonymize_user(user: User):
     Orchestrates the full user anonymization process.
 
     This function implements the steps defined in the user deletion workflow:
-    1. Cancels all pending notifications for the user.
+    1. Cancels all pending and provider-scheduled notifications for the user.
     2. Hashes all personally identifiable information (PII) into `hash_` fields.
     3. Wipes the original PII fields.
     4. Replaces the unique email field with a placeholder.
@@ -20,6 +21,7 @@ def anonymize_user(user: User):
     pending_notifications = Notification.objects.filter(user=user, status='pending')
     if pending_notifications.exists():
         pending_notifications.delete()
+    cancel_scheduled_notifications(Notification.objects.filter(user=user))
 
     # --- Step 2 & 3: Hash and Wipe PII ---
     salt = getattr(settings, 'HASHING_SALT', None)
@@ -29,12 +31,23 @@ def anonymize_user(user: User):
         return
 
     # --- Anonymize Sent Notification History ---
-    # We need to hash the PII stored in the recipient_contact_info of sent notifications.
-    notifications_to_update = Notification.objects.filter(user=user, status__in=['sent', 'failed', 'completed'])
+    # We need to hash the PII stored in the recipient_contact_info of every notification
+    # that was handed to a provider, whatever its current status. Only that column is
+    # written, so a concurrent status transition (e.g. a delivery callback) is never lost.
+    notifications_to_update = list(
+        Notification.objects.filter(user=user, recipient_contact_info__isnull=False)
+        .exclude(recipient_contact_info='')
+        .only('pk', 'recipient_contact_info')
+    )
     for notification in notifications_to_update:
-        if notification.recipient_contact_info:
-            notification.recipient_contact_info = hash_value(notification.recipient_contact_info, salt)
-            notification.save(update_fields=['recipient_contact_info'])
+        notification.recipient_contact_info = hash_value(notification.recipient_contact_info, salt)
+    Notification.objects.bulk_update(notifications_to_update, ['recipient_contact_info'])
+
+    # Fan-out notifications keep their recipients on the deliveries.
+    deliveries = list(NotificationDelivery.objects.filter(notification__user=user).only('pk', 'recipient'))
+    for delivery in deliveries:
+        delivery.recipient = hash_value(delivery.recipient, salt)
+    NotificationDelivery.objects.bulk_update(deliveries, ['recipient'])
 
     # A mapping of original PII fields to their `hash_` counterparts.
     pii_fields_to_hash = {
@@ -0,0 +1,25 @@
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from django.utils import timezone
+
+
+def get_user_timezone(user):
+    """
+    Returns the tzinfo that a user's notifications should be scheduled in.
+
+    Falls back to the project's current timezone if the user has no timezone
+    set or it is not a recognised IANA name.
+
+    Args:
+        user: The User instance.
+
+    Returns:
+        A tzinfo object.
+    """
+    tz_name = getattr(user, 'timezone', None)
+    if not tz_name:
+        return timezone.get_current_timezone()
+
+    try:
+        return ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return timezone.get_current_timezone()